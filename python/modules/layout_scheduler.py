@@ -0,0 +1,190 @@
+"""
+Layout Scheduler - Deferred, single-pass network layout
+
+Material creation used to call layoutChildren() on the material subnet and on
+the whole material library after every material, re-laying out the library N
+times for N materials. Inside a deferred_layout() block, request_layout() only
+marks networks as dirty; each network is laid out once when the block exits.
+Outside a block request_layout() lays out immediately, so callers keep working
+unchanged when nothing is deferred.
+
+Large flat networks (material libraries with hundreds of subnets) can use a
+deterministic grid instead of Houdini's general auto-layout. Networks nobody
+will look at (e.g. a throwaway publish network) can discard the requests.
+
+Usage:
+    from modules.layout_scheduler import deferred_layout, request_layout
+
+    with deferred_layout(grid_threshold=64) as scheduler:
+        for material in materials:
+            ...
+            request_layout(subnet)
+            request_layout(material_lib, grid=True)
+    print(scheduler.report.summary())
+"""
+
+import math
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import hou
+
+# Grid spacing in network units
+GRID_SPACING_X = 3.0
+GRID_SPACING_Y = 1.5
+
+
+@dataclass
+class LayoutReport:
+    """Outcome of one flush: how many layouts ran and the time they saved."""
+    requests: int = 0
+    layouts: int = 0
+    grid_layouts: int = 0
+    seconds: float = 0.0
+    estimated_seconds_saved: float = 0.0
+
+    def summary(self) -> str:
+        return (f"Layout: {self.layouts} network(s) laid out for {self.requests} request(s) "
+                f"in {self.seconds:.3f}s (~{self.estimated_seconds_saved:.3f}s saved, "
+                f"{self.grid_layouts} grid)")
+
+
+@dataclass
+class _DirtyNetwork:
+    node: hou.Node
+    path: str
+    depth: int
+    requests: int = 0
+    grid: bool = False
+
+
+def grid_layout(network: hou.Node, columns: Optional[int] = None):
+    """
+    Place the children of a network on a regular grid, in creation order.
+
+    Args:
+        network: Network whose children are positioned
+        columns: Nodes per row (defaults to a roughly square grid)
+    """
+    children = network.children()
+    if not children:
+        return
+    if columns is None:
+        columns = max(1, int(math.ceil(math.sqrt(len(children)))))
+    for index, child in enumerate(children):
+        row, col = divmod(index, columns)
+        child.setPosition(hou.Vector2(col * GRID_SPACING_X, -row * GRID_SPACING_Y))
+
+
+class LayoutScheduler:
+    """
+    Collects networks that need a layout and lays each one out once.
+
+    Args:
+        grid_threshold: Networks flagged as grid-capable with at least this many
+            children use grid_layout(); None always uses layoutChildren()
+        discard: Drop the requests instead of laying anything out
+    """
+
+    def __init__(self, grid_threshold: Optional[int] = None, discard: bool = False):
+        self.grid_threshold = grid_threshold
+        self.discard = discard
+        self._dirty: Dict[str, _DirtyNetwork] = {}
+        self.report = LayoutReport()
+
+    def request(self, network: hou.Node, grid: bool = False):
+        """Mark a network as needing a layout."""
+        path = network.path()
+        entry = self._dirty.get(path)
+        if entry is None:
+            entry = self._dirty[path] = _DirtyNetwork(network, path, path.count("/"))
+        else:
+            # The node may have been destroyed and recreated under the same path
+            entry.node = network
+        entry.requests += 1
+        entry.grid = entry.grid or grid
+
+    def flush(self) -> LayoutReport:
+        """Lay out every dirty network once (deepest first) and return the report."""
+        # Children before parents, so parent layouts see final child sizes
+        entries: List[_DirtyNetwork] = sorted(self._dirty.values(), key=lambda e: e.depth, reverse=True)
+        self._dirty = {}
+
+        if self.discard:
+            self.report.requests += sum(entry.requests for entry in entries)
+            return self.report
+
+        for entry in entries:
+            try:
+                entry.node.path()
+            except hou.ObjectWasDeleted:
+                # Destroyed since the request: lay out whatever now lives at that path
+                entry.node = hou.node(entry.path)
+                if entry.node is None:
+                    continue
+            try:
+                start = time.perf_counter()
+                use_grid = (entry.grid and self.grid_threshold is not None
+                            and len(entry.node.children()) >= self.grid_threshold)
+                if use_grid:
+                    grid_layout(entry.node)
+                    self.report.grid_layouts += 1
+                else:
+                    entry.node.layoutChildren()
+                elapsed = time.perf_counter() - start
+            except hou.ObjectWasDeleted:
+                continue
+
+            self.report.requests += entry.requests
+            self.report.layouts += 1
+            self.report.seconds += elapsed
+            # Each skipped request would have cost at least one layout of this network
+            self.report.estimated_seconds_saved += elapsed * (entry.requests - 1)
+
+        return self.report
+
+
+_active: List[LayoutScheduler] = []
+
+
+def request_layout(network: hou.Node, grid: bool = False):
+    """
+    Lay out a network now, or defer it if a deferred_layout() block is active.
+
+    Args:
+        network: Network to lay out
+        grid: Allow grid layout for this network (flat networks such as material libraries)
+    """
+    if _active:
+        _active[-1].request(network, grid=grid)
+    else:
+        network.layoutChildren()
+
+
+@contextmanager
+def deferred_layout(grid_threshold: Optional[int] = None, discard: bool = False):
+    """
+    Defer request_layout() calls until the block exits, then lay out once.
+
+    Nested blocks join the outermost scheduler.
+
+    Args:
+        grid_threshold: See LayoutScheduler
+        discard: See LayoutScheduler
+
+    Yields:
+        LayoutScheduler: its report is filled in when the block exits
+    """
+    if _active:
+        yield _active[-1]
+        return
+
+    scheduler = LayoutScheduler(grid_threshold=grid_threshold, discard=discard)
+    _active.append(scheduler)
+    try:
+        yield scheduler
+    finally:
+        _active.pop()
+        scheduler.flush()
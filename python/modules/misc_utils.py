@@ -1,10 +1,19 @@
-import hou
-import loputils
+from __future__ import annotations
+
 import re
 import unicodedata
 from typing import Optional, Set, Iterable
 from dataclasses import dataclass, field
 
+try:
+    import hou
+    import loputils
+except ImportError:
+    # The naming helpers (slugify, MaterialNamingConfig) are also used outside
+    # Houdini, e.g. by the build planner
+    hou = None
+    loputils = None
+
 
 @dataclass
 class MaterialNamingConfig:
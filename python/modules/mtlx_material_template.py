@@ -0,0 +1,216 @@
+"""
+MaterialX Material Template - Clone pre-configured MaterialX builder subnets
+
+Creating a MaterialX builder subnet from scratch costs dozens of HOM calls:
+create the subnet, destroy its default children, build and apply the full
+"MaterialX Builder" ParmTemplateGroup, then create and wire the shader and
+output nodes. MtlxMaterialTemplate does that once per material library and
+creates every material by copying the blank template, leaving only texture
+paths and connections to set per material.
+
+The template lives inside the material library while materials are being
+created and must be released afterwards, otherwise the materiallibrary LOP
+would author it as a material too.
+
+Usage:
+    template = MtlxMaterialTemplate(material_lib)
+    try:
+        subnet = template.instantiate("my_material")
+        surface = template.surface_node(subnet)
+    finally:
+        template.release()
+"""
+
+import hou
+from typing import Optional
+
+from modules.misc_utils import slugify
+
+TEMPLATE_NODE_NAME = "__mtlx_material_template__"
+
+# Names of the pre-built nodes inside a "standard" template
+SURFACE_NODE = "mtlxSurface"
+DISPLACEMENT_NODE = "mtlxDisplacement"
+SURFACE_OUTPUT = "surface_output"
+DISPLACEMENT_OUTPUT = "displacement_output"
+
+
+def build_mtlx_builder_parm_template_group() -> hou.ParmTemplateGroup:
+    """Parameter interface of a USD MaterialX Builder subnet."""
+    hou_parm_template_group = hou.ParmTemplateGroup()
+
+    # FOLDER MATERIALX
+    hou_parm_template = hou.FolderParmTemplate("folder1", "MaterialX Builder",
+                                               folder_type=hou.folderType.Collapsible, default_value=0,
+                                               ends_tab_group=False)
+    hou_parm_template.setTags({"group_type": "collapsible", "sidefx::shader_isparm": "0"})
+
+    # Inherent from the class
+    hou_parm_template2 = hou.IntParmTemplate("inherit_ctrl", "Inherit from Class", 1, default_value=([2]), min=0,
+                                             max=10, min_is_strict=False, max_is_strict=False,
+                                             look=hou.parmLook.Regular, naming_scheme=hou.parmNamingScheme.Base1,
+                                             menu_items=(["0", "1", "2"]),
+                                             menu_labels=(["Never", "Always", "Material Flag"]), icon_names=([]),
+                                             item_generator_script="",
+                                             item_generator_script_language=hou.scriptLanguage.Python,
+                                             menu_type=hou.menuType.Normal, menu_use_token=False)
+    hou_parm_template.addParmTemplate(hou_parm_template2)
+
+    # Class Arc
+    class_arc_expression = (
+        "n = hou.pwd()\nn_hasFlag = n.isMaterialFlagSet()\ni = n.evalParm('inherit_ctrl')\nr = 'none'\n"
+        "if i == 1 or (n_hasFlag and i == 2):\n    r = 'inherit'\nreturn r"
+    )
+    hou_parm_template2 = hou.StringParmTemplate("shader_referencetype", "Class Arc", 1,
+                                                default_value=([class_arc_expression]),
+                                                default_expression=([class_arc_expression]),
+                                                default_expression_language=([hou.scriptLanguage.Python]),
+                                                naming_scheme=hou.parmNamingScheme.Base1,
+                                                string_type=hou.stringParmType.Regular,
+                                                menu_items=(["none", "reference", "inherit", "specialize", "represent"]),
+                                                menu_labels=(["None", "Reference", "Inherit", "Specialize", "Represent"]),
+                                                icon_names=([]), item_generator_script="",
+                                                item_generator_script_language=hou.scriptLanguage.Python,
+                                                menu_type=hou.menuType.Normal)
+    hou_parm_template2.setTags({"sidefx::shader_isparm": "0", "spare_category": "Shader"})
+    hou_parm_template.addParmTemplate(hou_parm_template2)
+
+    #  Class Prim Path
+    hou_parm_template2 = hou.StringParmTemplate("shader_baseprimpath", "Class Prim Path", 1,
+                                                default_value=(["/__class_mtl__/`$OS`"]),
+                                                naming_scheme=hou.parmNamingScheme.Base1,
+                                                string_type=hou.stringParmType.Regular, menu_items=([]),
+                                                menu_labels=([]), icon_names=([]), item_generator_script="",
+                                                item_generator_script_language=hou.scriptLanguage.Python,
+                                                menu_type=hou.menuType.Normal)
+    hou_parm_template2.setTags(
+        {"script_action": "import lopshaderutils\nlopshaderutils.selectPrimFromInputOrFile(kwargs)",
+         "script_action_help": "Select a primitive in the Scene Viewer or Scene Graph Tree pane.\nCtrl-click to select using the primitive picker dialog.",
+         "script_action_icon": "BUTTONS_reselect", "sidefx::shader_isparm": "0", "sidefx::usdpathtype": "prim",
+         "spare_category": "Shader"})
+    hou_parm_template.addParmTemplate(hou_parm_template2)
+
+    # Separator
+    hou_parm_template.addParmTemplate(hou.SeparatorParmTemplate("separator1"))
+
+    # Tab Menu Mask
+    hou_parm_template2 = hou.StringParmTemplate("tabmenumask", "Tab Menu Mask", 1, default_value=(
+        ["MaterialX parameter constant collect null genericshader subnet subnetconnector suboutput subinput"]),
+                                                naming_scheme=hou.parmNamingScheme.Base1,
+                                                string_type=hou.stringParmType.Regular, menu_items=([]),
+                                                menu_labels=([]), icon_names=([]), item_generator_script="",
+                                                item_generator_script_language=hou.scriptLanguage.Python,
+                                                menu_type=hou.menuType.Normal)
+    hou_parm_template2.setTags({"spare_category": "Tab Menu"})
+    hou_parm_template.addParmTemplate(hou_parm_template2)
+
+    # Render Context Name
+    hou_parm_template2 = hou.StringParmTemplate("shader_rendercontextname", "Render Context Name", 1,
+                                                default_value=(["mtlx"]), naming_scheme=hou.parmNamingScheme.Base1,
+                                                string_type=hou.stringParmType.Regular, menu_items=([]),
+                                                menu_labels=([]), icon_names=([]), item_generator_script="",
+                                                item_generator_script_language=hou.scriptLanguage.Python,
+                                                menu_type=hou.menuType.Normal)
+    hou_parm_template2.setTags({"sidefx::shader_isparm": "0", "spare_category": "Shader"})
+    hou_parm_template.addParmTemplate(hou_parm_template2)
+
+    # Force Translation of Children
+    hou_parm_template2 = hou.ToggleParmTemplate("shader_forcechildren", "Force Translation of Children",
+                                                default_value=True)
+    hou_parm_template2.setTags({"sidefx::shader_isparm": "0", "spare_category": "Shader"})
+    hou_parm_template.addParmTemplate(hou_parm_template2)
+    hou_parm_template_group.append(hou_parm_template)
+
+    return hou_parm_template_group
+
+
+class MtlxMaterialTemplate:
+    """
+    A blank, fully configured MaterialX builder subnet inside a material library.
+
+    Args:
+        material_library: materiallibrary LOP (or any VOP network) to create materials in
+        with_main_nodes: Pre-build a standard surface + displacement wired to
+            surface/displacement subnetconnector outputs (TexToMtlX layout).
+            False gives an empty subnet with only the builder parameters.
+    """
+
+    def __init__(self, material_library: hou.Node, with_main_nodes: bool = True):
+        self.material_library = material_library
+        self.with_main_nodes = with_main_nodes
+        self.node: Optional[hou.Node] = None
+        self.instances = 0
+        self._build()
+
+    def _build(self):
+        existing = self.material_library.node(TEMPLATE_NODE_NAME)
+        if existing:
+            existing.destroy()
+
+        subnet = self.material_library.createNode("subnet", TEMPLATE_NODE_NAME)
+        for item in subnet.allItems():
+            item.destroy()
+        subnet.setParmTemplateGroup(build_mtlx_builder_parm_template_group())
+        subnet.setMaterialFlag(True)
+
+        if self.with_main_nodes:
+            surface = subnet.createNode("mtlxstandard_surface", SURFACE_NODE)
+            displacement = subnet.createNode("mtlxdisplacement", DISPLACEMENT_NODE)
+            surface_out = self._create_output_node(subnet, "surface")
+            displacement_out = self._create_output_node(subnet, "displacement")
+            surface_out.setInput(0, surface)
+            displacement_out.setInput(0, displacement)
+
+        subnet.hide(True)
+        self.node = subnet
+
+    @staticmethod
+    def _create_output_node(context, output_type):
+        node = context.createNode("subnetconnector", slugify(f"{output_type}_output"))
+        node.parm("connectorkind").set("output")
+        node.parm("parmname").set(output_type)
+        node.parm("parmlabel").set(output_type.capitalize())
+        node.parm("parmtype").set(output_type)
+        color = hou.Color(0.89, 0.69, 0.6) if output_type == "surface" else hou.Color(0.6, 0.69, 0.89)
+        node.setColor(color)
+        return node
+
+    def instantiate(self, name: str) -> hou.Node:
+        """
+        Copy the template into the material library as a new material subnet.
+
+        Args:
+            name: Name of the material subnet (an existing node with that name is replaced)
+
+        Returns:
+            The new material subnet
+        """
+        if self.node is None:
+            raise RuntimeError("MaterialX template has been released")
+
+        existing = self.material_library.node(name)
+        if existing:
+            existing.destroy()
+
+        subnet = hou.copyNodesTo((self.node,), self.material_library)[0]
+        subnet.setName(name)
+        subnet.hide(False)
+        self.instances += 1
+        return subnet
+
+    @staticmethod
+    def surface_node(subnet: hou.Node) -> Optional[hou.Node]:
+        return subnet.node(SURFACE_NODE)
+
+    @staticmethod
+    def displacement_node(subnet: hou.Node) -> Optional[hou.Node]:
+        return subnet.node(DISPLACEMENT_NODE)
+
+    def release(self):
+        """Destroy the template node so it is not authored as a material."""
+        if self.node is not None:
+            try:
+                self.node.destroy()
+            except hou.ObjectWasDeleted:
+                pass
+            self.node = None
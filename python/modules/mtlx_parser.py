@@ -0,0 +1,246 @@
+"""
+MaterialX Parser - Read .mtlx files into plain data (no Houdini required)
+
+Parsing is the hou-free first phase of MaterialXToVOPExpander: every file is
+turned into dicts of materials, nodegraphs and shaders, so a whole folder can
+be parsed concurrently before any node is created.
+
+Usage:
+    from modules.mtlx_parser import find_mtlx_files, parse_mtlx_files
+
+    parsed = parse_mtlx_files(find_mtlx_files("/path/to/materials"))
+    for result in parsed:
+        print(result.path, list(result.materials))
+"""
+
+import os
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+@dataclass
+class ParsedMtlxFile:
+    """Parse result of one .mtlx file."""
+    path: str
+    materials: Dict[str, Dict] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+def find_mtlx_files(folder_path: str, recursive: bool = True) -> List[str]:
+    """
+    Find all .mtlx files in a folder.
+
+    Args:
+        folder_path (str): Folder to search
+        recursive (bool): Search subfolders recursively
+
+    Returns:
+        list: Paths of .mtlx files
+    """
+    mtlx_files = []
+    if recursive:
+        for root, dirs, files in os.walk(folder_path):
+            for file in files:
+                if file.endswith('.mtlx'):
+                    mtlx_files.append(os.path.join(root, file))
+    else:
+        mtlx_files = [
+            os.path.join(folder_path, f)
+            for f in os.listdir(folder_path)
+            if f.endswith('.mtlx')
+        ]
+    return mtlx_files
+
+
+def parse_mtlx_file(mtlx_file_path: str) -> Dict:
+    """
+    Parse a MaterialX XML file and extract material data.
+
+    Args:
+        mtlx_file_path (str): Path to .mtlx file
+
+    Returns:
+        dict: Material data organized by material name
+    """
+    tree = ET.parse(mtlx_file_path)
+    root = tree.getroot()
+
+    materials = {}
+
+    # Find all surfacematerial nodes
+    for surfacematerial in root.findall('.//surfacematerial'):
+        material_name = surfacematerial.get('name', 'unnamed_material')
+
+        material_data = {
+            'name': material_name,
+            'nodegraphs': {},
+            'shaders': {},
+            'inputs': []
+        }
+
+        # Get inputs (references to shaders)
+        for input_elem in surfacematerial.findall('input'):
+            input_name = input_elem.get('name')
+            nodename = input_elem.get('nodename')
+            material_data['inputs'].append({
+                'name': input_name,
+                'nodename': nodename
+            })
+
+        materials[material_name] = material_data
+
+    # Parse nodegraphs (texture networks)
+    for nodegraph in root.findall('.//nodegraph'):
+        nodegraph_name = nodegraph.get('name')
+
+        nodegraph_data = {
+            'name': nodegraph_name,
+            'nodes': [],
+            'outputs': []
+        }
+
+        # Parse image nodes
+        for image_node in nodegraph.findall('.//image'):
+            node_name = image_node.get('name')
+            node_type = image_node.get('type')
+
+            file_input = image_node.find(".//input[@name='file']")
+            file_path = file_input.get('value') if file_input is not None else ''
+            colorspace = file_input.get('colorspace', 'lin_rec709') if file_input is not None else 'lin_rec709'
+
+            nodegraph_data['nodes'].append({
+                'name': node_name,
+                'type': 'image',
+                'output_type': node_type,
+                'file': file_path,
+                'colorspace': colorspace
+            })
+
+        # Parse normalmap nodes
+        for normalmap_node in nodegraph.findall('.//normalmap'):
+            node_name = normalmap_node.get('name')
+
+            in_input = normalmap_node.find(".//input[@name='in']")
+            input_nodename = in_input.get('nodename') if in_input is not None else ''
+
+            scale_input = normalmap_node.find(".//input[@name='scale']")
+            scale_value = None
+            if scale_input is not None:
+                scale_value = scale_input.get('value')
+
+            nodegraph_data['nodes'].append({
+                'name': node_name,
+                'type': 'normalmap',
+                'input_node': input_nodename,
+                'scale': scale_value
+            })
+
+        # Parse outputs
+        for output in nodegraph.findall('.//output'):
+            output_name = output.get('name')
+            output_type = output.get('type')
+            nodename = output.get('nodename')
+
+            nodegraph_data['outputs'].append({
+                'name': output_name,
+                'type': output_type,
+                'nodename': nodename
+            })
+
+        # Store nodegraph in all relevant materials
+        for mat_name, mat_data in materials.items():
+            mat_data['nodegraphs'][nodegraph_name] = nodegraph_data
+
+    # Parse shader nodes (standard_surface, displacement, etc.)
+    for standard_surface in root.findall('.//standard_surface'):
+        shader_name = standard_surface.get('name')
+
+        shader_data = {
+            'name': shader_name,
+            'type': 'standard_surface',
+            'inputs': []
+        }
+
+        for input_elem in standard_surface.findall('input'):
+            input_name = input_elem.get('name')
+            input_type = input_elem.get('type')
+            value = input_elem.get('value')
+            output = input_elem.get('output')
+            nodegraph = input_elem.get('nodegraph')
+
+            shader_data['inputs'].append({
+                'name': input_name,
+                'type': input_type,
+                'value': value,
+                'output': output,
+                'nodegraph': nodegraph
+            })
+
+        # Add shader to all materials
+        for mat_name, mat_data in materials.items():
+            mat_data['shaders'][shader_name] = shader_data
+
+    # Parse displacement shaders
+    for displacement in root.findall('.//displacement'):
+        shader_name = displacement.get('name')
+
+        shader_data = {
+            'name': shader_name,
+            'type': 'displacement',
+            'inputs': []
+        }
+
+        for input_elem in displacement.findall('input'):
+            input_name = input_elem.get('name')
+            input_type = input_elem.get('type')
+            value = input_elem.get('value')
+            output = input_elem.get('output')
+            nodegraph = input_elem.get('nodegraph')
+
+            shader_data['inputs'].append({
+                'name': input_name,
+                'type': input_type,
+                'value': value,
+                'output': output,
+                'nodegraph': nodegraph
+            })
+
+        # Add shader to all materials
+        for mat_name, mat_data in materials.items():
+            mat_data['shaders'][shader_name] = shader_data
+
+    return materials
+
+
+def _parse_safe(mtlx_file_path: str) -> ParsedMtlxFile:
+    try:
+        return ParsedMtlxFile(mtlx_file_path, parse_mtlx_file(mtlx_file_path))
+    except Exception as e:
+        return ParsedMtlxFile(mtlx_file_path, error=str(e))
+
+
+def parse_mtlx_files(
+    mtlx_files: List[str],
+    max_workers: Optional[int] = None,
+    use_processes: bool = False
+) -> List[ParsedMtlxFile]:
+    """
+    Parse many .mtlx files concurrently.
+
+    Args:
+        mtlx_files (list): Paths of .mtlx files
+        max_workers (int): Worker count (default: executor default)
+        use_processes (bool): Parse in worker processes instead of threads
+            (worth it for very large libraries, ElementTree holds the GIL)
+
+    Returns:
+        list: ParsedMtlxFile per input path, in input order; failures carry error
+    """
+    if len(mtlx_files) <= 1:
+        return [_parse_safe(path) for path in mtlx_files]
+
+    executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    with executor_class(max_workers=max_workers) as executor:
+        return list(executor.map(_parse_safe, mtlx_files))
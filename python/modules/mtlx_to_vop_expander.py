@@ -10,9 +10,12 @@ that you can modify in Houdini.
 
 import hou
 import os
-import xml.etree.ElementTree as ET
-from typing import Dict, List, Optional, Tuple
+import time
+from typing import Dict, List, Optional, Set, Tuple
 from modules.misc_utils import _sanitize, slugify
+from modules.mtlx_material_template import MtlxMaterialTemplate, build_mtlx_builder_parm_template_group
+from modules.layout_scheduler import deferred_layout, request_layout
+from modules.mtlx_parser import ParsedMtlxFile, find_mtlx_files, parse_mtlx_file, parse_mtlx_files
 
 
 class MaterialXToVOPExpander:
@@ -29,6 +32,10 @@ class MaterialXToVOPExpander:
         """
         self.material_library = material_library
         self.created_materials = []
+        # Blank builder subnet copied for every material (see _acquire_template)
+        self._template: Optional[MtlxMaterialTemplate] = None
+        # Child names of the material library while a batch is being created
+        self._existing_names: Optional[Set[str]] = None
 
     def expand_mtlx_file(
         self,
@@ -57,28 +64,29 @@ class MaterialXToVOPExpander:
         # Parse the MaterialX file
         mtlx_data = self._parse_mtlx_file(mtlx_file_path)
 
-        # Create VOP networks for each material
-        materials = []
-        for material_name, material_data in mtlx_data.items():
-            vop_net = self._create_vop_material(material_name, material_data, mtlx_file_path)
-            if vop_net:
-                materials.append(vop_net)
-
-        return materials
+        return self._create_parsed_materials([ParsedMtlxFile(mtlx_file_path, mtlx_data)])
 
     def expand_mtlx_folder(
         self,
         folder_path: str,
         material_library_node: Optional[hou.LopNode] = None,
-        recursive: bool = True
+        recursive: bool = True,
+        max_workers: Optional[int] = None,
+        use_processes: bool = False
     ) -> List[hou.VopNode]:
         """
         Expand all MaterialX files in a folder.
 
+        Runs in two phases: all files are parsed concurrently into plain data
+        (modules.mtlx_parser, no hou), then every material is created in one
+        batched pass under a single undo group.
+
         Args:
             folder_path (str): Path to folder containing .mtlx files
             material_library_node (hou.LopNode): Optional materiallibrary to use
             recursive (bool): Search subfolders recursively
+            max_workers (int): Parser worker count (default: executor default)
+            use_processes (bool): Parse in worker processes instead of threads
 
         Returns:
             list: List of created material VOP networks
@@ -92,31 +100,95 @@ class MaterialXToVOPExpander:
         elif self.material_library is None:
             self.material_library = self._create_material_library()
 
-        # Find all .mtlx files
-        mtlx_files = []
-        if recursive:
-            for root, dirs, files in os.walk(folder_path):
-                for file in files:
-                    if file.endswith('.mtlx'):
-                        mtlx_files.append(os.path.join(root, file))
-        else:
-            mtlx_files = [
-                os.path.join(folder_path, f)
-                for f in os.listdir(folder_path)
-                if f.endswith('.mtlx')
-            ]
-
-        # Expand each file
-        all_materials = []
-        for mtlx_file in mtlx_files:
-            try:
-                materials = self.expand_mtlx_file(mtlx_file, self.material_library)
-                all_materials.extend(materials)
-            except Exception as e:
-                print(f"Error expanding {mtlx_file}: {e}")
+        # Phase one: find and parse all .mtlx files
+        start = time.perf_counter()
+        mtlx_files = find_mtlx_files(folder_path, recursive)
+        parsed = parse_mtlx_files(mtlx_files, max_workers=max_workers, use_processes=use_processes)
+        parse_seconds = time.perf_counter() - start
+
+        # Phase two: create the nodes
+        start = time.perf_counter()
+        all_materials = self._create_parsed_materials(parsed)
+        create_seconds = time.perf_counter() - start
 
+        print(f"Expanded {len(all_materials)} materials from {len(mtlx_files)} files "
+              f"(parse {parse_seconds:.2f}s, create {create_seconds:.2f}s)")
         return all_materials
 
+    def _create_parsed_materials(self, parsed: List[ParsedMtlxFile]) -> List[hou.VopNode]:
+        """
+        Create the VOP networks of parsed MaterialX files in one batched pass.
+
+        Args:
+            parsed (list): ParsedMtlxFile results (failed files are reported and skipped)
+
+        Returns:
+            list: List of created material VOP networks
+        """
+        materials = []
+        # Existing names are collected once; new names are added as materials are created
+        self._existing_names = {child.name() for child in self.material_library.children()}
+        try:
+            with hou.undos.group("Expand MaterialX materials"), deferred_layout():
+                owns_template = self._acquire_template()
+                try:
+                    for result in parsed:
+                        if result.error:
+                            print(f"Error expanding {result.path}: {result.error}")
+                            continue
+                        for material_name, material_data in result.materials.items():
+                            try:
+                                vop_net = self._create_vop_material(material_name, material_data, result.path)
+                            except Exception as e:
+                                print(f"Error expanding {material_name} from {result.path}: {e}")
+                                continue
+                            if vop_net:
+                                materials.append(vop_net)
+                finally:
+                    if owns_template:
+                        self._release_template()
+        finally:
+            self._existing_names = None
+
+        return materials
+
+    def _unique_name(self, base_name: str) -> str:
+        """Return base_name, or base_name_NNN if a child with that name already exists."""
+        existing = self._existing_names
+        if existing is None:
+            existing = {child.name() for child in self.material_library.children()}
+        final_name = base_name
+        suffix = 1
+        while final_name in existing:
+            final_name = f"{base_name}_{suffix:03d}"
+            suffix += 1
+        if self._existing_names is not None:
+            self._existing_names.add(final_name)
+        return final_name
+
+    def _acquire_template(self) -> bool:
+        """
+        Build the material template for the current library if none is active.
+
+        Returns:
+            bool: True if the caller created the template and must release it
+        """
+        if self._template is not None and self._template.material_library == self.material_library:
+            return False
+        self._release_template()
+        try:
+            self._template = MtlxMaterialTemplate(self.material_library, with_main_nodes=False)
+        except Exception as e:
+            print(f"Warning: Could not create material template, building subnets from scratch: {e}")
+            self._template = None
+            return False
+        return True
+
+    def _release_template(self):
+        if self._template is not None:
+            self._template.release()
+            self._template = None
+
     def _create_material_library(self) -> hou.LopNode:
         """
         Create a new materiallibrary node.
@@ -146,154 +218,7 @@ class MaterialXToVOPExpander:
         Returns:
             dict: Material data organized by material name
         """
-        tree = ET.parse(mtlx_file_path)
-        root = tree.getroot()
-
-        materials = {}
-
-        # Find all surfacematerial nodes
-        for surfacematerial in root.findall('.//surfacematerial'):
-            material_name = surfacematerial.get('name', 'unnamed_material')
-
-            material_data = {
-                'name': material_name,
-                'nodegraphs': {},
-                'shaders': {},
-                'inputs': []
-            }
-
-            # Get inputs (references to shaders)
-            for input_elem in surfacematerial.findall('input'):
-                input_name = input_elem.get('name')
-                nodename = input_elem.get('nodename')
-                material_data['inputs'].append({
-                    'name': input_name,
-                    'nodename': nodename
-                })
-
-            materials[material_name] = material_data
-
-        # Parse nodegraphs (texture networks)
-        for nodegraph in root.findall('.//nodegraph'):
-            nodegraph_name = nodegraph.get('name')
-
-            nodegraph_data = {
-                'name': nodegraph_name,
-                'nodes': [],
-                'outputs': []
-            }
-
-            # Parse image nodes
-            for image_node in nodegraph.findall('.//image'):
-                node_name = image_node.get('name')
-                node_type = image_node.get('type')
-
-                file_input = image_node.find(".//input[@name='file']")
-                file_path = file_input.get('value') if file_input is not None else ''
-                colorspace = file_input.get('colorspace', 'lin_rec709') if file_input is not None else 'lin_rec709'
-
-                nodegraph_data['nodes'].append({
-                    'name': node_name,
-                    'type': 'image',
-                    'output_type': node_type,
-                    'file': file_path,
-                    'colorspace': colorspace
-                })
-
-            # Parse normalmap nodes
-            for normalmap_node in nodegraph.findall('.//normalmap'):
-                node_name = normalmap_node.get('name')
-
-                in_input = normalmap_node.find(".//input[@name='in']")
-                input_nodename = in_input.get('nodename') if in_input is not None else ''
-
-                scale_input = normalmap_node.find(".//input[@name='scale']")
-                scale_value = None
-                if scale_input is not None:
-                    scale_value = scale_input.get('value')
-
-                nodegraph_data['nodes'].append({
-                    'name': node_name,
-                    'type': 'normalmap',
-                    'input_node': input_nodename,
-                    'scale': scale_value
-                })
-
-            # Parse outputs
-            for output in nodegraph.findall('.//output'):
-                output_name = output.get('name')
-                output_type = output.get('type')
-                nodename = output.get('nodename')
-
-                nodegraph_data['outputs'].append({
-                    'name': output_name,
-                    'type': output_type,
-                    'nodename': nodename
-                })
-
-            # Store nodegraph in all relevant materials
-            for mat_name, mat_data in materials.items():
-                mat_data['nodegraphs'][nodegraph_name] = nodegraph_data
-
-        # Parse shader nodes (standard_surface, displacement, etc.)
-        for standard_surface in root.findall('.//standard_surface'):
-            shader_name = standard_surface.get('name')
-
-            shader_data = {
-                'name': shader_name,
-                'type': 'standard_surface',
-                'inputs': []
-            }
-
-            for input_elem in standard_surface.findall('input'):
-                input_name = input_elem.get('name')
-                input_type = input_elem.get('type')
-                value = input_elem.get('value')
-                output = input_elem.get('output')
-                nodegraph = input_elem.get('nodegraph')
-
-                shader_data['inputs'].append({
-                    'name': input_name,
-                    'type': input_type,
-                    'value': value,
-                    'output': output,
-                    'nodegraph': nodegraph
-                })
-
-            # Add shader to all materials
-            for mat_name, mat_data in materials.items():
-                mat_data['shaders'][shader_name] = shader_data
-
-        # Parse displacement shaders
-        for displacement in root.findall('.//displacement'):
-            shader_name = displacement.get('name')
-
-            shader_data = {
-                'name': shader_name,
-                'type': 'displacement',
-                'inputs': []
-            }
-
-            for input_elem in displacement.findall('input'):
-                input_name = input_elem.get('name')
-                input_type = input_elem.get('type')
-                value = input_elem.get('value')
-                output = input_elem.get('output')
-                nodegraph = input_elem.get('nodegraph')
-
-                shader_data['inputs'].append({
-                    'name': input_name,
-                    'type': input_type,
-                    'value': value,
-                    'output': output,
-                    'nodegraph': nodegraph
-                })
-
-            # Add shader to all materials
-            for mat_name, mat_data in materials.items():
-                mat_data['shaders'][shader_name] = shader_data
-
-        return materials
+        return parse_mtlx_file(mtlx_file_path)
 
     def _create_vop_material(
         self,
@@ -322,76 +247,19 @@ class MaterialXToVOPExpander:
 
         # Create per-material subnet (USD MaterialX Builder style)
         # Ensure unique name
-        base_name = sanitized_name
-        final_name = base_name
-        suffix = 1
-        while self.material_library.node(final_name) is not None:
-            final_name = f"{base_name}_{suffix:03d}"
-            suffix += 1
-        mtlx_subnet = self.material_library.createNode('subnet', node_name=final_name)
-        # Mark as material and prepare as MaterialX Builder-ish subnet
-        try:
-            mtlx_subnet.setMaterialFlag(True)
-        except Exception:
-            pass
-        # Apply a minimal MaterialX Builder parameter set similar to TexToMtlX
-        try:
-            ptg = hou.ParmTemplateGroup()
-            folder = hou.FolderParmTemplate(
-                "folder1", "MaterialX Builder", folder_type=hou.folderType.Collapsible, default_value=0,
-                ends_tab_group=False
-            )
-            folder.setTags({"group_type": "collapsible", "sidefx::shader_isparm": "0"})
-            inherit = hou.IntParmTemplate(
-                "inherit_ctrl", "Inherit from Class", 1, default_value=([2]), min=0, max=10,
-                menu_items=(['0','1','2']), menu_labels=(['Never','Always','Material Flag']), menu_use_token=False
-            )
-            folder.addParmTemplate(inherit)
-            expr = (
-                "n = hou.pwd()\n"
-                "n_hasFlag = n.isMaterialFlagSet()\n"
-                "i = n.evalParm('inherit_ctrl')\n"
-                "r = 'none'\n"
-                "if i == 1 or (n_hasFlag and i == 2):\n    r = 'inherit'\n"
-                "return r"
-            )
-            class_arc = hou.StringParmTemplate(
-                "shader_referencetype", "Class Arc", 1, default_value=([expr]),
-                default_expression=([expr]), default_expression_language=hou.scriptLanguage.Python,
-                string_type=hou.stringParmType.Regular,
-                menu_items=(['none','reference','inherit','specialize','represent']),
-                menu_labels=(['None','Reference','Inherit','Specialize','Represent'])
-            )
-            class_arc.setTags({"sidefx::shader_isparm": "0", "spare_category": "Shader"})
-            folder.addParmTemplate(class_arc)
-            baseprim = hou.StringParmTemplate(
-                "shader_baseprimpath", "Class Prim Path", 1, default_value=(["/__class_mtl__/`$OS`"]),
-                string_type=hou.stringParmType.Regular
-            )
-            baseprim.setTags({
-                "script_action": "import lopshaderutils\nlopshaderutils.selectPrimFromInputOrFile(kwargs)",
-                "script_action_help": "Select a primitive in the Scene Viewer or Scene Graph Tree pane.\nCtrl-click to select using the primitive picker dialog.",
-                "script_action_icon": "BUTTONS_reselect", "sidefx::shader_isparm": "0", "sidefx::usdpathtype": "prim",
-                "spare_category": "Shader"
-            })
-            folder.addParmTemplate(baseprim)
-            folder.addParmTemplate(hou.SeparatorParmTemplate("separator1"))
-            tabmask = hou.StringParmTemplate(
-                "tabmenumask", "Tab Menu Mask", 1,
-                default_value=(["MaterialX parameter constant collect null genericshader subnet subnetconnector suboutput subinput"])
-            )
-            tabmask.setTags({"spare_category": "Tab Menu"})
-            folder.addParmTemplate(tabmask)
-            rctx = hou.StringParmTemplate("shader_rendercontextname", "Render Context Name", 1, default_value=(["mtlx"]))
-            rctx.setTags({"sidefx::shader_isparm": "0", "spare_category": "Shader"})
-            folder.addParmTemplate(rctx)
-            force = hou.ToggleParmTemplate("shader_forcechildren", "Force Translation of Children", default_value=True)
-            force.setTags({"sidefx::shader_isparm": "0", "spare_category": "Shader"})
-            folder.addParmTemplate(force)
-            ptg.append(folder)
-            mtlx_subnet.setParmTemplateGroup(ptg)
-        except Exception:
-            pass
+        final_name = self._unique_name(sanitized_name)
+        if self._template is not None:
+            # Copy of the blank builder: parameters and material flag already set
+            mtlx_subnet = self._template.instantiate(final_name)
+        else:
+            mtlx_subnet = self.material_library.createNode('subnet', node_name=final_name)
+            for item in mtlx_subnet.allItems():
+                item.destroy()
+            try:
+                mtlx_subnet.setMaterialFlag(True)
+                mtlx_subnet.setParmTemplateGroup(build_mtlx_builder_parm_template_group())
+            except Exception:
+                pass
 
         # Create the shader node inside the subnet
         try:
@@ -597,8 +465,8 @@ class MaterialXToVOPExpander:
 
         # Layout for readability
         try:
-            mtlx_subnet.layoutChildren()
-            self.material_library.layoutChildren()
+            request_layout(mtlx_subnet)
+            request_layout(self.material_library, grid=True)
         except Exception:
             pass
 
@@ -630,7 +498,9 @@ def expand_mtlx_file(
 def expand_mtlx_folder(
     folder_path: str,
     material_library_node: Optional[hou.LopNode] = None,
-    recursive: bool = True
+    recursive: bool = True,
+    max_workers: Optional[int] = None,
+    use_processes: bool = False
 ) -> List[hou.VopNode]:
     """
     Convenience function to expand all MaterialX files in a folder.
@@ -639,12 +509,15 @@ def expand_mtlx_folder(
         folder_path (str): Path to folder
         material_library_node (hou.LopNode): Optional materiallibrary node
         recursive (bool): Search recursively
+        max_workers (int): Parser worker count
+        use_processes (bool): Parse in worker processes instead of threads
 
     Returns:
         list: List of created material VOP networks
     """
     expander = MaterialXToVOPExpander(material_library_node)
-    return expander.expand_mtlx_folder(folder_path, material_library_node, recursive)
+    return expander.expand_mtlx_folder(folder_path, material_library_node, recursive,
+                                       max_workers=max_workers, use_processes=use_processes)
 
 
 # Example usage
@@ -0,0 +1,118 @@
+"""
+Parts Scanner - Shared discovery of exported part folders
+
+A parts folder holds one subfolder per part (Wings, Cargo, Main, ...), each
+with a geometry file (geo.usd, {part}.bgeo.sc, ...) and optionally a
+payload.usd. Every part folder is listed once with os.scandir and candidates
+are resolved against that listing, instead of one os.path.exists probe per
+candidate file.
+
+Records use __slots__ and resolve their USD layer lazily, so large kits can be
+scanned without holding per-part dicts or opened layers in memory.
+
+Usage:
+    from modules.parts_scanner import scan_parts
+
+    for part in scan_parts("/path/to/KB3D_SPS_Spaceship_C"):
+        print(part.name, part.geo_file, part.payload)
+"""
+
+import os
+from typing import FrozenSet, List, Optional, Sequence
+
+# Candidate file names, in order of preference. {name} is the part folder name.
+USD_GEO_CANDIDATES = ('geo.usd', 'geo.usda', '{name}.usd', '{name}.usda')
+GEO_CANDIDATES = ('geo.usd', 'geo.usda', '{name}.bgeo.sc', '{name}.bgeo')
+PAYLOAD_CANDIDATES = ('payload.usd', 'payload.usda')
+
+USD_EXTENSIONS = ('.usd', '.usda', '.usdc')
+
+
+class PartRecord:
+    """A discovered part: its folder, resolved geometry file and payload"""
+
+    __slots__ = ('name', 'folder', 'geo_file', 'payload', 'files', '_layer')
+
+    def __init__(self, name: str, folder: str, geo_file: str,
+                 payload: Optional[str] = None, files: FrozenSet[str] = frozenset()):
+        self.name = name
+        self.folder = folder
+        self.geo_file = geo_file
+        self.payload = payload
+        self.files = files  # File names listed in the part folder
+        self._layer = None
+
+    @property
+    def is_usd(self) -> bool:
+        return self.geo_file.endswith(USD_EXTENSIONS)
+
+    @property
+    def layer(self):
+        """Sdf.Layer for the geometry file, opened on first access (None for non-USD)"""
+        if self._layer is None and self.is_usd:
+            from pxr import Sdf
+            self._layer = Sdf.Layer.FindOrOpen(self.geo_file)
+        return self._layer
+
+    def release(self):
+        """Drop the cached layer handle"""
+        self._layer = None
+
+    def __repr__(self):
+        return f"PartRecord(name={self.name!r}, geo_file={self.geo_file!r})"
+
+
+def _resolve(name: str, folder: str, files: FrozenSet[str],
+             candidates: Sequence[str]) -> Optional[str]:
+    for template in candidates:
+        file_name = template.format(name=name)
+        if file_name in files:
+            return os.path.join(folder, file_name)
+    return None
+
+
+def scan_parts(
+    parts_folder: str,
+    geo_candidates: Sequence[str] = GEO_CANDIDATES,
+    payload_candidates: Sequence[str] = PAYLOAD_CANDIDATES,
+    sort: bool = True
+) -> List[PartRecord]:
+    """
+    Scan a parts folder for part subfolders with a geometry file.
+
+    Args:
+        parts_folder: Folder containing part subfolders
+        geo_candidates: Geometry file names in order of preference ({name} = part name)
+        payload_candidates: Payload file names in order of preference
+        sort: Sort records by part name
+
+    Returns:
+        List of PartRecord, one per part folder with a geometry file
+    """
+    parts = []
+
+    if not os.path.isdir(parts_folder):
+        return parts
+
+    with os.scandir(parts_folder) as entries:
+        part_dirs = [(entry.name, entry.path) for entry in entries if entry.is_dir()]
+
+    for name, folder in part_dirs:
+        try:
+            with os.scandir(folder) as entries:
+                files = frozenset(entry.name for entry in entries if entry.is_file())
+        except OSError as e:
+            print(f"    Warning: Could not list part folder {folder}: {e}")
+            continue
+
+        geo_file = _resolve(name, folder, files, geo_candidates)
+        if not geo_file:
+            continue
+
+        payload = _resolve(name, folder, files, payload_candidates)
+        parts.append(PartRecord(name, folder, geo_file, payload, files))
+
+    if sort:
+        parts.sort(key=lambda p: p.name)
+
+    return parts
@@ -9,6 +9,7 @@ This gives you full control to modify materials instead of working with closed U
 
 import hou
 import os
+import json
 from typing import Dict, List, Optional, Tuple
 from modules.misc_utils import _sanitize, slugify
 
@@ -70,7 +71,8 @@ class USDMaterialExpander:
         folder_path: str,
         pattern: str = "**/mtl.usd",
         lop_network_name: str = "expanded_materials",
-        merge_all: bool = True
+        merge_all: bool = True,
+        batched: bool = False
     ) -> List[hou.LopNode]:
         """
         Import and expand materials from multiple USD files in a folder.
@@ -80,6 +82,9 @@ class USDMaterialExpander:
             pattern (str): Glob pattern for USD files (default: **/mtl.usd)
             lop_network_name (str): Name for the LOP network
             merge_all (bool): If True, merge all materials into one network
+            batched (bool): Reference every file from a single node and expand them
+                with a single materiallibrary, instead of one reference + materiallibrary
+                pair per file chained in series (see _expand_batched)
 
         Returns:
             list: List of created material nodes
@@ -107,6 +112,11 @@ class USDMaterialExpander:
                 initial_stage = child
                 break
 
+        if batched:
+            material_node = self._expand_batched(usd_files, initial_stage)
+            self.lop_context.layoutChildren()
+            return [material_node]
+
         # Create nodes for each USD file
         material_nodes = []
         previous_node = initial_stage
@@ -147,6 +157,53 @@ class USDMaterialExpander:
         self.lop_context.layoutChildren()
         return material_nodes
 
+    def _expand_batched(self, usd_files: List[str], input_node: Optional[hou.LopNode]) -> hou.LopNode:
+        """
+        Reference all USD files from one Python LOP and expand them with one materiallibrary.
+
+        The network depth stays constant (init -> references -> matlib) no matter
+        how many files are found, so an edit no longer recooks a chain that grows
+        with the file count. Each file is referenced at /ref_<folder>, the same
+        prim the per-file reference nodes create.
+
+        Args:
+            usd_files (list): USD files to reference
+            input_node (hou.LopNode): Node to connect the references to (may be None)
+
+        Returns:
+            hou.LopNode: The materiallibrary node
+        """
+        # Unique prim name per file, from its folder name
+        references = []
+        used_names = set()
+        for usd_file in usd_files:
+            base_name = _sanitize(f"ref_{os.path.basename(os.path.dirname(usd_file))}")
+            prim_name = base_name
+            suffix = 1
+            while prim_name in used_names:
+                prim_name = f"{base_name}_{suffix}"
+                suffix += 1
+            used_names.add(prim_name)
+            references.append((prim_name, usd_file))
+
+        refs_node = self.lop_context.createNode('pythonscript', node_name='reference_all_materials')
+        if input_node:
+            refs_node.setInput(0, input_node)
+
+        ptg = refs_node.parmTemplateGroup()
+        ptg.append(hou.StringParmTemplate("references", "References", 1, default_value=([json.dumps(references)])))
+        refs_node.setParmTemplateGroup(ptg)
+        refs_node.parm("python").set(
+            "import json\n"
+            "from modules.usd_material_expander import author_material_references\n"
+            "node = hou.pwd()\n"
+            "author_material_references(node.editableLayer(), json.loads(node.evalParm('references')))\n"
+        )
+
+        matlib = self._expand_materials_to_vops(refs_node, suffix="all")
+        matlib.setDisplayFlag(True)
+        return matlib
+
     def _create_lop_context(self, network_name: str) -> hou.LopNode:
         """
         Create a new LOP network context.
@@ -227,6 +284,23 @@ class USDMaterialExpander:
         return merge_node
 
 
+def author_material_references(layer, references: List[Tuple[str, str]]):
+    """
+    Author one root prim per USD file, referencing the file's default prim.
+
+    Args:
+        layer: Sdf.Layer to author into (a Python LOP's editableLayer())
+        references (list): (prim name, USD file path) pairs
+    """
+    from pxr import Sdf
+
+    with Sdf.ChangeBlock():
+        for prim_name, usd_file in references:
+            prim_spec = Sdf.CreatePrimInLayer(layer, f"/{prim_name}")
+            prim_spec.specifier = Sdf.SpecifierDef
+            prim_spec.referenceList.Prepend(Sdf.Reference(usd_file))
+
+
 def expand_usd_materials(
     usd_file_path: str,
     lop_network_name: str = "expanded_materials",
@@ -255,7 +329,8 @@ def expand_materials_from_folder(
     folder_path: str,
     pattern: str = "**/mtl.usd",
     lop_network_name: str = "expanded_materials",
-    merge_all: bool = True
+    merge_all: bool = True,
+    batched: bool = False
 ) -> List[hou.LopNode]:
     """
     Convenience function to expand materials from multiple USD files.
@@ -265,6 +340,7 @@ def expand_materials_from_folder(
         pattern (str): Glob pattern for USD files
         lop_network_name (str): Name for LOP network
         merge_all (bool): Merge all materials
+        batched (bool): Reference all files from a single node (flat network)
 
     Returns:
         list: List of created material nodes
@@ -274,7 +350,8 @@ def expand_materials_from_folder(
         folder_path,
         pattern,
         lop_network_name,
-        merge_all
+        merge_all,
+        batched
     )
 
 
@@ -20,13 +20,38 @@ Usage:
     # Create USD file
     builder.create_usd_material("/path/to/output.usda")
 
+    # Or build every material of a texture library in one batch
+    usd_material_variant_builder.build_library_materials("$JOB/textures", "$JOB/materials")
+
 Based on KB3D material structure analysis.
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple
 from pxr import Usd, UsdShade, Sdf, UsdGeom
 
+# Standard PBR texture types (shader input -> file name suffix)
+TEXTURE_TYPES = {
+    'base_color': 'basecolor',
+    'metalness': 'metallic',
+    'specular_roughness': 'roughness',
+    'normal': 'normal',
+    'emission_color': 'emissive',
+    'opacity': 'opacity',
+    'displacement': 'displacement'
+}
+
+# Equivalent file extensions per detected folder format
+_FORMAT_EXTENSIONS = {
+    'jpg': ('jpg', 'jpeg'),
+    'tif': ('tif', 'tiff'),
+}
+_IMAGE_EXTENSIONS = ('png', 'jpg', 'jpeg', 'exr', 'tif', 'tiff', 'tx', 'hdr')
+
+# (expanded path, texture types) -> (folder mtimes, library), see scan_texture_library
+_LIBRARY_CACHE: Dict[Tuple, Tuple[Tuple[Tuple[str, float], ...], Dict]] = {}
+
 
 class TextureVariant:
     """Represents a texture resolution variant."""
@@ -37,6 +62,7 @@ class TextureVariant:
         self.format = format              # "png" or "jpg"
         self.resolution = resolution      # "1k", "2k", "4k"
         self.textures: Dict[str, str] = {}  # Map type -> filename
+        self.is_default = False
 
 
 class USDMaterialVariantBuilder:
@@ -64,15 +90,7 @@ class USDMaterialVariantBuilder:
         self.default_variant: Optional[str] = None
 
         # Standard PBR texture types
-        self.texture_types = {
-            'base_color': 'basecolor',
-            'metalness': 'metallic',
-            'specular_roughness': 'roughness',
-            'normal': 'normal',
-            'emission_color': 'emissive',
-            'opacity': 'opacity',
-            'displacement': 'displacement'
-        }
+        self.texture_types = dict(TEXTURE_TYPES)
 
         # Asset metadata
         self.asset_info = {}
@@ -102,7 +120,8 @@ class USDMaterialVariantBuilder:
         return variant
 
     def auto_discover_variants(self, textures_base_path: str,
-                              material_base_name: str) -> int:
+                              material_base_name: str,
+                              library: Optional[Dict[str, List[TextureVariant]]] = None) -> int:
         """
         Auto-discover texture variants by scanning folder structure.
 
@@ -118,66 +137,22 @@ class USDMaterialVariantBuilder:
         Args:
             textures_base_path: Absolute path to textures folder
             material_base_name: Base name for texture files (e.g., "MyMaterial")
+            library: Already scanned library (see scan_texture_library), to reuse one
+                scan for many materials
 
         Returns:
             Number of variants discovered
         """
-        import hou
-
-        expanded_path = hou.text.expandString(textures_base_path)
-
-        if not os.path.isdir(expanded_path):
-            print(f"Warning: Texture path does not exist: {expanded_path}")
-            return 0
+        if library is None:
+            library = scan_texture_library(textures_base_path, self.texture_types)
 
         discovered_count = 0
-
-        # Scan for resolution folders
-        for subfolder in os.listdir(expanded_path):
-            subfolder_path = os.path.join(expanded_path, subfolder)
-
-            if not os.path.isdir(subfolder_path):
-                continue
-
-            # Check if folder matches resolution pattern (png4k, jpg2k, etc.)
-            format_match = None
-            resolution_match = None
-
-            if subfolder.startswith('png'):
-                format_match = 'png'
-                resolution_match = subfolder[3:]  # e.g., "4k" from "png4k"
-            elif subfolder.startswith('jpg'):
-                format_match = 'jpg'
-                resolution_match = subfolder[3:]  # e.g., "2k" from "jpg2k"
-
-            if not format_match or not resolution_match:
-                continue
-
-            # Check if textures exist
-            test_texture = os.path.join(
-                subfolder_path,
-                f"{material_base_name}_basecolor.{format_match}"
-            )
-
-            if os.path.isfile(test_texture):
-                variant = self.add_variant(
-                    variant_name=subfolder,
-                    folder_name=subfolder,
-                    format=format_match,
-                    resolution=resolution_match,
-                    is_default=(subfolder == "png4k")  # KB3D default
-                )
-
-                # Discover all textures for this variant
-                for texture_type, suffix in self.texture_types.items():
-                    texture_file = f"{material_base_name}_{suffix}.{format_match}"
-                    texture_path = os.path.join(subfolder_path, texture_file)
-
-                    if os.path.isfile(texture_path):
-                        variant.textures[texture_type] = texture_file
-
-                discovered_count += 1
-                print(f"Discovered variant: {subfolder} with {len(variant.textures)} textures")
+        for variant in library.get(material_base_name, []):
+            self.variants.append(variant)
+            if variant.is_default or not self.default_variant:
+                self.default_variant = variant.variant_name
+            discovered_count += 1
+            print(f"Discovered variant: {variant.folder_name} with {len(variant.textures)} textures")
 
         return discovered_count
 
@@ -320,8 +295,170 @@ class USDMaterialVariantBuilder:
         }
 
 
+def _expand_path(path: str) -> str:
+    try:
+        import hou
+        return hou.text.expandString(path)
+    except ImportError:
+        return os.path.expandvars(path)
+
+
+def _folder_mtimes(folders) -> Tuple[Tuple[str, float], ...]:
+    mtimes = []
+    for folder in folders:
+        try:
+            mtimes.append((folder, os.stat(folder).st_mtime))
+        except OSError:
+            mtimes.append((folder, -1.0))
+    return tuple(mtimes)
+
+
+def scan_texture_library(textures_base_path: str,
+                         texture_types: Optional[Dict[str, str]] = None) -> Dict[str, List[TextureVariant]]:
+    """
+    Discover the texture variants of every material in a texture library at once.
+
+    Variant folders are found with TextureVariantDetector (png4k, 4k_jpg,
+    Any_4K_PNG_Textures, 2048, ...) and each one is listed once; file names of
+    the form {material}_{suffix}.{ext} are grouped into a (material, type) map.
+    A material gets a variant when that folder has its basecolor texture.
+
+    The result is cached per (path, texture types) until the mtime of the
+    textures folder or of one of its variant folders changes.
+
+    Args:
+        textures_base_path: Path to the textures folder holding the variant folders
+        texture_types: Shader input -> file suffix map (defaults to TEXTURE_TYPES)
+
+    Returns:
+        dict: Material name -> list of TextureVariant (with textures filled in)
+    """
+    # Lazy import: the detector lives with the v3 asset builder
+    from tools.lops_asset_builder_v3.texture_variant_detector import TextureVariantDetector
+
+    texture_types = texture_types or TEXTURE_TYPES
+    type_by_suffix = {suffix.lower(): texture_type for texture_type, suffix in texture_types.items()}
+
+    expanded_path = _expand_path(textures_base_path)
+    if not os.path.isdir(expanded_path):
+        print(f"Warning: Texture path does not exist: {expanded_path}")
+        return {}
+
+    cache_key = (os.path.abspath(expanded_path), tuple(sorted(texture_types.items())))
+    cached = _LIBRARY_CACHE.get(cache_key)
+    if cached and cached[0] == _folder_mtimes(f for f, _ in cached[0]):
+        return {name: list(variants) for name, variants in cached[1].items()}
+
+    detector = TextureVariantDetector()
+    detected = detector.detect_variants(expanded_path)
+    mtimes = _folder_mtimes([cache_key[0]] + [v.folder_path for v in detected])
+    if not detected:
+        _LIBRARY_CACHE[cache_key] = (mtimes, {})
+        return {}
+
+    # KB3D default is png4k, otherwise the detector's configured priority decides
+    default_folder = "png4k" if any(v.folder_name == "png4k" for v in detected) \
+        else detector.choose_main_variant(detected)[0].folder_name
+
+    library: Dict[str, List[TextureVariant]] = {}
+    for detected_variant in detected:
+        allowed_ext = _FORMAT_EXTENSIONS.get(detected_variant.format, (detected_variant.format,))
+        if detected_variant.format == "unknown":
+            allowed_ext = _IMAGE_EXTENSIONS
+
+        # One listing per variant folder: (material, type) -> file
+        textures_by_material: Dict[str, Dict[str, str]] = {}
+        formats: Dict[str, str] = {}
+        try:
+            with os.scandir(detected_variant.folder_path) as entries:
+                for entry in entries:
+                    stem, _, ext = entry.name.rpartition('.')
+                    ext = ext.lower()
+                    if not stem or ext not in allowed_ext:
+                        continue
+                    material, _, suffix = stem.rpartition('_')
+                    texture_type = type_by_suffix.get(suffix.lower())
+                    if not material or not texture_type or not entry.is_file():
+                        continue
+                    textures_by_material.setdefault(material, {})[texture_type] = entry.name
+                    formats.setdefault(material, 'jpg' if ext == 'jpeg' else ext)
+        except OSError as e:
+            print(f"Warning: Could not list texture folder {detected_variant.folder_path}: {e}")
+            continue
+
+        for material, textures in textures_by_material.items():
+            if 'base_color' not in textures:
+                continue
+            fmt = detected_variant.format if detected_variant.format != "unknown" else formats[material]
+            variant = TextureVariant(detected_variant.folder_name, detected_variant.folder_name,
+                                     fmt, detected_variant.resolution)
+            variant.textures = textures
+            variant.is_default = detected_variant.folder_name == default_folder
+            library.setdefault(material, []).append(variant)
+
+    _LIBRARY_CACHE[cache_key] = (mtimes, library)
+    return {name: list(variants) for name, variants in library.items()}
+
+
+def build_library_materials(textures_base_path: str, output_dir: str,
+                            material_names: Optional[List[str]] = None,
+                            base_texture_path: Optional[str] = None,
+                            mtlx_file_pattern: Optional[str] = "{material}.mtlx",
+                            output_pattern: str = "{material}/{material}.usda",
+                            max_workers: Optional[int] = None) -> Dict[str, bool]:
+    """
+    Create the variant USD of every material in a texture library in one batch.
+
+    The library is scanned once (see scan_texture_library) and the USD files are
+    written in parallel.
+
+    Args:
+        textures_base_path: Path to the textures folder holding the variant folders
+        output_dir: Folder the material USD files are written to
+        material_names: Only build these materials (default: every material found)
+        base_texture_path: Texture path written into the USD files (default: textures_base_path)
+        mtlx_file_pattern: MaterialX file referenced by each material, None for no reference
+        output_pattern: Output file path relative to output_dir
+        max_workers: Worker threads (default: ThreadPoolExecutor default)
+
+    Returns:
+        dict: Material name -> True if its USD file was written
+    """
+    library = scan_texture_library(textures_base_path)
+    if material_names is not None:
+        wanted = set(material_names)
+        library = {name: variants for name, variants in library.items() if name in wanted}
+
+    if not library:
+        print(f"Warning: No texture variants discovered in {textures_base_path}")
+        return {}
+
+    texture_root = base_texture_path or textures_base_path
+    output_dir = _expand_path(output_dir)
+
+    def _build(material: str, variants: List[TextureVariant]) -> bool:
+        builder = USDMaterialVariantBuilder(material, base_texture_path=texture_root)
+        for variant in variants:
+            builder.variants.append(variant)
+            if variant.is_default or not builder.default_variant:
+                builder.default_variant = variant.variant_name
+        output_path = os.path.join(output_dir, output_pattern.format(material=material))
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        mtlx_reference = mtlx_file_pattern.format(material=material) if mtlx_file_pattern else None
+        return builder.create_usd_material(output_path, mtlx_reference=mtlx_reference)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {name: executor.submit(_build, name, variants) for name, variants in library.items()}
+        results = {name: future.result() for name, future in futures.items()}
+
+    built = sum(1 for ok in results.values() if ok)
+    print(f"Built {built}/{len(results)} materials from {textures_base_path}")
+    return results
+
+
 def create_kb3d_style_material(material_name: str, textures_path: str,
-                               output_path: str, mtlx_file: str = None) -> bool:
+                               output_path: str, mtlx_file: str = None,
+                               library: Optional[Dict[str, List[TextureVariant]]] = None) -> bool:
     """
     Convenience function to create KB3D-style material with auto-discovery.
 
@@ -330,6 +467,7 @@ def create_kb3d_style_material(material_name: str, textures_path: str,
         textures_path: Path to textures folder (with png4k, jpg2k subfolders)
         output_path: Output .usda file path
         mtlx_file: Optional MaterialX filename (defaults to {material_name}.mtlx)
+        library: Already scanned library of textures_path (see scan_texture_library)
 
     Returns:
         True if successful
@@ -344,7 +482,7 @@ def create_kb3d_style_material(material_name: str, textures_path: str,
     builder = USDMaterialVariantBuilder(material_name)
 
     # Auto-discover variants
-    variant_count = builder.auto_discover_variants(textures_path, material_name)
+    variant_count = builder.auto_discover_variants(textures_path, material_name, library=library)
 
     if variant_count == 0:
         print(f"Warning: No texture variants discovered in {textures_path}")
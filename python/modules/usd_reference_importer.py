@@ -33,7 +33,10 @@ class USDReferenceImporter:
         scan_result: Dict,
         stage_name: str = "asset_references",
         spacing: float = 5.0,
-        layout_type: str = "grid"
+        layout_type: str = "grid",
+        assembly: bool = False,
+        assembly_path: Optional[str] = None,
+        load_payloads: bool = False
     ) -> hou.LopNode:
         """
         Import all geometry assets from scan results as USD references.
@@ -42,11 +45,22 @@ class USDReferenceImporter:
             scan_result (dict): Result from AssetFolderScanner.scan_folder()
             stage_name (str): Name for the stage network
             spacing (float): Distance between assets in Houdini units
-            layout_type (str): Layout type - "grid", "line", or "circular"
+            layout_type (str): Layout type - "grid", "line", "circular" or "packed"
+            assembly (bool): Write one assembly layer and load it with a single
+                sublayer node instead of a reference + xform node pair per asset
+                (see import_scanned_assets_as_assembly)
+            assembly_path (str): Assembly layer file (assembly mode only)
+            load_payloads (bool): Load asset payloads on open (assembly mode only)
 
         Returns:
             hou.LopNode: The merge node containing all references
+            (the sublayer node in assembly mode)
         """
+        if assembly:
+            return self.import_scanned_assets_as_assembly(
+                scan_result, stage_name, spacing, layout_type, assembly_path, load_payloads
+            )
+
         # Create stage if needed
         if self.stage_context is None:
             self.stage_context = self._create_stage_context(stage_name)
@@ -73,11 +87,15 @@ class USDReferenceImporter:
 
         # Import each asset as reference
         reference_nodes = []
-        positions = self._calculate_positions(len(asset_folders), spacing, layout_type)
+        primary_files = [self._select_primary_usd(files) for files in asset_folders.values()]
+        bounds = None
+        if layout_type == "packed":
+            bounds = [self._asset_bounds(usd_file) if usd_file else None for usd_file in primary_files]
+        positions = self._calculate_positions(len(asset_folders), spacing, layout_type, bounds)
 
-        for idx, (folder_name, files) in enumerate(asset_folders.items()):
+        for idx, folder_name in enumerate(asset_folders):
             # Use the named USD file (e.g., KB3D_NEC_BldgMD_B.usd) if available
-            usd_file = self._select_primary_usd(files)
+            usd_file = primary_files[idx]
 
             if usd_file:
                 ref_node = self._create_reference_node(
@@ -100,6 +118,150 @@ class USDReferenceImporter:
 
         return None
 
+    def import_scanned_assets_as_assembly(
+        self,
+        scan_result: Dict,
+        stage_name: str = "asset_references",
+        spacing: float = 5.0,
+        layout_type: str = "grid",
+        assembly_path: Optional[str] = None,
+        load_payloads: bool = False
+    ) -> Optional[hou.LopNode]:
+        """
+        Import all geometry assets through one generated assembly layer.
+
+        The layer holds one instanceable Xform prim per asset, translated to its
+        layout position and payloading the asset file (see write_assembly_layer).
+        It is loaded by a single sublayer node with payload loading off by
+        default, so a preview of hundreds of assets opens without loading any
+        geometry and the network holds one node instead of two per asset.
+
+        Args:
+            scan_result (dict): Result from AssetFolderScanner.scan_folder()
+            stage_name (str): Name for the stage network
+            spacing (float): Distance between assets in Houdini units
+            layout_type (str): Layout type - "grid", "line", "circular" or "packed"
+            assembly_path (str): Layer file to write
+                (default: $HIP/usd/<stage_name>_assembly.usda)
+            load_payloads (bool): Load the asset payloads when the layer is opened
+
+        Returns:
+            hou.LopNode: The sublayer node, or None if nothing was imported
+        """
+        if self.stage_context is None:
+            self.stage_context = self._create_stage_context(stage_name)
+
+        geo_files = scan_result.get('geometry_files', {})
+        if not geo_files:
+            hou.ui.displayMessage(
+                "No geometry files found in scan results.",
+                severity=hou.severityType.Warning
+            )
+            return None
+
+        from pxr import Tf
+
+        # (prim name, usd path) per asset folder, skipping folders without a USD file
+        assets = []
+        bounds = []
+        used_names = set()
+        for folder_name, files in self._group_by_asset_folder(geo_files).items():
+            usd_file = self._select_primary_usd(files)
+            if not usd_file:
+                continue
+            if not os.path.exists(usd_file['path']):
+                print(f"Warning: USD file not found: {usd_file['path']}")
+                continue
+            # Prim names must be valid identifiers (no leading digit, "-" or ".")
+            base_name = Tf.MakeValidIdentifier(_sanitize(folder_name))
+            prim_name = base_name
+            suffix = 1
+            while prim_name in used_names:
+                prim_name = f"{base_name}_{suffix}"
+                suffix += 1
+            used_names.add(prim_name)
+            assets.append((prim_name, usd_file['path']))
+            if layout_type == "packed":
+                bounds.append(self._asset_bounds(usd_file))
+
+        if not assets:
+            return None
+
+        positions = self._calculate_positions(len(assets), spacing, layout_type, bounds or None)
+
+        if assembly_path is None:
+            assembly_path = os.path.join(hou.expandString("$HIP"), "usd", f"{_sanitize(stage_name)}_assembly.usda")
+        write_assembly_layer(
+            assembly_path,
+            [(name, path, position) for (name, path), position in zip(assets, positions)]
+        )
+
+        # Get the initial stage node to connect the layer to
+        initial_stage = None
+        for child in self.stage_context.children():
+            if child.type().name() == 'configurestage':
+                initial_stage = child
+                break
+
+        sublayer_node = self.stage_context.createNode('sublayer', node_name='assembly')
+        if initial_stage:
+            sublayer_node.setInput(0, initial_stage)
+        sublayer_node.parm('filepath1').set(assembly_path)
+        output_node = self._set_payload_loading(sublayer_node, load_payloads)
+
+        output_node.setDisplayFlag(True)
+        output_node.setRenderFlag(True)
+
+        for (name, path), position in zip(assets, positions):
+            self.imported_refs.append({
+                'name': name,
+                'ref_node': sublayer_node,
+                'xform_node': None,
+                'path': path,
+                'position': position
+            })
+
+        self.stage_context.layoutChildren()
+        print(f"Wrote assembly layer with {len(assets)} assets: {assembly_path}")
+
+        return sublayer_node
+
+    def _set_payload_loading(self, sublayer_node: hou.LopNode, load_payloads: bool) -> hou.LopNode:
+        """
+        Set whether the assembly payloads load, on the sublayer node if it has
+        the loadpayloads toggle, else with a Configure Stage LOP after it.
+
+        Args:
+            sublayer_node (hou.LopNode): Sublayer node loading the assembly layer
+            load_payloads (bool): Load the asset payloads
+
+        Returns:
+            hou.LopNode: Last node of the chain (the one to display)
+
+        Raises:
+            hou.OperationFailed: If payloads must stay unloaded and neither node can defer them
+        """
+        payloads_parm = sublayer_node.parm('loadpayloads')
+        if payloads_parm:
+            payloads_parm.set(int(load_payloads))
+            return sublayer_node
+        if load_payloads:
+            # Payloads load by default
+            return sublayer_node
+
+        configure_node = self.stage_context.createNode('configurestage', node_name='assembly_payloads')
+        configure_node.setInput(0, sublayer_node)
+        payloads_parm = configure_node.parm('loadpayloads')
+        if payloads_parm is None:
+            configure_node.destroy()
+            sublayer_node.destroy()
+            raise hou.OperationFailed(
+                "Could not defer payload loading: neither the sublayer nor the configurestage LOP "
+                "has a 'loadpayloads' parameter in this Houdini version"
+            )
+        payloads_parm.set(0)
+        return configure_node
+
     def _group_by_asset_folder(self, geo_files: Dict) -> Dict[str, List[Dict]]:
         """
         Group geometry files by their parent asset folder.
@@ -156,6 +318,28 @@ class USDReferenceImporter:
         # Return in priority order
         return named_variant or payload_usd or first_usd
 
+    def _asset_bounds(self, file_info: Dict) -> Optional[Tuple[Tuple[float, ...], Tuple[float, ...]]]:
+        """
+        Bounding box of an asset for the packed layout.
+
+        Uses the 'bounds' entry of the scanned file info when the scanner provided
+        one, otherwise the extentsHint authored on the asset's default prim. The
+        result is stored back into the file info, so the same scan result does
+        not reopen the asset on the next import.
+
+        Args:
+            file_info (dict): File info from the scanner
+
+        Returns:
+            tuple: ((min x, y, z), (max x, y, z)) or None if unknown
+        """
+        bounds = file_info.get('bounds')
+        if bounds is None:
+            bounds = read_extents_hint(file_info['path'])
+            if bounds is not None:
+                file_info['bounds'] = bounds
+        return bounds
+
     def _create_stage_context(self, stage_name: str) -> hou.LopNode:
         """
         Create a new LOPS stage context.
@@ -252,21 +436,47 @@ class USDReferenceImporter:
         self,
         count: int,
         spacing: float,
-        layout_type: str
+        layout_type: str,
+        bounds: Optional[List] = None
     ) -> List[Tuple[float, float, float]]:
         """
         Calculate spatial positions for assets based on layout type.
 
         Args:
             count (int): Number of assets to position
-            spacing (float): Distance between assets
-            layout_type (str): "grid", "line", or "circular"
+            spacing (float): Distance between assets (gap between bounding boxes for "packed")
+            layout_type (str): "grid", "line", "circular" or "packed"
+            bounds (list): Per-asset ((min), (max)) bounding boxes or None, for "packed".
+                Assets without bounds get the median size of the others.
 
         Returns:
             list: List of (x, y, z) position tuples
         """
         positions = []
 
+        if layout_type == "packed":
+            known = [b for b in (bounds or []) if b is not None]
+            if not known:
+                print("Warning: No asset bounds available for packed layout, using grid")
+                return self._calculate_positions(count, spacing, "grid")
+
+            import numpy as np
+            from modules.layout_packing import pack_bounds
+
+            known_min = np.array([b[0] for b in known], dtype=np.float64)
+            known_max = np.array([b[1] for b in known], dtype=np.float64)
+            half_size = np.median(known_max - known_min, axis=0) * 0.5
+
+            bounds_min = np.tile(-half_size, (count, 1))
+            bounds_max = np.tile(half_size, (count, 1))
+            for idx, b in enumerate(bounds):
+                if b is not None:
+                    bounds_min[idx] = b[0]
+                    bounds_max[idx] = b[1]
+
+            translations = pack_bounds(bounds_min, bounds_max, spacing=spacing)
+            return [tuple(float(v) for v in t) for t in translations]
+
         if layout_type == "grid":
             # Arrange in a square grid
             import math
@@ -329,11 +539,92 @@ class USDReferenceImporter:
         return merge_node
 
 
+_extents_cache: Dict[Tuple[str, float], Optional[Tuple]] = {}
+
+
+def read_extents_hint(usd_path: str) -> Optional[Tuple[Tuple[float, ...], Tuple[float, ...]]]:
+    """
+    Read the extentsHint of a USD file's default prim, without composing a stage.
+
+    Results are cached per (path, modification time).
+
+    Args:
+        usd_path (str): USD file
+
+    Returns:
+        tuple: ((min x, y, z), (max x, y, z)) or None if the file has no extentsHint
+    """
+    try:
+        key = (usd_path, os.path.getmtime(usd_path))
+    except OSError:
+        return None
+    if key in _extents_cache:
+        return _extents_cache[key]
+
+    from pxr import Sdf
+
+    bounds = None
+    layer = Sdf.Layer.FindOrOpen(usd_path)
+    if layer is not None and layer.defaultPrim:
+        prim_spec = layer.GetPrimAtPath(Sdf.Path.absoluteRootPath.AppendChild(layer.defaultPrim))
+        attr = prim_spec.attributes.get('extentsHint') if prim_spec else None
+        if attr is not None and attr.HasDefaultValue() and len(attr.default) >= 2:
+            extent_min, extent_max = attr.default[0], attr.default[1]
+            bounds = (tuple(float(v) for v in extent_min), tuple(float(v) for v in extent_max))
+
+    _extents_cache[key] = bounds
+    return bounds
+
+
+def write_assembly_layer(
+    layer_path: str,
+    assets: List[Tuple[str, str, Tuple[float, float, float]]]
+):
+    """
+    Write an assembly layer with one instanceable, translated Xform per asset.
+
+    Each prim payloads the asset file's default prim, so the assets stay
+    unloaded until payloads are loaded, and identical assets share prototypes.
+
+    Args:
+        layer_path (str): Layer file to write (existing file is overwritten)
+        assets (list): (prim name, usd path, (x, y, z) position) per asset
+    """
+    from pxr import Gf, Sdf, Vt
+
+    os.makedirs(os.path.dirname(layer_path) or ".", exist_ok=True)
+
+    layer = Sdf.Layer.FindOrOpen(layer_path) if os.path.exists(layer_path) else None
+    if layer is None:
+        layer = Sdf.Layer.CreateNew(layer_path)
+    else:
+        layer.Clear()
+
+    with Sdf.ChangeBlock():
+        for prim_name, usd_path, position in assets:
+            prim_spec = Sdf.CreatePrimInLayer(layer, f"/{prim_name}")
+            prim_spec.specifier = Sdf.SpecifierDef
+            prim_spec.typeName = "Xform"
+            prim_spec.instanceable = True
+            prim_spec.payloadList.Prepend(Sdf.Payload(usd_path))
+
+            translate = Sdf.AttributeSpec(prim_spec, "xformOp:translate", Sdf.ValueTypeNames.Double3)
+            translate.default = Gf.Vec3d(*position)
+            op_order = Sdf.AttributeSpec(prim_spec, "xformOpOrder", Sdf.ValueTypeNames.TokenArray,
+                                         Sdf.VariabilityUniform)
+            op_order.default = Vt.TokenArray(["xformOp:translate"])
+
+    layer.Save()
+
+
 def import_scanned_assets(
     scan_result: Dict,
     stage_name: str = "asset_references",
     spacing: float = 5.0,
-    layout_type: str = "grid"
+    layout_type: str = "grid",
+    assembly: bool = False,
+    assembly_path: Optional[str] = None,
+    load_payloads: bool = False
 ) -> Optional[hou.LopNode]:
     """
     Convenience function to import scanned assets as USD references.
@@ -342,13 +633,19 @@ def import_scanned_assets(
         scan_result (dict): Result from AssetFolderScanner.scan_folder()
         stage_name (str): Name for the stage network
         spacing (float): Distance between assets in Houdini units
-        layout_type (str): Layout type - "grid", "line", or "circular"
+        layout_type (str): Layout type - "grid", "line", "circular" or "packed"
+        assembly (bool): Load all assets through one generated assembly layer
+        assembly_path (str): Assembly layer file (assembly mode only)
+        load_payloads (bool): Load asset payloads on open (assembly mode only)
 
     Returns:
         hou.LopNode: The merge node containing all references
+        (the sublayer node in assembly mode)
     """
     importer = USDReferenceImporter()
-    return importer.import_scanned_assets(scan_result, stage_name, spacing, layout_type)
+    return importer.import_scanned_assets(
+        scan_result, stage_name, spacing, layout_type, assembly, assembly_path, load_payloads
+    )
 
 
 # Example usage
@@ -18,9 +18,15 @@ Usage:
 
 import os
 import hou
-from typing import List, Dict, Set, Optional, Callable
+from typing import List, Set, Optional, Callable
 from pxr import Usd, UsdGeom, UsdShade, Sdf, Gf
 
+from modules.parts_scanner import PartRecord, scan_parts
+from tools.asset_library_builder.material_name_converter import (
+    extract_mesh_names_from_layer,
+    find_matching_materials_fast,
+)
+
 
 def build_from_parts(
     parts_folder: str,
@@ -28,7 +34,8 @@ def build_from_parts(
     models_folder: str,
     materials_folder: str,
     texture_variants: List[str] = None,
-    progress_callback: Optional[Callable[[int, str], None]] = None
+    progress_callback: Optional[Callable[[int, str], None]] = None,
+    fast_material_discovery: bool = True
 ) -> str:
     """
     Build proper USD assembly from individual part folders.
@@ -41,6 +48,8 @@ def build_from_parts(
         materials_folder: Materials folder for material references
         texture_variants: List of texture variants (default: ["jpg1k", "jpg2k", "png4k"])
         progress_callback: Optional callback(percent: int, message: str) for progress updates
+        fast_material_discovery: Read mesh names from part layers without stage
+                     composition and match against a cached Materials index
 
     Returns:
         Path to created payload.usd
@@ -77,7 +86,8 @@ def build_from_parts(
 
     # Step 2: Scan materials from parts (10-20%)
     _report_progress(15, "Step 2/6: Scanning materials from parts...")
-    materials = _scan_materials_from_parts(parts, materials_folder, progress_callback)
+    materials = _scan_materials_from_parts(parts, materials_folder, progress_callback,
+                                           fast=fast_material_discovery)
     _report_progress(20, f"  Found {len(materials)} unique materials")
 
     # Step 3: Create geo.usd by merging all parts (20-50%)
@@ -117,63 +127,19 @@ def build_from_parts(
     return payload_path
 
 
-def _scan_parts_folder(parts_folder: str) -> List[Dict]:
+def _scan_parts_folder(parts_folder: str) -> List[PartRecord]:
     """
     Scan parts folder and find all part subfolders.
 
-    Returns list of dicts with part info:
-    [
-        {
-            'name': 'PartA',
-            'folder': '/path/to/PartA',
-            'geo_usd': '/path/to/PartA/geo.usd',
-            'bgeo': '/path/to/PartA/PartA.bgeo.sc',
-            'payload': '/path/to/PartA/payload.usd'
-        },
-        ...
-    ]
+    Returns list of PartRecord sorted by name, each with name, folder,
+    geo_file (geo.usd/geo.usda preferred over {name}.bgeo.sc/{name}.bgeo)
+    and payload (payload.usd/payload.usda or None).
     """
-    parts = []
-
     if not os.path.exists(parts_folder):
         print(f"ERROR: Parts folder not found: {parts_folder}")
-        return parts
+        return []
 
-    for item in os.listdir(parts_folder):
-        part_path = os.path.join(parts_folder, item)
-
-        if not os.path.isdir(part_path):
-            continue
-
-        # Check for geo files
-        geo_usd = os.path.join(part_path, "geo.usd")
-        geo_usda = os.path.join(part_path, "geo.usda")
-        bgeo = os.path.join(part_path, f"{item}.bgeo.sc")
-        bgeo_alt = os.path.join(part_path, f"{item}.bgeo")
-        payload = os.path.join(part_path, "payload.usd")
-        payload_alt = os.path.join(part_path, "payload.usda")
-
-        # Prefer USD over BGEO
-        geo_file = None
-        if os.path.exists(geo_usd):
-            geo_file = geo_usd
-        elif os.path.exists(geo_usda):
-            geo_file = geo_usda
-        elif os.path.exists(bgeo):
-            geo_file = bgeo
-        elif os.path.exists(bgeo_alt):
-            geo_file = bgeo_alt
-
-        if geo_file:
-            part_info = {
-                'name': item,
-                'folder': part_path,
-                'geo_file': geo_file,
-                'payload': payload if os.path.exists(payload) else (payload_alt if os.path.exists(payload_alt) else None)
-            }
-            parts.append(part_info)
-
-    return sorted(parts, key=lambda p: p['name'])
+    return scan_parts(parts_folder)
 
 
 def _extract_mesh_names_from_usd(usd_file_path: str) -> Set[str]:
@@ -254,31 +220,36 @@ def _find_matching_materials(
 
 
 def _scan_materials_from_parts(
-    parts: List[Dict],
+    parts: List[PartRecord],
     materials_folder: str,
-    progress_callback: Optional[Callable[[int, str], None]] = None
+    progress_callback: Optional[Callable[[int, str], None]] = None,
+    fast: bool = True
 ) -> Set[str]:
     """
     Scan all part files and extract material names from mesh names.
     Uses mesh names directly as material names (no conversion).
     Matches against Materials folder (case-insensitive).
+
+    With fast=True, part layers are read as prim specs (no stage composition)
+    and materials are matched against a cached Materials folder index.
     """
+    extract_mesh_names = extract_mesh_names_from_layer if fast else _extract_mesh_names_from_usd
     mesh_names = set()
     total = len(parts)
 
     # Step 1: Extract all mesh names from parts
     for i, part in enumerate(parts):
-        geo_file = part['geo_file']
+        geo_file = part.geo_file
 
         # Report progress
         if progress_callback:
             percent = 10 + int((i / total) * 10)  # 10-20% range
-            progress_callback(percent, f"  Scanning meshes from part {i+1}/{total}: {part['name']}")
+            progress_callback(percent, f"  Scanning meshes from part {i+1}/{total}: {part.name}")
 
         # Only scan USD files
         if geo_file.endswith(('.usd', '.usda', '.usdc')):
             try:
-                part_mesh_names = _extract_mesh_names_from_usd(geo_file)
+                part_mesh_names = extract_mesh_names(geo_file)
                 mesh_names.update(part_mesh_names)
             except Exception as e:
                 print(f"    Warning: Could not extract mesh names from {geo_file}: {e}")
@@ -286,7 +257,10 @@ def _scan_materials_from_parts(
     print(f"  Found {len(mesh_names)} unique mesh names")
 
     # Step 2: Match against Materials folder (use mesh names directly)
-    matched_materials = _find_matching_materials(mesh_names, materials_folder)
+    if fast:
+        matched_materials = set(find_matching_materials_fast(mesh_names, materials_folder).values())
+    else:
+        matched_materials = _find_matching_materials(mesh_names, materials_folder)
 
     print(f"  Matched {len(matched_materials)} materials in library")
 
@@ -295,7 +269,7 @@ def _scan_materials_from_parts(
 
 
 def _create_geo_from_parts(
-    parts: List[Dict],
+    parts: List[PartRecord],
     output_path: str,
     asset_name: str,
     parts_folder: str,
@@ -323,8 +297,8 @@ def _create_geo_from_parts(
 
         # Import each part (20-43% progress range)
         for i, part in enumerate(parts):
-            part_name = part['name']
-            geo_file = part['geo_file']
+            part_name = part.name
+            geo_file = part.geo_file
 
             # Report progress
             if progress_callback:
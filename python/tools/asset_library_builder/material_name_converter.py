@@ -3,11 +3,22 @@ Material Name Converter - Convert mesh names to material names
 
 Converts lowercase underscore mesh names to proper PascalCase material names:
     kb3d_mtm_metalpanelgraytrima -> KB3D_MTM_MetalPanelGrayTrimA
+
+Also provides fast, composition-free material discovery: mesh names are read
+from prim specs with Sdf.Layer.FindOrOpen, and material folders are looked up
+in a cached listing of the Materials folder. Both caches are keyed by
+(path, mtime) and live for the Houdini session.
 """
 
 import os
 import re
-from typing import Set, List, Dict
+from typing import Set, List, Dict, FrozenSet, Optional, Tuple
+
+# abs layer path -> (mtime, mesh names, dependency layer paths)
+_LAYER_MESH_CACHE: Dict[str, Tuple[float, FrozenSet[str], Tuple[str, ...]]] = {}
+
+# abs materials folder -> (mtime, {lowercase folder name: folder name})
+_MATERIAL_LIBRARY_CACHE: Dict[str, Tuple[float, Dict[str, str]]] = {}
 
 
 def mesh_name_to_material_name(mesh_name: str) -> str:
@@ -164,6 +175,161 @@ def extract_mesh_names_from_usd(usd_file_path: str) -> Set[str]:
     return mesh_names
 
 
+def _mtime(path: str) -> Optional[float]:
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def _scan_layer_specs(layer) -> Tuple[FrozenSet[str], Tuple[str, ...]]:
+    """Collect Mesh prim spec names and referenced/sublayered file paths from one layer"""
+    mesh_names = set()
+    dependencies = [layer.ComputeAbsolutePath(path) for path in layer.subLayerPaths]
+
+    stack = list(layer.rootPrims)
+    while stack:
+        spec = stack.pop()
+        if spec.typeName == "Mesh":
+            mesh_names.add(spec.name)
+
+        for arcs in (spec.referenceList, spec.payloadList):
+            for items in (arcs.explicitItems, arcs.prependedItems, arcs.appendedItems, arcs.addedItems):
+                for item in items:
+                    if item.assetPath:
+                        dependencies.append(layer.ComputeAbsolutePath(item.assetPath))
+
+        stack.extend(spec.nameChildren)
+        for variant_set in spec.variantSets.values():
+            for variant in variant_set.variants.values():
+                stack.extend(variant.primSpec.nameChildren)
+
+    return frozenset(mesh_names), tuple(dependencies)
+
+
+def extract_mesh_names_from_layer(usd_file_path: str, follow_composition: bool = True) -> Set[str]:
+    """
+    Extract Mesh prim names from a USD file without composing a stage.
+
+    Prim specs are walked by typeName, so meshes in every variant and in
+    inactive prims are included. Sublayers, references and payloads are
+    followed when follow_composition is True. Results are cached per layer
+    by (path, mtime).
+
+    Args:
+        usd_file_path: Path to USD file
+        follow_composition: Also scan sublayers, references and payloads
+
+    Returns:
+        Set of mesh names
+    """
+    from pxr import Sdf
+
+    mesh_names = set()
+    visited = set()
+    pending = [os.path.abspath(usd_file_path)]
+
+    while pending:
+        layer_path = pending.pop()
+        if layer_path in visited:
+            continue
+        visited.add(layer_path)
+
+        mtime = _mtime(layer_path)
+        cached = _LAYER_MESH_CACHE.get(layer_path)
+        if cached and cached[0] == mtime:
+            names, dependencies = cached[1], cached[2]
+        else:
+            try:
+                layer = Sdf.Layer.FindOrOpen(layer_path)
+            except Exception as e:
+                print(f"    Warning: Could not open layer {layer_path}: {e}")
+                continue
+            if not layer:
+                continue
+            names, dependencies = _scan_layer_specs(layer)
+            _LAYER_MESH_CACHE[layer_path] = (mtime, names, dependencies)
+
+        mesh_names.update(names)
+        if follow_composition:
+            pending.extend(dependencies)
+
+    return mesh_names
+
+
+def index_material_library(materials_folder: str) -> Dict[str, str]:
+    """
+    Index the material folders of a Materials folder.
+
+    The folder is listed once and the index cached until its mtime changes.
+    Only the subfolder names are cached: whether a material folder holds its
+    {name}.usd is checked per requested material (see
+    find_matching_materials_fast), because writing that file does not change
+    the Materials folder mtime.
+
+    Args:
+        materials_folder: Path to Materials folder
+
+    Returns:
+        Dict mapping lowercase material folder name to the material folder name
+    """
+    folder = os.path.abspath(materials_folder)
+    mtime = _mtime(folder)
+    if mtime is None:
+        return {}
+
+    cached = _MATERIAL_LIBRARY_CACHE.get(folder)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    folders = {}
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                folders[entry.name.lower()] = entry.name
+
+    _MATERIAL_LIBRARY_CACHE[folder] = (mtime, folders)
+    return folders
+
+
+def find_matching_materials_fast(
+    material_names: Set[str],
+    materials_folder: str
+) -> Dict[str, str]:
+    """
+    Same result as find_matching_materials, resolved against the cached
+    index_material_library() folder listing; only the requested materials
+    get a {name}.usd check.
+
+    Args:
+        material_names: Set of material names to match
+        materials_folder: Path to Materials folder
+
+    Returns:
+        Dict mapping material name to material folder name
+    """
+    if not os.path.isdir(materials_folder):
+        print(f"WARNING: Materials folder not found: {materials_folder}")
+        return {}
+
+    folders = index_material_library(materials_folder)
+    matches = {}
+    for mat_name in material_names:
+        actual_name = folders.get(mat_name.lower())
+        if actual_name and os.path.isfile(os.path.join(materials_folder, actual_name, f"{actual_name}.usd")):
+            matches[mat_name] = actual_name
+        else:
+            print(f"  WARNING: Material not found in library: {mat_name}")
+
+    return matches
+
+
+def clear_discovery_cache():
+    """Forget cached layer scans and material library indexes"""
+    _LAYER_MESH_CACHE.clear()
+    _MATERIAL_LIBRARY_CACHE.clear()
+
+
 # Test/Debug function
 if __name__ == "__main__":
     # Test conversions
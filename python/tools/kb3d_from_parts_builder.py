@@ -18,9 +18,11 @@ Usage:
 
 import os
 import hou
-from typing import List, Dict, Set, Optional
+from typing import List, Set, Optional
 from pxr import Usd, UsdGeom, UsdShade, Sdf, Gf
 
+from modules.parts_scanner import PartRecord, scan_parts
+
 
 def build_from_parts(
     parts_folder: str,
@@ -111,66 +113,22 @@ def build_from_parts(
     return payload_path
 
 
-def _scan_parts_folder(parts_folder: str) -> List[Dict]:
+def _scan_parts_folder(parts_folder: str) -> List[PartRecord]:
     """
     Scan parts folder and find all part subfolders.
 
-    Returns list of dicts with part info:
-    [
-        {
-            'name': 'SatelliteArmE',
-            'folder': '/path/to/SatelliteArmE',
-            'geo_usd': '/path/to/SatelliteArmE/geo.usd',
-            'bgeo': '/path/to/SatelliteArmE/SatelliteArmE.bgeo.sc',
-            'payload': '/path/to/SatelliteArmE/payload.usd'
-        },
-        ...
-    ]
+    Returns list of PartRecord sorted by name, each with name, folder,
+    geo_file (geo.usd/geo.usda preferred over {name}.bgeo.sc/{name}.bgeo)
+    and payload (payload.usd/payload.usda or None).
     """
-    parts = []
-
     if not os.path.exists(parts_folder):
         print(f"ERROR: Parts folder not found: {parts_folder}")
-        return parts
+        return []
 
-    for item in os.listdir(parts_folder):
-        part_path = os.path.join(parts_folder, item)
+    return scan_parts(parts_folder)
 
-        if not os.path.isdir(part_path):
-            continue
 
-        # Check for geo files
-        geo_usd = os.path.join(part_path, "geo.usd")
-        geo_usda = os.path.join(part_path, "geo.usda")
-        bgeo = os.path.join(part_path, f"{item}.bgeo.sc")
-        bgeo_alt = os.path.join(part_path, f"{item}.bgeo")
-        payload = os.path.join(part_path, "payload.usd")
-        payload_alt = os.path.join(part_path, "payload.usda")
-
-        # Prefer USD over BGEO
-        geo_file = None
-        if os.path.exists(geo_usd):
-            geo_file = geo_usd
-        elif os.path.exists(geo_usda):
-            geo_file = geo_usda
-        elif os.path.exists(bgeo):
-            geo_file = bgeo
-        elif os.path.exists(bgeo_alt):
-            geo_file = bgeo_alt
-
-        if geo_file:
-            part_info = {
-                'name': item,
-                'folder': part_path,
-                'geo_file': geo_file,
-                'payload': payload if os.path.exists(payload) else (payload_alt if os.path.exists(payload_alt) else None)
-            }
-            parts.append(part_info)
-
-    return sorted(parts, key=lambda p: p['name'])
-
-
-def _scan_materials_from_parts(parts: List[Dict]) -> Set[str]:
+def _scan_materials_from_parts(parts: List[PartRecord]) -> Set[str]:
     """
     Scan all part files and extract material names BEFORE building.
     This avoids stage cooking issues.
@@ -178,7 +136,7 @@ def _scan_materials_from_parts(parts: List[Dict]) -> Set[str]:
     materials = set()
 
     for part in parts:
-        geo_file = part['geo_file']
+        geo_file = part.geo_file
 
         # Only scan USD files (BGEO doesn't have material info easily accessible)
         if geo_file.endswith(('.usd', '.usda', '.usdc')):
@@ -214,7 +172,7 @@ def _scan_materials_from_parts(parts: List[Dict]) -> Set[str]:
 
 
 def _create_geo_from_parts(
-    parts: List[Dict],
+    parts: List[PartRecord],
     output_path: str,
     asset_name: str,
     parts_folder: str,
@@ -237,8 +195,8 @@ def _create_geo_from_parts(
 
         # Import each part
         for i, part in enumerate(parts):
-            part_name = part['name']
-            geo_file = part['geo_file']
+            part_name = part.name
+            geo_file = part.geo_file
 
             print(f"  Importing part {i+1}/{len(parts)}: {part_name}")
 
@@ -24,10 +24,12 @@ Usage:
 
 import hou
 import os
-from typing import List, Dict, Optional
+from typing import List, Optional
 
+from modules.parts_scanner import PartRecord, USD_GEO_CANDIDATES, scan_parts
 
-def scan_kb3d_parts(parts_folder: str) -> List[Dict[str, str]]:
+
+def scan_kb3d_parts(parts_folder: str) -> List[PartRecord]:
     """
     Scan a KitBash3D parts folder and find all part subfolders.
 
@@ -35,43 +37,14 @@ def scan_kb3d_parts(parts_folder: str) -> List[Dict[str, str]]:
         parts_folder: Path to folder containing part subfolders (Wings, Cargo, Main, etc.)
 
     Returns:
-        List of dicts with part info: [{'name': 'Wings', 'path': '/path/to/Wings', 'geo': '/path/to/Wings/geo.usd'}, ...]
+        List of PartRecord (name, folder, geo_file) with geo.usd, geo.usda, or a
+        .usd file named after the folder
     """
-    parts = []
-
     if not os.path.isdir(parts_folder):
         print(f"Error: {parts_folder} is not a directory")
-        return parts
-
-    # Look for subdirectories that contain geo files
-    for item in os.listdir(parts_folder):
-        item_path = os.path.join(parts_folder, item)
-
-        if not os.path.isdir(item_path):
-            continue
-
-        # Look for geo.usd, geo.usda, or .usd file with same name as folder
-        geo_candidates = [
-            os.path.join(item_path, 'geo.usd'),
-            os.path.join(item_path, 'geo.usda'),
-            os.path.join(item_path, f'{item}.usd'),
-            os.path.join(item_path, f'{item}.usda'),
-        ]
-
-        geo_file = None
-        for candidate in geo_candidates:
-            if os.path.exists(candidate):
-                geo_file = candidate
-                break
-
-        if geo_file:
-            parts.append({
-                'name': item,
-                'path': item_path,
-                'geo': geo_file
-            })
+        return []
 
-    return parts
+    return scan_parts(parts_folder, geo_candidates=USD_GEO_CANDIDATES)
 
 
 def process_kb3d_parts(
@@ -103,7 +76,7 @@ def process_kb3d_parts(
         print(f"No parts found in {parts_folder}")
         return None
 
-    print(f"Found {len(parts)} parts: {[p['name'] for p in parts]}")
+    print(f"Found {len(parts)} parts: {[p.name for p in parts]}")
 
     # Create or use existing OBJ context
     if obj_context is None:
@@ -119,14 +92,14 @@ def process_kb3d_parts(
     merge_inputs = []
 
     for i, part in enumerate(parts):
-        print(f"Processing part: {part['name']}")
+        print(f"Processing part: {part.name}")
 
         # Create USD import node
-        usd_import = obj_context.createNode('file', f"import_{part['name']}")
-        usd_import.parm('file').set(part['geo'])
+        usd_import = obj_context.createNode('file', f"import_{part.name}")
+        usd_import.parm('file').set(part.geo_file)
 
         # Apply matchsize with CENTER mode
-        matchsize = obj_context.createNode('matchsize', f"matchsize_{part['name']}")
+        matchsize = obj_context.createNode('matchsize', f"matchsize_{part.name}")
         matchsize.setInput(0, usd_import)
         matchsize.parm('scale').set(match_size)
 
@@ -235,7 +208,7 @@ if __name__ == "__main__":
     output = "/media/tushita/TUSHITA_LINUX_DATA/assets/KitBash3D - Spaceships/KB3D_SPACESHIP_CLONE/geo/KB3D_SPS_Spaceship_C_merged.bgeo.sc"
 
     parts = scan_kb3d_parts(test_folder)
-    print("Found parts:", [p['name'] for p in parts])
+    print("Found parts:", [p.name for p in parts])
 
     # Process and create network for inspection
     node = process_kb3d_parts(
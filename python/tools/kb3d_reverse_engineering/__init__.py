@@ -6,15 +6,22 @@ component-based USD pipeline.
 
 Modules:
     kb3d_usd_analyzer - Analyze USD files to extract component structure
+    kit_analyzer - Analyze every asset of a kit in parallel into one JSONL mapping
+    geometry_matcher - Match prototype names to extracted geometry folders
+    benchmark_analyzer - Time KB3DAnalyzer on a generated large assembly
     kb3d_geometry_converter - Convert extracted .bgeo.sc to USD components
     kb3d_assembly_generator - Generate new assemblies from components
     kb3d_pipeline_orchestrator - Batch process entire asset library
 """
 
-from .kb3d_usd_analyzer import KB3DAnalyzer, analyze_asset, AssetMapping
+from .kb3d_usd_analyzer import KB3DAnalyzer, StageIndexer, analyze_asset, AssetMapping
+from .geometry_matcher import GeometryMatcher, GeometryMatch
 
 __all__ = [
     'KB3DAnalyzer',
+    'StageIndexer',
     'analyze_asset',
     'AssetMapping',
+    'GeometryMatcher',
+    'GeometryMatch',
 ]
@@ -0,0 +1,169 @@
+"""
+KB3D Analyzer Benchmark
+
+Generates a synthetic KB3D-style assembly (internal prototypes, thousands of
+referencing instances, external prop references and materials) and times
+KB3DAnalyzer with the original per-extractor traversals against the
+single-pass StageIndexer.
+
+Usage:
+    python -m tools.kb3d_reverse_engineering.benchmark_analyzer [instance_count] [output_dir]
+    or from Houdini Python Shell:
+    from tools.kb3d_reverse_engineering import benchmark_analyzer
+    benchmark_analyzer.run_benchmark(10000)
+"""
+
+import os
+import tempfile
+import time
+from typing import Dict
+
+from pxr import Sdf
+
+from tools.kb3d_reverse_engineering.kb3d_usd_analyzer import KB3DAnalyzer
+
+
+def build_benchmark_stage(output_dir: str, instance_count: int = 10000,
+                          prototype_count: int = 50, material_count: int = 40,
+                          prop_count: int = 20) -> str:
+    """
+    Write a synthetic KB3D assembly to disk.
+
+    Args:
+        output_dir: Directory to write the assembly (and its prop file) into
+        instance_count: Number of instances referencing internal prototypes
+        prototype_count: Number of prototypes under __prototypes__
+        material_count: Number of Material prims (each with a shader child)
+        prop_count: Number of external prop references
+
+    Returns:
+        Path to the generated assembly USD file
+    """
+    asset_name = "KB3D_BNC_BenchmarkAssembly_A"
+    asset_dir = os.path.join(output_dir, asset_name)
+    props_dir = os.path.join(output_dir, "props")
+    os.makedirs(asset_dir, exist_ok=True)
+    os.makedirs(props_dir, exist_ok=True)
+
+    prop_path = os.path.join(props_dir, "KB3D_BNC_Prop.usda")
+    prop_layer = Sdf.Layer.CreateNew(prop_path)
+    prop_root = Sdf.CreatePrimInLayer(prop_layer, "/Prop")
+    prop_root.specifier = Sdf.SpecifierDef
+    prop_root.typeName = "Xform"
+    prop_layer.defaultPrim = "Prop"
+    prop_layer.Save()
+
+    usd_path = os.path.join(asset_dir, f"{asset_name}.usda")
+    layer = Sdf.Layer.CreateNew(usd_path)
+    root_path = Sdf.Path(f"/{asset_name}")
+
+    def define(path, type_name):
+        spec = Sdf.CreatePrimInLayer(layer, path)
+        spec.specifier = Sdf.SpecifierDef
+        spec.typeName = type_name
+        return spec
+
+    with Sdf.ChangeBlock():
+        root = define(root_path, "Xform")
+        root.kind = "assembly"
+        layer.defaultPrim = asset_name
+
+        vset = Sdf.VariantSetSpec(root, "texture_variant")
+        for name in ("png4k", "jpg2k", "jpg1k"):
+            Sdf.VariantSpec(vset, name)
+        root.variantSetNameList.prependedItems.append("texture_variant")
+        root.variantSelections["texture_variant"] = "png4k"
+
+        mtl_scope = root_path.AppendChild("mtl")
+        define(mtl_scope, "Scope")
+        for i in range(material_count):
+            mat_path = mtl_scope.AppendChild(f"KB3D_BNC_Material_{i:03d}")
+            define(mat_path, "Material")
+            define(mat_path.AppendChild("mtlxstandard_surface"), "Shader")
+
+        protos_path = root_path.AppendChild("__prototypes__")
+        define(protos_path, "Scope")
+        proto_paths = []
+        for i in range(prototype_count):
+            proto_path = protos_path.AppendChild(f"{asset_name}_Part_{i:03d}")
+            define(proto_path, "Xform")
+            define(proto_path.AppendChild("geo"), "Mesh")
+            proto_paths.append(proto_path)
+
+        instances_path = root_path.AppendChild("instances")
+        define(instances_path, "Xform")
+        for i in range(instance_count):
+            inst_path = instances_path.AppendChild(f"Part_{i:05d}")
+            inst = define(inst_path, "Xform")
+            inst.instanceable = True
+            inst.referenceList.prependedItems.append(
+                Sdf.Reference(primPath=proto_paths[i % prototype_count])
+            )
+            translate = Sdf.AttributeSpec(inst, "xformOp:translate", Sdf.ValueTypeNames.Double3)
+            translate.default = (float(i % 100), 0.0, float(i // 100))
+            order = Sdf.AttributeSpec(inst, "xformOpOrder", Sdf.ValueTypeNames.TokenArray,
+                                      Sdf.VariabilityUniform)
+            order.default = ["xformOp:translate"]
+
+        props_path = root_path.AppendChild("props")
+        define(props_path, "Xform")
+        for i in range(prop_count):
+            prop = define(props_path.AppendChild(f"Prop_{i:03d}"), "Xform")
+            prop.kind = "component"
+            prop.referenceList.prependedItems.append(
+                Sdf.Reference("../props/KB3D_BNC_Prop.usda")
+            )
+
+    layer.Save()
+    return usd_path
+
+
+def _time_analyze(usd_path: str, **kwargs) -> float:
+    analyzer = KB3DAnalyzer(usd_path)
+    start = time.perf_counter()
+    analyzer.analyze(**kwargs)
+    return time.perf_counter() - start
+
+
+def run_benchmark(instance_count: int = 10000, output_dir: str = None) -> Dict[str, float]:
+    """
+    Generate a benchmark stage and time each analysis mode.
+
+    Args:
+        instance_count: Number of prototype instances in the generated stage
+        output_dir: Where to write the stage (defaults to a temp directory)
+
+    Returns:
+        Dict of mode name -> seconds
+    """
+    output_dir = output_dir or tempfile.mkdtemp(prefix="kb3d_analyzer_bench_")
+    usd_path = build_benchmark_stage(output_dir, instance_count=instance_count)
+
+    # Keep the layer registry warm so every mode pays the same open cost
+    layer = Sdf.Layer.FindOrOpen(usd_path)
+
+    results = {
+        "traverse_per_extractor": _time_analyze(usd_path, indexed=False),
+        "single_pass": _time_analyze(usd_path, indexed=True),
+        "single_pass_load_none": _time_analyze(usd_path, indexed=True, load_payloads=False),
+    }
+    del layer
+
+    baseline = results["traverse_per_extractor"]
+    print("\n" + "=" * 60)
+    print(f"KB3DAnalyzer benchmark ({instance_count} instances)")
+    print("=" * 60)
+    for mode, seconds in results.items():
+        speedup = baseline / seconds if seconds else 0.0
+        print(f"  {mode:<26} {seconds:8.3f}s  x{speedup:.2f}")
+    print("=" * 60)
+
+    return results
+
+
+if __name__ == "__main__":
+    import sys
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    out_dir = sys.argv[2] if len(sys.argv) > 2 else None
+    run_benchmark(count, out_dir)
@@ -0,0 +1,155 @@
+"""
+Geometry Matcher
+
+Matches KB3D prototype names to extracted geometry folder names.
+
+Names are normalized once (asset prefix stripped, CamelCase and underscores
+split into lowercase tokens). Folders are indexed by token, so each prototype
+only scores the folders it shares a token with, ranked by IDF-weighted token
+overlap and refined with a sequence ratio on the normalized strings.
+
+Pure Python, no pxr/hou dependency.
+
+Usage:
+    from tools.kb3d_reverse_engineering.geometry_matcher import GeometryMatcher
+    matcher = GeometryMatcher(folder_names, asset_prefix="KB3D_MTM_BldgLgCommsArray_A")
+    match = matcher.match("KB3D_MTM_BldgLgCommsArray_A_AntennaDishLg")
+    if match:
+        print(match.folder, match.confidence)
+"""
+
+import heapq
+import math
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional, Tuple
+
+_WORD_SPLIT = re.compile(r"[^A-Za-z0-9]+")
+_CAMEL_TOKENS = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+")
+
+
+@dataclass(frozen=True)
+class GeometryMatch:
+    """Result of matching one name against the folder index"""
+    folder: str
+    confidence: float
+    method: str  # "exact" or "fuzzy"
+
+
+def tokenize_name(name: str) -> Tuple[str, ...]:
+    """Split a name on underscores/punctuation and CamelCase boundaries into lowercase tokens"""
+    tokens = []
+    for part in _WORD_SPLIT.split(name):
+        tokens.extend(t.lower() for t in _CAMEL_TOKENS.findall(part))
+    return tuple(tokens)
+
+
+def strip_prefix(name: str, prefix: str) -> str:
+    """Remove an asset prefix (and its separator) from the start of a name"""
+    if prefix and name.startswith(prefix):
+        stripped = name[len(prefix):].lstrip("_")
+        return stripped or name
+    return name
+
+
+class GeometryMatcher:
+    """Token inverted index over geometry folder names"""
+
+    def __init__(self, folder_names: List[str], asset_prefix: str = "",
+                 max_candidates: int = 4):
+        """
+        Args:
+            folder_names: Geometry folder names to match against
+            asset_prefix: Prefix stripped from both folder and query names
+            max_candidates: Number of top token-overlap candidates refined with
+                the sequence ratio per query
+        """
+        self.asset_prefix = asset_prefix
+        self.max_candidates = max_candidates
+
+        self._folders = list(folder_names)
+        self._keys = []
+        self._tokens = []
+        self._exact = {}
+        self._index = defaultdict(list)
+
+        for i, folder in enumerate(self._folders):
+            tokens = tokenize_name(strip_prefix(folder, asset_prefix))
+            key = "".join(tokens)
+            self._tokens.append(frozenset(tokens))
+            self._keys.append(key)
+            self._exact.setdefault(key, i)
+            for token in self._tokens[i]:
+                self._index[token].append(i)
+
+        count = max(len(self._folders), 1)
+        self._idf = {token: math.log(1.0 + count / len(ids)) for token, ids in self._index.items()}
+        # Tokens no folder has count as fully distinctive, so they lower the score
+        self._unseen_idf = math.log(1.0 + count)
+        self._weights = [sum(self._idf[t] for t in tokens) for tokens in self._tokens]
+        self._common_cutoff = max(32, count // 20)
+
+    def match(self, name: str, threshold: float = 0.5) -> Optional[GeometryMatch]:
+        """
+        Find the best folder for a name.
+
+        Args:
+            name: Prototype name (asset prefix is stripped automatically)
+            threshold: Minimum confidence (0-1) for a fuzzy match
+
+        Returns:
+            GeometryMatch, or None if nothing scores above the threshold
+        """
+        tokens = tokenize_name(strip_prefix(name, self.asset_prefix))
+        key = "".join(tokens)
+        if not key:
+            return None
+
+        exact = self._exact.get(key)
+        if exact is not None:
+            return GeometryMatch(self._folders[exact], 1.0, "exact")
+
+        query = frozenset(tokens)
+        known = sorted((t for t in query if t in self._index), key=lambda t: len(self._index[t]))
+        if not known:
+            return None
+
+        # Gather candidates from the rarest tokens; very common tokens ("a",
+        # "01", ...) only contribute when nothing rarer is shared
+        candidates = set()
+        for token in known:
+            postings = self._index[token]
+            if candidates and len(postings) > self._common_cutoff:
+                break
+            candidates.update(postings)
+
+        def overlap(i):
+            return sum(self._idf[t] for t in query & self._tokens[i])
+
+        query_weight = sum(self._idf.get(t, self._unseen_idf) for t in query)
+        sequence = SequenceMatcher(None, autojunk=False)
+        sequence.set_seq2(key)  # SequenceMatcher caches its analysis of seq2
+
+        best = None
+        best_score = 0.0
+        for i in heapq.nlargest(self.max_candidates, candidates, key=overlap):
+            token_score = 0.7 * 2.0 * overlap(i) / (query_weight + self._weights[i])
+            if token_score + 0.3 <= best_score:
+                continue
+            sequence.set_seq1(self._keys[i])
+            if token_score + 0.3 * sequence.quick_ratio() <= best_score:
+                continue
+            score = token_score + 0.3 * sequence.ratio()
+            if score > best_score:
+                best = i
+                best_score = score
+
+        if best is None or best_score < threshold:
+            return None
+        return GeometryMatch(self._folders[best], round(best_score, 4), "fuzzy")
+
+    def match_all(self, names: List[str], threshold: float = 0.5) -> Dict[str, Optional[GeometryMatch]]:
+        """Match several names, returning name -> GeometryMatch (or None)"""
+        return {name: self.match(name, threshold) for name in names}
@@ -9,15 +9,21 @@ Usage:
     analyzer = kb3d_usd_analyzer.KB3DAnalyzer("/path/to/asset.usd")
     mapping = analyzer.analyze()
     analyzer.save_mapping("/path/to/output.json")
+
+    # Large assemblies: skip payload loading, the structure lives in the root layer
+    mapping = analyzer.analyze(load_payloads=False)
 """
 
 import json
 import os
 import re
+import time
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
 
+from tools.kb3d_reverse_engineering.geometry_matcher import GeometryMatcher
+
 try:
     from pxr import Usd, UsdGeom, Sdf, UsdShade
     HAS_USD = True
@@ -53,6 +59,7 @@ class InternalPrototype:
     prim_path: str
     instances: List[Dict] = field(default_factory=list)
     geometry_source: str = ""  # Path to .bgeo.sc file
+    match_confidence: float = 0.0  # 1.0 for exact folder matches
 
 
 @dataclass
@@ -65,6 +72,95 @@ class AssetMapping:
     internal_prototypes: List[InternalPrototype] = field(default_factory=list)
     materials: List[str] = field(default_factory=list)
     texture_variants: List[str] = field(default_factory=list)
+    # Prototype -> geometry folder matches keyed by the geo dir and its mtime,
+    # reused by map_to_extracted_geometry() while the folder is unchanged
+    geometry_match_cache: Dict = field(default_factory=dict)
+
+
+@dataclass
+class StageIndex:
+    """Everything KB3DAnalyzer needs from a stage, gathered in a single traversal"""
+    texture_variants: List[str] = field(default_factory=list)
+    materials: List[str] = field(default_factory=list)
+    external_refs: List[Tuple["Usd.Prim", str]] = field(default_factory=list)
+    prototypes_path: Optional["Sdf.Path"] = None
+    prototypes: List["Usd.Prim"] = field(default_factory=list)
+    internal_refs: List[Tuple["Usd.Prim", str]] = field(default_factory=list)
+    prim_count: int = 0
+
+
+class StageIndexer:
+    """
+    Builds a StageIndex with one Usd.PrimRange pass over the stage.
+
+    Root layer references are read once up front by walking the layer's prim
+    specs, so the composed traversal only does a dict lookup per prim instead
+    of a GetPrimAtPath() call on the root layer. Subtrees that cannot hold
+    anything of interest (shader networks below a Material, children of gprims)
+    are pruned.
+    """
+
+    def __init__(self, stage):
+        self.stage = stage
+
+    def build(self) -> StageIndex:
+        index = StageIndex()
+        index.texture_variants = self._texture_variants()
+        layer_refs = self._index_root_layer_references()
+
+        seen_materials = set()
+        prim_range = iter(Usd.PrimRange.Stage(self.stage))
+        for prim in prim_range:
+            index.prim_count += 1
+            path = prim.GetPath()
+
+            if prim.IsA(UsdShade.Material):
+                name = prim.GetName()
+                if name not in seen_materials:
+                    seen_materials.add(name)
+                    index.materials.append(name)
+                prim_range.PruneChildren()
+                continue
+
+            if index.prototypes_path is None and prim.GetName() == "__prototypes__":
+                index.prototypes_path = path
+                index.prototypes = list(prim.GetChildren())
+
+            for ref in layer_refs.get(path, ()):
+                ref_path = ref.assetPath
+                # External reference has "../" or absolute path
+                if ref_path and ("../" in ref_path or ref_path.startswith("/")):
+                    if "__prototypes__" not in path.pathString:
+                        index.external_refs.append((prim, ref_path))
+                if ref.primPath:
+                    index.internal_refs.append((prim, str(ref.primPath)))
+
+            if prim.IsA(UsdGeom.Gprim):
+                prim_range.PruneChildren()
+
+        return index
+
+    def _texture_variants(self) -> List[str]:
+        default_prim = self.stage.GetDefaultPrim()
+        if not default_prim:
+            return []
+
+        variant_sets = default_prim.GetVariantSets()
+        if variant_sets.HasVariantSet("texture_variant"):
+            return list(variant_sets.GetVariantSet("texture_variant").GetVariantNames())
+        return []
+
+    def _index_root_layer_references(self) -> Dict["Sdf.Path", list]:
+        """Map prim path -> prepended reference items authored on the root layer"""
+        refs = {}
+        stack = list(self.stage.GetRootLayer().rootPrims)
+        while stack:
+            spec = stack.pop()
+            items = spec.referenceList.prependedItems
+            if items:
+                refs[spec.path] = list(items)
+            stack.extend(spec.nameChildren)
+        return refs
 
 
 class KB3DAnalyzer:
@@ -89,20 +185,39 @@ class KB3DAnalyzer:
 
         self.stage = None
         self.mapping = None
+        self.timings = {}
 
-    def analyze(self) -> AssetMapping:
+    def analyze(self, load_payloads: bool = True, indexed: bool = True,
+                stage_cache=None) -> AssetMapping:
         """
         Analyze the USD file and extract component structure.
 
+        Args:
+            load_payloads: Load payloads when opening the stage. The component
+                structure is authored in the root layer, so False (LoadNone)
+                is usually enough and much faster on large assemblies.
+            indexed: Gather everything in a single traversal (StageIndexer).
+                False runs the original per-extractor traversals.
+            stage_cache: Optional Usd.StageCache to open the stage through, so
+                repeated analyses in one process reuse composed stages.
+
         Returns:
             AssetMapping object containing all extracted data
         """
         print(f"Analyzing USD file: {self.usd_file_path}")
 
         # Open USD stage
-        self.stage = Usd.Stage.Open(self.usd_file_path)
+        load_set = Usd.Stage.LoadAll if load_payloads else Usd.Stage.LoadNone
+        start = time.perf_counter()
+        if stage_cache is not None:
+            with Usd.StageCacheContext(stage_cache):
+                self.stage = Usd.Stage.Open(self.usd_file_path, load_set)
+        else:
+            self.stage = Usd.Stage.Open(self.usd_file_path, load_set)
+        self.timings["open"] = time.perf_counter() - start
         if not self.stage:
             raise RuntimeError(f"Failed to open USD stage: {self.usd_file_path}")
+        start = time.perf_counter()
 
         # Initialize mapping
         default_prim = self.stage.GetDefaultPrim()
@@ -113,10 +228,15 @@ class KB3DAnalyzer:
         )
 
         # Extract data
-        self._extract_texture_variants()
-        self._extract_materials()
-        self._extract_external_references()
-        self._extract_internal_prototypes()
+        if indexed:
+            self._extract_from_index(StageIndexer(self.stage).build())
+        else:
+            self._extract_texture_variants()
+            self._extract_materials()
+            self._extract_external_references()
+            self._extract_internal_prototypes()
+
+        self.timings["analyze"] = time.perf_counter() - start
 
         print(f"Analysis complete:")
         print(f"  - External props: {len(self.mapping.external_props)}")
@@ -126,6 +246,58 @@ class KB3DAnalyzer:
 
         return self.mapping
 
+    def _extract_from_index(self, index: StageIndex):
+        """Populate the mapping from a single-pass StageIndex"""
+        self.mapping.texture_variants = index.texture_variants
+        if index.texture_variants:
+            print(f"  Found texture variants: {', '.join(index.texture_variants)}")
+
+        self.mapping.materials = index.materials
+        print(f"  Found {len(self.mapping.materials)} materials")
+
+        for prim, ref_path in index.external_refs:
+            self.mapping.external_props.append(ExternalReference(
+                instance_name=prim.GetName(),
+                ref_path=ref_path,
+                kind=prim.GetMetadata("kind") or "",
+                instanceable=prim.IsInstanceable(),
+                transform=self._extract_transform(prim),
+                prim_path=prim.GetPath().pathString
+            ))
+        print(f"  Found {len(self.mapping.external_props)} external prop references")
+
+        if not index.prototypes_path:
+            print("  No __prototypes__ scope found, checking for class definitions...")
+            return
+
+        prototype_map = {}
+        for child in index.prototypes:
+            proto_path = child.GetPath().pathString
+            prototype = InternalPrototype(
+                prototype_name=child.GetName(),
+                prim_path=proto_path,
+                instances=[]
+            )
+            prototype_map[proto_path] = prototype
+            self.mapping.internal_prototypes.append(prototype)
+
+        print(f"  Found {len(prototype_map)} internal prototype definitions")
+
+        for prim, proto_ref in index.internal_refs:
+            if proto_ref not in prototype_map:
+                continue
+            if index.prototypes_path.IsPrefixOf(prim.GetPath()):
+                continue
+            prototype_map[proto_ref].instances.append({
+                "instance_name": prim.GetName(),
+                "prim_path": prim.GetPath().pathString,
+                "transform": asdict(self._extract_transform(prim)),
+                "instanceable": prim.IsInstanceable()
+            })
+
+        for proto in self.mapping.internal_prototypes:
+            print(f"    - {proto.prototype_name}: {len(proto.instances)} instances")
+
     def _extract_texture_variants(self):
         """Extract texture variant names from variant sets"""
         default_prim = self.stage.GetDefaultPrim()
@@ -270,12 +442,17 @@ class KB3DAnalyzer:
             xform_op_order=xform_op_order
         )
 
-    def map_to_extracted_geometry(self, extracted_geo_dir: str):
+    def map_to_extracted_geometry(self, extracted_geo_dir: str, threshold: float = 0.5):
         """
         Map prototype names to extracted geometry folders.
 
+        Names are matched with GeometryMatcher (exact first, then token-indexed
+        fuzzy matching). Matches are stored in the mapping's
+        geometry_match_cache and reused while the directory is unchanged.
+
         Args:
             extracted_geo_dir: Path to kb3d_clone/geo/{asset_name}/ directory
+            threshold: Minimum confidence (0-1) for a fuzzy match
         """
         if not self.mapping:
             raise RuntimeError("Must run analyze() first")
@@ -284,50 +461,60 @@ class KB3DAnalyzer:
             print(f"Warning: Extracted geometry directory not found: {extracted_geo_dir}")
             return
 
-        # List available geometry folders
-        geo_folders = [f for f in os.listdir(extracted_geo_dir)
-                       if os.path.isdir(os.path.join(extracted_geo_dir, f))]
+        geo_dir = os.path.abspath(extracted_geo_dir)
+        geo_dir_mtime = os.stat(geo_dir).st_mtime
+        proto_names = [proto.prototype_name for proto in self.mapping.internal_prototypes]
+
+        cache = self.mapping.geometry_match_cache
+        matches = cache.get("matches", {})
+        cache_valid = (
+            cache.get("geo_dir") == geo_dir
+            and cache.get("geo_dir_mtime") == geo_dir_mtime
+            and cache.get("threshold") == threshold
+            and all(name in matches for name in proto_names)
+        )
 
         print(f"\nMapping prototypes to extracted geometry...")
-        print(f"  Available geometry folders: {len(geo_folders)}")
+        if cache_valid:
+            print(f"  Using cached matches for {geo_dir}")
+        else:
+            with os.scandir(geo_dir) as entries:
+                geo_folders = [entry.name for entry in entries if entry.is_dir()]
+            print(f"  Available geometry folders: {len(geo_folders)}")
 
-        # Map each prototype to a geometry folder
-        for proto in self.mapping.internal_prototypes:
-            # Try to match prototype name to folder name
             # Prototype names often have prefixes like "KB3D_MTM_BldgLgCommsArray_A_"
-            proto_basename = proto.prototype_name
-
-            # Remove asset prefix
-            if proto_basename.startswith(self.asset_name + "_"):
-                proto_basename = proto_basename[len(self.asset_name) + 1:]
-
-            # Try exact match first
-            if proto_basename in geo_folders:
-                bgeo_path = os.path.join(extracted_geo_dir, proto_basename, f"{proto_basename}.bgeo.sc")
-                if os.path.exists(bgeo_path):
-                    proto.geometry_source = bgeo_path
-                    print(f"    ✓ Mapped {proto.prototype_name} → {proto_basename}")
-                    continue
-
-            # Try fuzzy matching
-            best_match = None
-            best_score = 0
-            for folder in geo_folders:
-                # Simple similarity: count matching characters
-                similarity = sum(1 for a, b in zip(proto_basename.lower(), folder.lower()) if a == b)
-                if similarity > best_score:
-                    best_score = similarity
-                    best_match = folder
-
-            if best_match and best_score > len(proto_basename) * 0.5:
-                bgeo_path = os.path.join(extracted_geo_dir, best_match, f"{best_match}.bgeo.sc")
-                if os.path.exists(bgeo_path):
-                    proto.geometry_source = bgeo_path
-                    print(f"    ~ Fuzzy matched {proto.prototype_name} → {best_match} (score: {best_score})")
-                else:
-                    print(f"    ✗ No match for {proto.prototype_name}")
-            else:
+            matcher = GeometryMatcher(geo_folders, asset_prefix=self.asset_name)
+            matches = {}
+            for name in proto_names:
+                match = matcher.match(name, threshold)
+                matches[name] = asdict(match) if match else None
+
+            self.mapping.geometry_match_cache = {
+                "geo_dir": geo_dir,
+                "geo_dir_mtime": geo_dir_mtime,
+                "threshold": threshold,
+                "matches": matches,
+            }
+
+        for proto in self.mapping.internal_prototypes:
+            match = matches.get(proto.prototype_name)
+            if not match:
                 print(f"    ✗ No match for {proto.prototype_name}")
+                continue
+
+            folder = match["folder"]
+            bgeo_path = os.path.join(geo_dir, folder, f"{folder}.bgeo.sc")
+            if not os.path.exists(bgeo_path):
+                print(f"    ✗ No match for {proto.prototype_name}")
+                continue
+
+            proto.geometry_source = bgeo_path
+            proto.match_confidence = match["confidence"]
+            if match["method"] == "exact":
+                print(f"    ✓ Mapped {proto.prototype_name} → {folder}")
+            else:
+                print(f"    ~ Fuzzy matched {proto.prototype_name} → {folder} "
+                      f"(confidence: {match['confidence']:.2f})")
 
     def save_mapping(self, output_path: str):
         """
@@ -353,12 +540,20 @@ class KB3DAnalyzer:
         with open(json_path, 'r') as f:
             data = json.load(f)
 
-        # Reconstruct dataclass (simplified, may need refinement)
+        # Reconstruct nested dataclasses
+        data["external_props"] = [
+            ExternalReference(**{**ref, "transform": Transform(**ref["transform"])})
+            for ref in data.get("external_props", [])
+        ]
+        data["internal_prototypes"] = [
+            InternalPrototype(**proto) for proto in data.get("internal_prototypes", [])
+        ]
         self.mapping = AssetMapping(**data)
         return self.mapping
 
 
-def analyze_asset(usd_path: str, extracted_geo_dir: str = None, output_json: str = None):
+def analyze_asset(usd_path: str, extracted_geo_dir: str = None, output_json: str = None,
+                  load_payloads: bool = True):
     """
     Convenience function to analyze a single asset.
 
@@ -366,12 +561,13 @@ def analyze_asset(usd_path: str, extracted_geo_dir: str = None, output_json: str
         usd_path: Path to main USD file
         extracted_geo_dir: Optional path to extracted geometry directory
         output_json: Optional path to save JSON mapping
+        load_payloads: Load payloads when opening the stage
 
     Returns:
         AssetMapping object
     """
     analyzer = KB3DAnalyzer(usd_path)
-    mapping = analyzer.analyze()
+    mapping = analyzer.analyze(load_payloads=load_payloads)
 
     if extracted_geo_dir:
         analyzer.map_to_extracted_geometry(extracted_geo_dir)
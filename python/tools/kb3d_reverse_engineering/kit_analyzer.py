@@ -0,0 +1,246 @@
+"""
+KB3D Kit Analyzer
+
+Runs KB3DAnalyzer over every asset in a KitBash3D kit folder in parallel.
+
+Each worker process opens stages with payloads unloaded through its own
+Usd.StageCache and erases each asset's stage once it is analyzed, so a worker
+never holds more than one composed stage. Layers used by more than one asset
+(shared material or prop layers of the kit) are kept open, so they are read
+at most twice per worker. Results are streamed to a single JSONL file as assets finish,
+one line per asset, with per-file layer open, compose and analysis times.
+
+Usage:
+    from tools.kb3d_reverse_engineering import kit_analyzer
+    summary = kit_analyzer.analyze_kit(
+        "/path/to/KB3D_MissionToMinerva",
+        "/path/to/mtm_mapping.jsonl",
+        jobs=8
+    )
+
+    or from a shell with pxr available:
+    python -m tools.kb3d_reverse_engineering.kit_analyzer <kit_folder> <output.jsonl> [jobs]
+"""
+
+import contextlib
+import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict
+from typing import Dict, List, Optional
+
+try:
+    from pxr import Sdf, Usd
+    HAS_USD = True
+except ImportError:
+    HAS_USD = False
+
+from tools.kb3d_reverse_engineering.kb3d_usd_analyzer import KB3DAnalyzer
+
+USD_EXTENSIONS = ('.usd', '.usda', '.usdc')
+
+# One stage cache per worker process; holds only the stage being analyzed
+_STAGE_CACHE = None
+
+# Per worker: layer identifier -> number of assets that used it, and the
+# layers used by more than one asset, kept open for the next assets
+_LAYER_USES: Dict[str, int] = {}
+_SHARED_LAYERS: Dict[str, "Sdf.Layer"] = {}
+
+
+def _retain_shared_layers(stage):
+    """Keep the layers of a stage that other assets used too (not its root or session layer)"""
+    own = {stage.GetRootLayer().identifier, stage.GetSessionLayer().identifier}
+    for layer in stage.GetUsedLayers():
+        identifier = layer.identifier
+        if identifier in own or identifier in _SHARED_LAYERS:
+            continue
+        uses = _LAYER_USES.get(identifier, 0) + 1
+        _LAYER_USES[identifier] = uses
+        if uses > 1:
+            _SHARED_LAYERS[identifier] = layer
+
+
+def discover_kit_assets(kit_folder: str) -> List[str]:
+    """
+    Find the main USD file of every asset in a kit.
+
+    An asset is a subfolder containing a USD file named after the folder
+    (e.g. KB3D_MTM_BldgLg_A/KB3D_MTM_BldgLg_A.usd). USD files directly in the
+    kit folder are treated as assets too.
+
+    Args:
+        kit_folder: Root folder of the kit
+
+    Returns:
+        Sorted list of USD file paths
+    """
+    assets = []
+    with os.scandir(kit_folder) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.lower().endswith(USD_EXTENSIONS):
+                assets.append(entry.path)
+            elif entry.is_dir():
+                with os.scandir(entry.path) as children:
+                    names = {child.name for child in children if child.is_file()}
+                for ext in USD_EXTENSIONS:
+                    if f"{entry.name}{ext}" in names:
+                        assets.append(os.path.join(entry.path, f"{entry.name}{ext}"))
+                        break
+    return sorted(assets)
+
+
+def _analyze_in_worker(usd_path: str, extracted_geo_root: Optional[str] = None,
+                       load_payloads: bool = False, verbose: bool = False) -> Dict:
+    """Analyze one asset; runs inside a worker process and returns a JSON-ready record"""
+    global _STAGE_CACHE
+    if _STAGE_CACHE is None:
+        _STAGE_CACHE = Usd.StageCache()
+
+    record = {
+        "usd_path": usd_path,
+        "asset_name": os.path.splitext(os.path.basename(usd_path))[0],
+        "pid": os.getpid(),
+        "success": False,
+    }
+
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output) if not verbose else contextlib.nullcontext():
+            start = time.perf_counter()
+            layer = Sdf.Layer.FindOrOpen(usd_path)
+            layer_open = time.perf_counter() - start
+
+            analyzer = KB3DAnalyzer(usd_path)
+            try:
+                mapping = analyzer.analyze(load_payloads=load_payloads, stage_cache=_STAGE_CACHE)
+
+                if extracted_geo_root:
+                    geo_dir = os.path.join(extracted_geo_root, analyzer.asset_name)
+                    if os.path.isdir(geo_dir):
+                        analyzer.map_to_extracted_geometry(geo_dir)
+            finally:
+                # Every asset is opened once: drop its composed stage, keep only shared layers
+                if analyzer.stage:
+                    _retain_shared_layers(analyzer.stage)
+                    _STAGE_CACHE.Erase(analyzer.stage)
+                    analyzer.stage = None
+            del layer
+
+        record.update({
+            "success": True,
+            "timings": {
+                "layer_open": round(layer_open, 6),
+                "compose": round(analyzer.timings.get("open", 0.0), 6),
+                "analyze": round(analyzer.timings.get("analyze", 0.0), 6),
+            },
+            "mapping": asdict(mapping),
+        })
+    except Exception as e:
+        record["error"] = str(e)
+
+    return record
+
+
+def analyze_kit(
+    kit_folder: str,
+    output_jsonl: str,
+    jobs: Optional[int] = None,
+    extracted_geo_root: Optional[str] = None,
+    load_payloads: bool = False,
+    verbose: bool = False
+) -> Dict:
+    """
+    Analyze every asset of a kit in parallel and stream results to JSONL.
+
+    Args:
+        kit_folder: Root folder of the kit
+        output_jsonl: Output JSONL path, one asset record per line
+        jobs: Number of worker processes (default: CPU count). 1 runs in-process.
+        extracted_geo_root: Optional kb3d_clone/geo/ root; assets with a
+            matching subfolder are mapped to their extracted geometry
+        load_payloads: Load payloads when opening stages (default False)
+        verbose: Print each analyzer's own output
+
+    Returns:
+        Summary dict with counts and the slowest assets by compose time
+    """
+    if not HAS_USD:
+        raise ImportError("USD libraries (pxr) not available")
+
+    usd_files = discover_kit_assets(kit_folder)
+    print(f"Analyzing {len(usd_files)} assets in {kit_folder}")
+
+    start = time.perf_counter()
+    timings = []
+    failed = []
+
+    def _write(handle, record):
+        handle.write(json.dumps(record) + "\n")
+        handle.flush()
+        status = "✓" if record["success"] else "✗"
+        if record["success"]:
+            t = record["timings"]
+            timings.append((t["layer_open"] + t["compose"], record["asset_name"]))
+            print(f"  {status} {record['asset_name']}: open {t['layer_open']:.3f}s, "
+                  f"compose {t['compose']:.3f}s, analyze {t['analyze']:.3f}s")
+        else:
+            failed.append(record["asset_name"])
+            print(f"  {status} {record['asset_name']}: {record['error']}")
+
+    with open(output_jsonl, 'w') as handle:
+        if jobs == 1:
+            for usd_path in usd_files:
+                _write(handle, _analyze_in_worker(usd_path, extracted_geo_root, load_payloads, verbose))
+        else:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                futures = {
+                    executor.submit(_analyze_in_worker, usd_path, extracted_geo_root,
+                                    load_payloads, verbose): usd_path
+                    for usd_path in usd_files
+                }
+                for future in as_completed(futures):
+                    try:
+                        record = future.result()
+                    except Exception as e:
+                        usd_path = futures[future]
+                        record = {
+                            "usd_path": usd_path,
+                            "asset_name": os.path.splitext(os.path.basename(usd_path))[0],
+                            "success": False,
+                            "error": str(e),
+                        }
+                    _write(handle, record)
+
+    timings.sort(reverse=True)
+    summary = {
+        "kit_folder": kit_folder,
+        "output": output_jsonl,
+        "total": len(usd_files),
+        "succeeded": len(usd_files) - len(failed),
+        "failed": failed,
+        "duration": time.perf_counter() - start,
+        "slowest": [{"asset_name": name, "open_compose": round(t, 6)} for t, name in timings[:10]],
+    }
+
+    print(f"\nKit analysis complete in {summary['duration']:.2f}s: "
+          f"{summary['succeeded']}/{summary['total']} assets")
+    if summary["slowest"]:
+        print("  Most expensive to open/compose:")
+        for entry in summary["slowest"]:
+            print(f"    {entry['open_compose']:.3f}s  {entry['asset_name']}")
+    print(f"  Mapping written to: {output_jsonl}")
+
+    return summary
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 3:
+        print("Usage: python -m tools.kb3d_reverse_engineering.kit_analyzer <kit_folder> <output.jsonl> [jobs]")
+        sys.exit(1)
+
+    analyze_kit(sys.argv[1], sys.argv[2], jobs=int(sys.argv[3]) if len(sys.argv) > 3 else None)
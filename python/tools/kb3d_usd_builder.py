@@ -33,10 +33,12 @@ Usage:
 
 import hou
 import os
-from typing import List, Dict, Optional, Tuple
+from typing import List, Optional, Tuple
 
+from modules.parts_scanner import PartRecord, USD_GEO_CANDIDATES, scan_parts
 
-def scan_parts_folder(parts_folder: str) -> List[Dict[str, str]]:
+
+def scan_parts_folder(parts_folder: str) -> List[PartRecord]:
     """
     Scan folder for exported USD parts.
 
@@ -44,40 +46,9 @@ def scan_parts_folder(parts_folder: str) -> List[Dict[str, str]]:
         parts_folder: Path containing part subfolders (Wings, Cargo, Main, etc.)
 
     Returns:
-        List of dicts with part info
+        List of PartRecord
     """
-    parts = []
-
-    if not os.path.isdir(parts_folder):
-        return parts
-
-    for item in os.listdir(parts_folder):
-        item_path = os.path.join(parts_folder, item)
-
-        if not os.path.isdir(item_path):
-            continue
-
-        # Look for geo files
-        geo_candidates = [
-            os.path.join(item_path, 'geo.usd'),
-            os.path.join(item_path, 'geo.usda'),
-            os.path.join(item_path, f'{item}.usd'),
-        ]
-
-        geo_file = None
-        for candidate in geo_candidates:
-            if os.path.exists(candidate):
-                geo_file = candidate
-                break
-
-        if geo_file:
-            parts.append({
-                'name': item,
-                'path': item_path,
-                'geo': geo_file
-            })
-
-    return parts
+    return scan_parts(parts_folder, geo_candidates=USD_GEO_CANDIDATES)
 
 
 def create_centered_geo_usd(
@@ -107,7 +78,7 @@ def create_centered_geo_usd(
     if not parts:
         raise ValueError(f"No parts found in {parts_folder}")
 
-    print(f"Found {len(parts)} parts: {[p['name'] for p in parts]}")
+    print(f"Found {len(parts)} parts: {[p.name for p in parts]}")
     mode_str = "preserving transforms" if preserve_transforms else "centered with matchsize"
     print(f"Processing mode: {mode_str}")
 
@@ -120,17 +91,17 @@ def create_centered_geo_usd(
     merge_inputs = []
 
     for part in parts:
-        print(f"Processing part: {part['name']}")
+        print(f"Processing part: {part.name}")
 
         # Import USD
-        usd_import = sop_geo.createNode('file', f"import_{part['name']}")
-        usd_import.parm('file').set(part['geo'])
+        usd_import = sop_geo.createNode('file', f"import_{part.name}")
+        usd_import.parm('file').set(part.geo_file)
 
         last_node = usd_import
 
         # Apply matchsize ONLY if not preserving transforms
         if not preserve_transforms:
-            matchsize = sop_geo.createNode('matchsize', f"matchsize_{part['name']}")
+            matchsize = sop_geo.createNode('matchsize', f"matchsize_{part.name}")
             matchsize.setInput(0, last_node)
             matchsize.parm('scale').set(match_size)
             matchsize.parm('justify').set(1)  # Center
@@ -140,12 +111,12 @@ def create_centered_geo_usd(
             last_node = matchsize
 
         # Add part name attribute
-        attribcreate = sop_geo.createNode('attribcreate', f"partname_{part['name']}")
+        attribcreate = sop_geo.createNode('attribcreate', f"partname_{part.name}")
         attribcreate.setInput(0, last_node)
         attribcreate.parm('name1').set('kb3d_part')
         attribcreate.parm('class1').set(1)  # Primitive
         attribcreate.parm('type1').set(3)  # String
-        attribcreate.parm('string1').set(part['name'])
+        attribcreate.parm('string1').set(part.name)
 
         merge_inputs.append(attribcreate)
 
@@ -384,18 +355,18 @@ def build_individual_part_assets(
     print(f"Parts folder: {parts_folder}")
     print(f"Output base: {output_base_folder}")
     print(f"Match size: {match_size}")
-    print(f"Found {len(parts)} parts: {[p['name'] for p in parts]}")
+    print(f"Found {len(parts)} parts: {[p.name for p in parts]}")
     print()
 
     for part in parts:
-        part_name = part['name']
+        part_name = part.name
         part_output_folder = os.path.join(output_base_folder, part_name)
 
         print(f"Building part: {part_name}")
 
         # Create single-part folder with just this part
         # We'll pass a temporary folder with just this one part
-        single_part_folder = part['path']
+        single_part_folder = part.folder
 
         try:
             # Build USD asset for this single part with centered matchsize
@@ -8,9 +8,23 @@ Available interfaces:
 - GUI: create_component_builder() - Interactive dialog-based interface
 - GUI: show_batch_asset_builder() - Batch Asset Builder UI (formerly asset_config_generator)
 - CLI: lops_asset_builder_cli module - Command-line/pipeline interface
+- build_planner module - Houdini-free validation and build plans for config batches
 """
 
-from .lops_asset_builder_v3 import create_component_builder
-from .batch_asset_builder import show_batch_asset_builder
+import importlib
+
+# The GUI entry points are imported on first use, so the Houdini-free modules
+# of the package (build_planner, ...) can be imported outside Houdini
+_LAZY_EXPORTS = {
+    'create_component_builder': 'lops_asset_builder_v3',
+    'show_batch_asset_builder': 'batch_asset_builder',
+}
 
 __all__ = ['create_component_builder', 'show_batch_asset_builder']
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{module_name}", __name__), name)
@@ -22,6 +22,11 @@ import os
 
 from PySide6 import QtWidgets, QtCore, QtGui
 
+from tools.lops_asset_builder_v3.progress_events import (
+    ProgressBus, ProgressEvent, PhaseProgress, RateLimiter, describe,
+    PHASE_START, PHASE_END, MATERIAL_CREATED, COUNTER, LOG,
+)
+
 # Keep strong references to active progress reporters to prevent dialogs
 # from being garbage-collected (and auto-closing) when build functions return.
 _LIVE_REPORTERS: list["ProgressReporter"] = []
@@ -412,6 +417,10 @@ class SimpleProgressDialog(QtWidgets.QDialog):
         # Escalated kill support
         self._esc_presses = 0
         self.force_kill = False
+        # Repaints / processEvents are coalesced to a fixed rate and log lines
+        # are appended to the QTextEdit in chunks
+        self._refresh = RateLimiter()
+        self._log_buffer: list[str] = []
 
     def _on_kill(self):
         # Increment ESC press count and escalate actions
@@ -419,22 +428,23 @@ class SimpleProgressDialog(QtWidgets.QDialog):
         if self._esc_presses == 1:
             # Soft cancel: let the builder stop gracefully
             self.cancelled = True
-            self.log_edit.append("User requested cancel (ESC). Stopping after current step…")
+            self._log_buffer.append("User requested cancel (ESC). Stopping after current step…")
         elif self._esc_presses == 2:
             # Force kill requested: try to abort ASAP
             self.cancelled = True
             self.force_kill = True
-            self.log_edit.append("User requested FORCE KILL (ESC x2). Attempting immediate abort… Press ESC again to exit application.")
+            self._log_buffer.append("User requested FORCE KILL (ESC x2). Attempting immediate abort… Press ESC again to exit application.")
         else:
             # Third time: exit the application event loop (last resort)
             self.cancelled = True
             self.force_kill = True
-            self.log_edit.append("ESC pressed 3 times — exiting application event loop now.")
+            self._log_buffer.append("ESC pressed 3 times — exiting application event loop now.")
+            self._flush_log()
             try:
                 QtCore.QCoreApplication.exit(1)
             except Exception:
                 pass
-        QtWidgets.QApplication.processEvents()
+        self.pump(force=True)
 
     def keyPressEvent(self, event: QtGui.QKeyEvent) -> None:
         # Use ESC to kill the process instead of buttons
@@ -450,21 +460,33 @@ class SimpleProgressDialog(QtWidgets.QDialog):
 
     def set_value(self, value: int):
         self.progress_bar.setValue(max(0, min(int(value), self._max)))
-        QtWidgets.QApplication.processEvents()
+        self.pump()
 
     def set_message(self, msg: str):
         self.message_label.setText(msg)
-        QtWidgets.QApplication.processEvents()
+        self.pump()
 
     def log(self, msg: str):
-        self.log_edit.append(msg)
+        self._log_buffer.append(msg)
+        self.pump()
+
+    def pump(self, force: bool = False):
+        """Flush buffered log lines and process Qt events, at most UI_REFRESH_HZ times a second."""
+        if force or self._refresh.ready():
+            self._flush_log()
+            QtWidgets.QApplication.processEvents()
+
+    def _flush_log(self):
+        if not self._log_buffer:
+            return
+        self.log_edit.append("\n".join(self._log_buffer))
+        self._log_buffer = []
         # Auto-scroll to bottom to keep the latest log visible
         try:
             self.log_edit.moveCursor(QtGui.QTextCursor.End)
         except Exception:
             # Fallback: ensure cursor visible without hard dependency
             self.log_edit.ensureCursorVisible()
-        QtWidgets.QApplication.processEvents()
 
     def mark_finished(self):
         self.finished = True
@@ -475,16 +497,20 @@ class SimpleProgressDialog(QtWidgets.QDialog):
         except Exception:
             pass
         self.message_label.setText("Finished.")
-        QtWidgets.QApplication.processEvents()
+        self.pump(force=True)
 
 
 class ProgressReporter:
-    def __init__(self, title="LOPs Asset Builder v3"):
+    def __init__(self, title="LOPs Asset Builder v3", bus: ProgressBus | None = None):
         self._use_qt = False
         self._step = 0
         self._total = 100
         self._dialog = None
         self._cancelled = False
+        self._phase = PhaseProgress()
+        # Builders publish typed events here (see progress_events)
+        self.events = bus or ProgressBus()
+        self.events.subscribe(self._on_event)
         try:
             app = QtWidgets.QApplication.instance()
             if app is not None:
@@ -530,6 +556,24 @@ class ProgressReporter:
         else:
             print(message)
 
+    def _on_event(self, event: ProgressEvent):
+        if event.kind == PHASE_START:
+            self._phase.start(self._step, event, self._total)
+        elif event.kind in (MATERIAL_CREATED, COUNTER):
+            self._step = max(self._step, self._phase.value(event))
+        elif event.kind == PHASE_END:
+            self._step = max(self._step, self._phase.end())
+
+        message = describe(event)
+        if self._use_qt:
+            if message:
+                if event.kind != LOG:
+                    self._dialog.set_message(message)
+                self._dialog.log(message)
+            self._dialog.set_value(self._step)
+        elif message:
+            print(f"[Progress] {self._step}/{self._total}: {message}" if event.kind != LOG else message)
+
     def request_cancel(self):
         self._cancelled = True
 
@@ -537,7 +581,7 @@ class ProgressReporter:
         if self._use_qt:
             # Pump the Qt event loop so button clicks (Kill Process) are handled while heavy work runs
             try:
-                QtWidgets.QApplication.processEvents(QtCore.QEventLoop.AllEvents, 50)
+                self._dialog.pump()
             except Exception:
                 pass
             if self._dialog is not None:
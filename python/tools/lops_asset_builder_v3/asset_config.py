@@ -0,0 +1,173 @@
+"""
+Asset build configuration for LOPS Asset Builder v3.
+
+AssetBuilderConfig is the config the CLI, the batch builder and the build
+planner share, and collect_config_files / load_config_items find and load
+config JSON files. The module has no Houdini imports, so configs can be
+loaded and checked on machines without Houdini (see build_planner).
+"""
+
+from __future__ import annotations
+import os
+import sys
+import json
+import glob
+from typing import Dict, List, Any, Optional
+from dataclasses import dataclass, field, asdict
+
+
+@dataclass
+class AssetBuilderConfig:
+    """Configuration for LOPS Asset Builder command-line execution.
+
+    Required fields:
+        main_asset_file_path: Path to main geometry file
+        folder_textures: Path to texture folder
+
+    Optional fields with defaults:
+        asset_name: Asset name (auto-derived from file if not provided)
+        asset_variants: List of additional geometry variant file paths
+        asset_vset_name: Geometry variant set name
+        mtl_variants: List of material variant folder paths
+        mtl_vset_name: Material variant set name
+        create_lookdev: Enable lookdev setup
+        create_light_rig: Enable light rig creation
+        enable_env_lights: Enable environment lights
+        env_light_paths: List of HDRI paths for environment lights
+        create_network_boxes: Create network boxes around node groups (default: False)
+        skip_matchsize: Skip matchsize node creation in component geometry (default: False)
+        stage_context_path: Path to stage node (default: /stage)
+        verbose: Print detailed progress logs
+        layout_grid_threshold: Grid-layout material libraries with at least this many materials (default: None)
+        texture_variants_only: Build shader networks once and author mtl_variants as texture path
+            overrides in a per-material variant set (default: False)
+        texture_vset_name: Variant set name for texture_variants_only (default: texture_variant)
+        publish_only: Build in a throwaway LOP network, save the component USD to disk and
+            destroy the network; no lookdev, layout or notes (default: False)
+        publish_dir: Folder for publish_only output, one <asset> subfolder each (default: $HIP/usd/assets)
+        profile: Record per-phase wall time, HOM calls and created nodes in BuildResult.profile (default: False)
+    """
+    # Required
+    main_asset_file_path: str
+    folder_textures: str
+
+    # Optional with defaults (all bool options default to False)
+    asset_name: str = ""
+    asset_variants: List[str] = field(default_factory=list)
+    create_geo_variants: bool = True
+    asset_vset_name: str = "geo_variant"
+    mtl_variants: List[str] = field(default_factory=list)
+    mtl_vset_name: str = "mtl_variant"
+    create_lookdev: bool = False
+    create_light_rig: bool = False
+    enable_env_lights: bool = False
+    env_light_paths: List[str] = field(default_factory=list)
+    create_network_boxes: bool = False
+    skip_matchsize: bool = False
+    stage_context_path: str = "/stage"
+    verbose: bool = True
+    lowercase_material_names: bool = False  # Default to False to preserve FBX naming
+    use_custom_component_output: bool = True
+    layout_grid_threshold: Optional[int] = None  # Grid-layout material libraries with at least this many materials
+    texture_variants_only: bool = False  # Build shaders once; mtl_variants only override texture paths
+    texture_vset_name: str = "texture_variant"
+    publish_only: bool = False  # Only write the component USD; leave nothing in the scene
+    publish_dir: str = ""
+    profile: bool = False  # Per-phase profile (see build_profiler); adds a small cost per HOM call
+
+    def __post_init__(self):
+        """Auto-derive asset name if not provided and validate paths."""
+        if not self.asset_name:
+            self.asset_name = self._derive_asset_name(self.main_asset_file_path)
+
+        # Validate required paths
+        if not os.path.isfile(self.main_asset_file_path):
+            raise ValueError(f"Main asset file does not exist: {self.main_asset_file_path}")
+        if not os.path.isdir(self.folder_textures):
+            raise ValueError(f"Texture folder does not exist: {self.folder_textures}")
+
+    @staticmethod
+    def _derive_asset_name(path: str) -> str:
+        """Derive asset name from file path."""
+        base = os.path.basename(path) if path else ""
+        if not base:
+            return "ASSET"
+        # Strip .bgeo.sc specially, otherwise strip last extension
+        if base.endswith(".bgeo.sc"):
+            base = base[:-len(".bgeo.sc")]
+        else:
+            if "." in base:
+                base = base.split(".")[0]
+        return base or "ASSET"
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AssetBuilderConfig":
+        """Create config from dictionary."""
+        # Filter only known fields
+        valid_fields = {f.name for f in cls.__dataclass_fields__.values()}
+        filtered = {k: v for k, v in data.items() if k in valid_fields}
+        return cls(**filtered)
+
+    @classmethod
+    def from_json_file(cls, filepath: str) -> "AssetBuilderConfig":
+        """Load config from JSON file."""
+        with open(filepath, 'r') as f:
+            data = json.load(f)
+        return cls.from_dict(data)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert config to dictionary."""
+        return asdict(self)
+
+    def to_json_file(self, filepath: str):
+        """Save config to JSON file."""
+        with open(filepath, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+
+def collect_config_files(inputs: List[str]) -> List[str]:
+    """
+    Expand command-line inputs into config JSON files.
+
+    Args:
+        inputs: JSON files, directories (their *.json files) or glob patterns
+
+    Returns:
+        Sorted unique list of config file paths
+    """
+    files = []
+    for item in inputs:
+        if os.path.isdir(item):
+            files.extend(glob.glob(os.path.join(item, "*.json")))
+        elif glob.has_magic(item):
+            files.extend(f for f in glob.glob(item, recursive=True) if os.path.isfile(f))
+        elif os.path.isfile(item):
+            files.append(item)
+        else:
+            print(f"Warning: No config found at {item}", file=sys.stderr)
+    return sorted({os.path.abspath(f) for f in files})
+
+
+def load_config_items(config_files: List[str]) -> List[tuple]:
+    """
+    Load every config of the given files. A file holds one config dict or a
+    list of them (as written by the batch builder's "Generate Batch Config").
+
+    Returns:
+        List of (config_file, index_in_file, config dict or loading Exception)
+    """
+    items = []
+    for config_file in config_files:
+        try:
+            with open(config_file, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            items.append((config_file, 0, e))
+            continue
+        configs = data if isinstance(data, list) else [data]
+        for index, config in enumerate(configs):
+            if isinstance(config, dict):
+                items.append((config_file, index, config))
+            else:
+                items.append((config_file, index, ValueError(f"Config #{index} is not a JSON object")))
+    return items
@@ -12,6 +12,7 @@ Features:
 - Preview and edit before saving
 - Batch mode: Generate configs for multiple assets
 - Execute builds directly from UI
+- Folder scans run on a worker thread and stream assets into the list
 
 Usage:
     from tools.lops_asset_builder_v3 import batch_asset_builder
@@ -31,6 +32,15 @@ import hou
 
 from tools.lops_asset_builder_v3 import lops_asset_builder_cli
 from tools.lops_asset_builder_v3.asset_builder_ui import SimpleProgressDialog
+from tools.lops_asset_builder_v3.build_estimator import (
+    MaterialIndex, TimingHistory, format_duration, material_seconds,
+)
+from tools.lops_asset_builder_v3.progress_events import (
+    ProgressBus, ProgressEvent, RateLimiter, describe, MATERIAL_CREATED, LOG,
+)
+from tools.lops_asset_builder_v3.geo_variant_parser import (
+    GeoVariantParser, GeoFileParse, VARIANT_SUFFIXES, VARIANT_PATTERNS,
+)
 from tools.lops_asset_builder_v3.texture_variant_detector import TextureVariantDetector
 
 # Keep strong references to progress dialogs so they don't get garbage-collected
@@ -75,25 +85,10 @@ class AssetScanner:
     # Common geometry file extensions
     GEO_EXTENSIONS = ['.abc', '.usd', '.usda', '.usdc', '.obj', '.fbx', '.bgeo', '.bgeo.sc']
 
-    # Common variant suffixes to detect
-    VARIANT_SUFFIXES = [
-        '_high', '_mid', '_low',           # LOD variants
-        '_lod0', '_lod1', '_lod2', '_lod3', # LOD numbered
-        '_proxy', '_render', '_sim',       # Purpose variants
-        '_hero', '_background',            # Quality variants
-        'High', 'Mid', 'Low',              # Capitalized
-        'LOD0', 'LOD1', 'LOD2',            # Capitalized LOD
-    ]
-
-    # Additional patterns for single-letter and numbered variants
-    # Will be checked separately with regex
-    VARIANT_PATTERNS = [
-        r'_[A-Z]$',         # Single uppercase letter: _A, _B, _C
-        r'_[a-z]$',         # Single lowercase letter: _a, _b, _c
-        r'_v\d+$',          # Version numbered: _v1, _v2, _v3
-        r'_var\d+$',        # Variant numbered: _var1, _var2
-        r'_\d+$',           # Pure numbered: _1, _2, _3
-    ]
+    # Common variant suffixes to detect, and additional regex patterns for
+    # single-letter and numbered variants (see geo_variant_parser)
+    VARIANT_SUFFIXES = VARIANT_SUFFIXES
+    VARIANT_PATTERNS = VARIANT_PATTERNS
 
     def _load_geo_variant_config(self):
         """Load configurable geo variant suffixes and regex patterns.
@@ -193,6 +188,24 @@ class AssetScanner:
         self.variant_suffixes: List[str] = list(self.VARIANT_SUFFIXES)
         self.variant_patterns: List[str] = list(self.VARIANT_PATTERNS)
         self._load_geo_variant_config()
+        # Texture folder -> material names, filled during the scan for batch estimates
+        self.material_index = MaterialIndex()
+        self._parser: Optional[GeoVariantParser] = None
+        self._parser_config: Tuple = ()
+
+    @property
+    def parser(self) -> GeoVariantParser:
+        """Cached file name parser for the current suffix/pattern config."""
+        suffixes = tuple(self.variant_suffixes or self.VARIANT_SUFFIXES)
+        patterns = tuple(self.variant_patterns or self.VARIANT_PATTERNS)
+        if self._parser is None or self._parser_config != (suffixes, patterns):
+            self._parser = GeoVariantParser(suffixes, patterns)
+            self._parser_config = (suffixes, patterns)
+        return self._parser
+
+    def parse_file(self, filename: str) -> GeoFileParse:
+        """Cached parse record (base, suffix, sort keys) of a geometry file name or path."""
+        return self.parser.parse(filename)
 
     def scan_folder(self, folder_path: str, recursive: bool = False) -> List[DetectedAsset]:
         """
@@ -207,37 +220,52 @@ class AssetScanner:
         """
         expanded_path = hou.text.expandString(folder_path)
 
-        if not os.path.isdir(expanded_path):
-            return []
+        for _ in self.iter_scan(expanded_path, recursive):
+            pass
+
+        return self.detected_assets
+
+    def iter_scan(self, folder_path: str, recursive: bool = False):
+        """
+        Scan a folder one directory at a time, yielding the assets found in each.
+
+        Uses no hou or Qt calls, so it can run on a worker thread (see
+        AssetScanWorker). Stop iterating to cancel; detected_assets then holds
+        the assets found so far.
+
+        Args:
+            folder_path: Path to scan ($VARIABLES already expanded)
+            recursive: Scan subdirectories
 
+        Yields:
+            (folders_scanned, new_assets) after each directory
+        """
         self.detected_assets = []
 
+        if not os.path.isdir(folder_path):
+            return
+
         if recursive:
-            self._scan_recursive(expanded_path)
+            folders = ((root, files) for root, _dirs, files in os.walk(folder_path))
         else:
-            self._scan_single_folder(expanded_path)
+            folders = iter([(folder_path, os.listdir(folder_path))])
 
-        return self.detected_assets
-
-    def _scan_recursive(self, base_path: str):
-        """Recursively scan for asset folders."""
-        for root, dirs, files in os.walk(base_path):
+        indexed = set()
+        for scanned, (root, files) in enumerate(folders, start=1):
+            new_assets = []
             # Look for folders with geometry files
             geo_files = [f for f in files if self._is_geometry_file(f)]
-
             if geo_files:
+                first_new = len(self.detected_assets)
                 self._analyze_folder(root, geo_files)
-
-    def _scan_single_folder(self, folder_path: str):
-        """Scan a single folder for assets."""
-        geo_files = []
-
-        for item in os.listdir(folder_path):
-            if self._is_geometry_file(item):
-                geo_files.append(item)
-
-        if geo_files:
-            self._analyze_folder(folder_path, geo_files)
+                new_assets = self.detected_assets[first_new:]
+                # Index the texture folders now so build estimates don't re-scan them
+                for asset in new_assets:
+                    for texture_folder in [asset.texture_path] + list(asset.material_variants):
+                        if texture_folder and texture_folder not in indexed:
+                            indexed.add(texture_folder)
+                            self.material_index.index_folder(texture_folder)
+            yield scanned, new_assets
 
     def _is_geometry_file(self, filename: str) -> bool:
         """Check if file is a geometry file."""
@@ -257,29 +285,10 @@ class AssetScanner:
     def _analyze_folder(self, folder_path: str, geo_files: List[str]):
         """Analyze geometry files in a folder to detect main asset and variants."""
 
-        # Group files by base name
-        asset_groups = {}
-
-        for geo_file in geo_files:
-            base_name, suffix = self._extract_base_and_suffix(geo_file)
-
-            if base_name not in asset_groups:
-                asset_groups[base_name] = {
-                    'main': None,
-                    'variants': [],
-                    'suffixes': []
-                }
-
-            if suffix:
-                asset_groups[base_name]['variants'].append(geo_file)
-                asset_groups[base_name]['suffixes'].append(suffix)
-            else:
-                # No suffix = likely the main file
-                if asset_groups[base_name]['main'] is None:
-                    asset_groups[base_name]['main'] = geo_file
-                else:
-                    # Multiple files without suffix, treat as variants
-                    asset_groups[base_name]['variants'].append(geo_file)
+        # Group files by base name; variants are sorted deterministically so that,
+        # when no explicit main exists, the first variant is considered the main
+        # (patterns like _A, _B, _C choose _A as main)
+        asset_groups = self.parser.group(geo_files)
 
         # Create DetectedAsset for each group
         for base_name, data in asset_groups.items():
@@ -287,44 +296,6 @@ class AssetScanner:
             main_file = data['main']
             variants = list(data['variants'])
 
-            # Sort variants deterministically so that, when no explicit main exists,
-            # the first variant after sorting is considered the main. This ensures
-            # patterns like _A, _B, _C choose _A as main.
-            def _variant_sort_key(filename: str):
-                # Extract suffix using the existing logic
-                _bn, suf = self._extract_base_and_suffix(filename)
-                s = suf or ""
-                s_low = s.lower()
-                # Single letter _A/_b
-                m = re.match(r'^_([A-Za-z])$', s)
-                if m:
-                    ch = m.group(1).upper()
-                    return (0, ord(ch) - ord('A'))
-                # Pure numbered _1
-                m = re.match(r'^_(\d+)$', s)
-                if m:
-                    return (1, int(m.group(1)))
-                # Versioned _v1
-                m = re.match(r'^_v(\d+)$', s_low)
-                if m:
-                    return (2, int(m.group(1)))
-                # Quality _high/_mid/_low → High < Mid < Low
-                if s_low in ['_high', '_mid', '_low']:
-                    order = {'_high': 0, '_mid': 1, '_low': 2}
-                    return (3, order[s_low])
-                # LOD _lodN
-                m = re.match(r'^_lod(\d+)$', s_low)
-                if m:
-                    return (4, int(m.group(1)))
-                # Other known words get moderate priority by name
-                known_suffixes = ['_proxy', '_render', '_sim', '_hero', '_background']
-                if s_low in known_suffixes:
-                    return (5, known_suffixes.index(s_low))
-                # Fallback: lexicographic on full filename
-                return (9, filename.lower())
-
-            variants.sort(key=_variant_sort_key)
-
             if main_file is None and variants:
                 # No clear main file, pick the first sorted variant as main
                 main_file = variants[0]
@@ -368,37 +339,8 @@ class AssetScanner:
         Returns:
             (base_name, suffix)
         """
-        # Remove extension(s)
-        name = filename
-        if name.lower().endswith('.bgeo.sc'):
-            name = name[:-8]  # .bgeo.sc is 8 characters
-        else:
-            name = os.path.splitext(name)[0]
-
-        # 1. Check for exact suffix matches first (most specific)
-        for suffix in (self.variant_suffixes or self.VARIANT_SUFFIXES):
-            try:
-                if name.endswith(suffix):
-                    base_name = name[:-len(suffix)].rstrip('_')
-                    return (base_name, suffix)
-            except Exception:
-                continue
-
-        # 2. Check for pattern-based variants (regex patterns)
-        for pattern in (self.variant_patterns or self.VARIANT_PATTERNS):
-            try:
-                match = re.search(pattern, name)
-            except re.error:
-                # Skip invalid regex patterns from config
-                match = None
-            if match:
-                # Extract the matched suffix
-                suffix = match.group(0)
-                base_name = name[:match.start()].rstrip('_')
-                return (base_name, suffix)
-
-        # 3. No variant detected
-        return (name, "")
+        record = self.parse_file(filename)
+        return (record.base, record.suffix)
 
     def _detect_common_suffix(self, suffixes: List[str]) -> str:
         """Detect common suffix pattern from list of suffixes."""
@@ -479,16 +421,20 @@ class AssetScanner:
 class BatchUIProgressReporter:
     """Simplified progress reporter based on a fixed number of tasks (materials).
 
-    - Total tasks are precomputed before building (sum of estimated materials per
-      material folder across all selected assets).
-    - Each time the builder logs "Created material …" we increment the done count
-      by 1. No dynamic total changes during build; the bar is stable and monotonic.
+    - Total tasks are precomputed before building (sum of the materials per
+      material folder across all selected assets, from the scanner's MaterialIndex).
+    - Each MATERIAL_CREATED event published by the builder increments the done
+      count by 1. No dynamic total changes during build; the bar is stable and monotonic.
     - When an asset finishes, we top up any remaining tasks allocated to that
       asset to ensure the segment completes (useful when folders had zero
       discoverable textures and templates were created instead).
     """
-    def __init__(self, dialog: SimpleProgressDialog, asset_index: int, asset_label: str, expected_tasks_for_asset: int):
+    def __init__(self, dialog: SimpleProgressDialog, asset_index: int, asset_label: str, expected_tasks_for_asset: int,
+                 bus: ProgressBus | None = None):
         self.dialog = dialog
+        # Builders publish typed events here (see progress_events)
+        self.events = bus or ProgressBus()
+        self.events.subscribe(self._on_event)
         self.asset_index = max(1, int(asset_index))
         self.asset_label = asset_label or f"Asset {self.asset_index}"
         self.expected = max(1, int(expected_tasks_for_asset))
@@ -523,42 +469,32 @@ class BatchUIProgressReporter:
             raise KeyboardInterrupt("Cancelled by user")
         if message:
             try:
-                # Check if this is a material creation message
-                mat_match = re.search(r"Created material\s+(\d+)\s*/\s*(\d+)\s*:\s*(.+)", message)
-                if mat_match:
-                    # Extract material count and name from the message
-                    mat_current = mat_match.group(1)
-                    mat_total = mat_match.group(2)
-                    mat_name = mat_match.group(3)
-
-                    # Format asset progress (e.g., "24/85")
-                    if self.total_assets > 0:
-                        asset_progress = f"({self.asset_index}/{self.total_assets})"
-                    else:
-                        asset_progress = f"({self.asset_index})"
-
-                    # Enhanced message: "Building RootPlatform (24/85) - Created material 2/3: Material_Name"
-                    enhanced_message = f"Building {self.asset_label} {asset_progress} - Created material {mat_current}/{mat_total}: {mat_name}"
-                    self.dialog.set_message(enhanced_message)
-                    self.dialog.log(enhanced_message)
-                else:
-                    # Regular message without enhancement
-                    self.dialog.set_message(message)
-                    self.dialog.log(f"[{self.asset_index}] {message}")
-            except Exception:
-                # Fallback to original behavior on any error
-                try:
-                    self.dialog.set_message(message)
-                    self.dialog.log(f"[{self.asset_index}] {message}")
-                except Exception:
-                    pass
-            # Count material creation steps: "Created material n/X: ..."
-            try:
-                if re.search(r"Created material\s+\d+\s*/\s*\d+\s*:\s*", message):
-                    self._inc(1)
+                self.dialog.set_message(message)
+                self.dialog.log(f"[{self.asset_index}] {message}")
             except Exception:
                 pass
 
+    def _on_event(self, event: ProgressEvent):
+        try:
+            if event.kind == MATERIAL_CREATED:
+                # Format asset progress (e.g., "24/85")
+                if self.total_assets > 0:
+                    asset_progress = f"({self.asset_index}/{self.total_assets})"
+                else:
+                    asset_progress = f"({self.asset_index})"
+
+                # Enhanced message: "Building RootPlatform (24/85) - Created material 2/3: Material_Name"
+                enhanced_message = f"Building {self.asset_label} {asset_progress} - {describe(event)}"
+                self.dialog.set_message(enhanced_message)
+                self.dialog.log(enhanced_message)
+                self._inc(1)
+            elif event.message:
+                if event.kind != LOG:
+                    self.dialog.set_message(event.message)
+                self.dialog.log(f"[{self.asset_index}] {event.message}")
+        except Exception:
+            pass
+
     def log(self, message: str):
         try:
             self.dialog.log(f"[{self.asset_index}] {message}")
@@ -567,7 +503,7 @@ class BatchUIProgressReporter:
 
     def is_cancelled(self) -> bool:
         try:
-            QtWidgets.QApplication.processEvents(QtCore.QEventLoop.AllEvents, 50)
+            self.dialog.pump()
         except Exception:
             pass
         try:
@@ -587,6 +523,60 @@ class BatchUIProgressReporter:
                 pass
 
 
+class AssetScanSignals(QtCore.QObject):
+    """Signals of an AssetScanWorker (QRunnable is not a QObject)."""
+    assets_found = QtCore.Signal(list)    # List[DetectedAsset], batched
+    progress = QtCore.Signal(int, int)    # folders scanned, assets found
+    failed = QtCore.Signal(str)
+    finished = QtCore.Signal(bool)        # True if the scan was cancelled
+
+
+class AssetScanWorker(QtCore.QRunnable):
+    """Runs AssetScanner.iter_scan on a QThreadPool thread.
+
+    Detected assets are streamed back in batches at most UI_REFRESH_HZ times
+    per second, so a large scan fills the list progressively without flooding
+    the UI thread with one signal per folder.
+    """
+    def __init__(self, scanner: AssetScanner, folder_path: str, recursive: bool):
+        super().__init__()
+        self.setAutoDelete(False)  # The dialog keeps the worker until finished
+        self.scanner = scanner
+        self.folder_path = folder_path
+        self.recursive = recursive
+        self.signals = AssetScanSignals()
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def is_cancelled(self) -> bool:
+        return self._cancelled
+
+    def run(self):
+        pending: List[DetectedAsset] = []
+        scanned = 0
+        found = 0
+        limiter = RateLimiter()
+        try:
+            for scanned, new_assets in self.scanner.iter_scan(self.folder_path, self.recursive):
+                if self._cancelled:
+                    break
+                pending.extend(new_assets)
+                found += len(new_assets)
+                if limiter.ready():
+                    if pending:
+                        self.signals.assets_found.emit(pending)
+                        pending = []
+                    self.signals.progress.emit(scanned, found)
+            if pending:
+                self.signals.assets_found.emit(pending)
+            self.signals.progress.emit(scanned, found)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        self.signals.finished.emit(self._cancelled)
+
+
 class CollapsibleSection(QtWidgets.QWidget):
     """A simple collapsible container with a clickable header and a content area."""
     def __init__(self, title: str = "", content: QtWidgets.QWidget | None = None, parent=None):
@@ -639,6 +629,10 @@ class CollapsibleSection(QtWidgets.QWidget):
 class ConfigGeneratorDialog(QtWidgets.QDialog):
     """UI for generating LOPS Asset Builder configs."""
 
+    # Item data roles of the asset model
+    ASSET_ROLE = QtCore.Qt.UserRole
+    NAME_ROLE = QtCore.Qt.UserRole + 1  # Lowercase asset name, used to filter and sort
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("LOPS Batch Asset Builder")
@@ -648,7 +642,8 @@ class ConfigGeneratorDialog(QtWidgets.QDialog):
 
         self.scanner = AssetScanner()
         self.detected_assets: List[DetectedAsset] = []
-        self.filtered_assets: List[DetectedAsset] = []
+        self._scan_worker: Optional[AssetScanWorker] = None
+        self._expand_scanned_assets = False
         # Store selected environment light files (HDRIs)
         self.env_light_paths: List[str] = []
 
@@ -723,6 +718,14 @@ class ConfigGeneratorDialog(QtWidgets.QDialog):
         self.btn_scan.clicked.connect(self._scan_folder)
         scan_layout.addWidget(self.btn_scan)
 
+        # Scan progress (indeterminate: the number of folders is not known up front)
+        self.scan_progress = QtWidgets.QProgressBar()
+        self.scan_progress.setRange(0, 0)
+        self.scan_progress.setTextVisible(False)
+        self.scan_progress.setMaximumHeight(8)
+        self.scan_progress.setVisible(False)
+        scan_layout.addWidget(self.scan_progress)
+
         scroll_layout.addWidget(scan_group)
 
         # Results section (non-collapsible)
@@ -757,14 +760,26 @@ class ConfigGeneratorDialog(QtWidgets.QDialog):
         controls_layout.addStretch()
         results_layout.addLayout(controls_layout)
 
-        # Asset list
-        self.asset_list = QtWidgets.QListWidget()
-        self.asset_list.setSelectionMode(QtWidgets.QListWidget.ExtendedSelection)
+        # Asset list: source model filled by the scan, proxy filters/sorts by name
+        self.asset_model = QtGui.QStandardItemModel(self)
+        self.asset_proxy = QtCore.QSortFilterProxyModel(self)
+        self.asset_proxy.setSourceModel(self.asset_model)
+        self.asset_proxy.setFilterRole(self.NAME_ROLE)
+        self.asset_proxy.setSortRole(self.NAME_ROLE)
+        self.asset_proxy.setFilterCaseSensitivity(QtCore.Qt.CaseInsensitive)
+        self.asset_proxy.setDynamicSortFilter(True)
+        self.asset_proxy.sort(0, QtCore.Qt.AscendingOrder)
+
+        self.asset_list = QtWidgets.QListView()
+        self.asset_list.setModel(self.asset_proxy)
+        self.asset_list.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+        self.asset_list.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.asset_list.setUniformItemSizes(True)
         # Make the list occupy more space
         self.asset_list.setMinimumHeight(320)
         self.asset_list.setSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Expanding)
-        self.asset_list.setStyleSheet("QListWidget { padding: 2px; }")
-        self.asset_list.itemSelectionChanged.connect(self._on_selection_changed)
+        self.asset_list.setStyleSheet("QListView { padding: 2px; }")
+        self.asset_list.selectionModel().selectionChanged.connect(self._on_selection_changed)
         results_layout.addWidget(self.asset_list)
 
         # Selection buttons
@@ -1052,43 +1067,18 @@ class ConfigGeneratorDialog(QtWidgets.QDialog):
             # Collect all geometry files (main + variants)
             all_geo_files = [asset.main_file] + asset.geo_variants
 
-            # Sort files to maintain consistent ordering
-            def _variant_sort_key(filepath: str):
-                filename = os.path.basename(filepath)
-                base_name, suffix = self._extract_base_and_suffix_from_path(filepath)
-                s = suffix or ""
-                s_low = s.lower()
-
-                # Single letter _A/_B/_C
-                m = re.match(r'^_([A-Za-z])$', s)
-                if m:
-                    ch = m.group(1).upper()
-                    return (0, ord(ch) - ord('A'))
-
-                # Files without suffix come first
-                if not s:
-                    return (-1, filename.lower())
-
-                # Pure numbered _1, _2
-                m = re.match(r'^_(\d+)$', s)
-                if m:
-                    return (1, int(m.group(1)))
-
-                # Fallback: lexicographic
-                return (9, filename.lower())
-
-            all_geo_files.sort(key=_variant_sort_key)
+            # Sort files to maintain consistent ordering: files without suffix first,
+            # then single letters _A/_B/_C (parse records are cached by the scanner)
+            all_geo_files.sort(key=lambda filepath: self.scanner.parse_file(filepath).letter_sort_key)
 
             # Create one DetectedAsset for each geometry file
             for i, geo_file in enumerate(all_geo_files):
                 # Determine asset name with letter suffix
-                base_filename = os.path.basename(geo_file)
-                name_without_ext = os.path.splitext(base_filename)[0]
-                if name_without_ext.lower().endswith('.bgeo'):
-                    name_without_ext = name_without_ext[:-5]  # Remove .bgeo from .bgeo.sc
+                record = self.scanner.parse_file(geo_file)
+                name_without_ext = record.stem
 
                 # Extract base and suffix
-                base_name, existing_suffix = self._extract_base_and_suffix_from_path(geo_file)
+                base_name, existing_suffix = record.letter_base, record.letter_suffix
 
                 # Assign letter position
                 letter = chr(ord('A') + i)
@@ -1144,7 +1134,13 @@ class ConfigGeneratorDialog(QtWidgets.QDialog):
         self._update_env_ui()
 
     def _scan_folder(self):
-        """Scan folder for assets."""
+        """Scan folder for assets on a worker thread (the button cancels a running scan)."""
+        if self._scan_worker is not None:
+            self._scan_worker.cancel()
+            self.btn_scan.setEnabled(False)
+            self.status_label.setText("Cancelling scan...")
+            return
+
         folder = self.folder_edit.text().strip()
 
         if not folder:
@@ -1155,85 +1151,97 @@ class ConfigGeneratorDialog(QtWidgets.QDialog):
         textures_root = self.textures_edit.text().strip() if hasattr(self, 'textures_edit') else ''
         self.scanner.textures_root = textures_root if textures_root and os.path.isdir(textures_root) else None
 
+        self.detected_assets = []
+        self.asset_model.removeRows(0, self.asset_model.rowCount())
+        # If "Generate variants by list" is unchecked, expand each asset into individual items
+        self._expand_scanned_assets = not self.cb_generate_list_variants.isChecked()
+
+        # hou is only touched here, on the UI thread
+        expanded_path = hou.text.expandString(folder)
+        worker = AssetScanWorker(self.scanner, expanded_path, self.cb_recursive.isChecked())
+        worker.signals.assets_found.connect(self._on_scan_assets_found)
+        worker.signals.progress.connect(self._on_scan_progress)
+        worker.signals.failed.connect(self._on_scan_failed)
+        worker.signals.finished.connect(self._on_scan_finished)
+        self._scan_worker = worker
+
+        self.btn_scan.setText("Cancel Scan")
+        self.scan_progress.setVisible(True)
         self.status_label.setText("Scanning...")
-        QtWidgets.QApplication.processEvents()
+        QtCore.QThreadPool.globalInstance().start(worker)
+
+    def _on_scan_assets_found(self, assets: List[DetectedAsset]):
+        """Append a batch of streamed scan results to the model."""
+        if self._expand_scanned_assets:
+            assets = self._expand_assets_to_individual_variants(assets)
+        self.detected_assets.extend(assets)
+        self._populate_asset_list(assets)
+
+    def _on_scan_progress(self, folders_scanned: int, assets_found: int):
+        if self._scan_worker is not None and not self._scan_worker.is_cancelled():
+            self.status_label.setText(
+                f"Scanning... {folders_scanned} folder(s), {len(self.detected_assets)} assets found"
+            )
 
-        # Scan
-        recursive = self.cb_recursive.isChecked()
-        self.detected_assets = self.scanner.scan_folder(folder, recursive)
+    def _on_scan_failed(self, message: str):
+        print(f"Warning: Asset scan failed: {message}")
+        QtWidgets.QMessageBox.warning(self, "Scan Failed", f"Scanning failed:\n{message}")
 
-        # If "Generate variants by list" is unchecked, expand each asset into individual items
-        if not self.cb_generate_list_variants.isChecked():
-            self.detected_assets = self._expand_assets_to_individual_variants(self.detected_assets)
+    def _on_scan_finished(self, cancelled: bool):
+        self._scan_worker = None
+        self.btn_scan.setText("Scan Folder")
+        self.btn_scan.setEnabled(True)
+        self.scan_progress.setVisible(False)
+        status = f"Found {len(self.detected_assets)} assets"
+        self.status_label.setText(f"{status} (scan cancelled)" if cancelled else status)
 
-        # Update list via filter/sort pipeline
-        self._apply_filter_and_sort()
-        self.status_label.setText(f"Found {len(self.detected_assets)} assets")
+    def closeEvent(self, event):
+        # Stop a running scan; the worker exits after its current folder
+        if self._scan_worker is not None:
+            self._scan_worker.cancel()
+        super().closeEvent(event)
 
     def _populate_asset_list(self, assets: List[DetectedAsset]):
-        """Populate the asset list widget with given assets."""
-        self.asset_list.clear()
+        """Append assets to the asset model (the proxy applies filter and sort order)."""
+        root = self.asset_model.invisibleRootItem()
+        rows = []
         for asset in assets:
             item_text = f"{asset.name} ({len(asset.geo_variants)} geo variants, {len(asset.material_variants)} mat variants)"
-            item = QtWidgets.QListWidgetItem(item_text)
-            item.setData(QtCore.Qt.UserRole, asset)
-            self.asset_list.addItem(item)
+            item = QtGui.QStandardItem(item_text)
+            item.setData(asset, self.ASSET_ROLE)
+            item.setData(asset.name.lower(), self.NAME_ROLE)
+            rows.append(item)
+        if rows:
+            root.appendRows(rows)
+
+    def _selected_assets(self) -> List[DetectedAsset]:
+        """Selected (visible) assets, in list order."""
+        indexes = sorted(self.asset_list.selectionModel().selectedRows(), key=lambda index: index.row())
+        return [index.data(self.ASSET_ROLE) for index in indexes]
 
     def _apply_filter_and_sort(self):
-        """Filter detected assets by search text and sort by name asc/desc, then populate list,
-        preserving current selections when possible (e.g., when clearing the search bar)."""
-        # Capture currently selected items' stable keys (use main_file path which is unique per asset)
-        selected_keys = set()
-        try:
-            for item in self.asset_list.selectedItems():
-                asset = item.data(QtCore.Qt.UserRole)
-                if asset and getattr(asset, 'main_file', None):
-                    selected_keys.add(asset.main_file)
-        except Exception:
-            selected_keys = set()
+        """Filter assets by search text and sort by name asc/desc.
 
-        assets = list(self.detected_assets) if self.detected_assets else []
-
-        # Filter
+        Runs on the proxy model, so the list is not rebuilt; selected assets
+        that stay visible keep their selection.
+        """
         query = ""
         try:
             query = (self.search_edit.text() or "").strip().lower()
         except Exception:
             query = ""
-        if query:
-            assets = [a for a in assets if query in a.name.lower()]
+        self.asset_proxy.setFilterFixedString(query)
 
-        # Sort
         desc = False
         try:
             desc = (self.sort_combo.currentIndex() == 1)
         except Exception:
             desc = False
-        assets.sort(key=lambda a: a.name.lower(), reverse=desc)
-
-        # Store and display
-        self.filtered_assets = assets
-        self._populate_asset_list(self.filtered_assets)
-
-        # Attempt to restore previous selection for items that are still visible under the new filter
-        restored = 0
-        try:
-            for i in range(self.asset_list.count()):
-                item = self.asset_list.item(i)
-                asset = item.data(QtCore.Qt.UserRole)
-                if asset and getattr(asset, 'main_file', None) in selected_keys:
-                    item.setSelected(True)
-                    restored += 1
-        except Exception:
-            pass
-
-        # If nothing is restored, itemSelectionChanged signal will have cleared details and count.
-        # If items were restored, _on_selection_changed will update details and selection count accordingly.
-        return
+        self.asset_proxy.sort(0, QtCore.Qt.DescendingOrder if desc else QtCore.Qt.AscendingOrder)
 
-    def _on_selection_changed(self):
+    def _on_selection_changed(self, *_args):
         """Handle selection change."""
-        selected = self.asset_list.selectedItems()
+        selected = self._selected_assets()
         self.lbl_selection_count.setText(f"{len(selected)} selected")
 
         if not selected:
@@ -1242,8 +1250,7 @@ class ConfigGeneratorDialog(QtWidgets.QDialog):
 
         # Show details for all selected assets
         details_blocks = []
-        for item in selected:
-            asset: DetectedAsset = item.data(QtCore.Qt.UserRole)
+        for asset in selected:
             details = []
             details.append(f"<b>Asset Name:</b> {asset.name}")
             details.append(f"<b>Main File:</b> {os.path.basename(asset.main_file)}")
@@ -1311,32 +1318,9 @@ class ConfigGeneratorDialog(QtWidgets.QDialog):
         return asset.main_file, asset.geo_variants
 
     def _extract_base_and_suffix_from_path(self, filepath: str) -> Tuple[str, str]:
-        """Helper to extract base and suffix from full file path."""
-        filename = os.path.basename(filepath)
-
-        # Remove extension(s)
-        name = filename
-        if name.lower().endswith('.bgeo.sc'):
-            name = name[:-8]
-        else:
-            name = os.path.splitext(name)[0]
-
-        # Check for single letter suffix pattern _A, _B, _C
-        m = re.search(r'_([A-Z])$', name)
-        if m:
-            suffix = m.group(0)
-            base_name = name[:m.start()]
-            return (base_name, suffix)
-
-        # Check for other patterns
-        m = re.search(r'_([a-z])$', name)
-        if m:
-            suffix = m.group(0)
-            base_name = name[:m.start()]
-            return (base_name, suffix)
-
-        # No variant detected
-        return (name, "")
+        """Helper to extract base and single-letter suffix (_A, _b) from full file path."""
+        record = self.scanner.parse_file(filepath)
+        return (record.letter_base, record.letter_suffix)
 
     def _get_config_for_asset(self, asset: DetectedAsset) -> Dict:
         """Generate config dictionary for an asset."""
@@ -1383,13 +1367,13 @@ class ConfigGeneratorDialog(QtWidgets.QDialog):
 
     def _generate_single_config(self):
         """Generate config for selected asset."""
-        selected = self.asset_list.selectedItems()
+        selected = self._selected_assets()
 
         if not selected:
             QtWidgets.QMessageBox.warning(self, "No Selection", "Please select an asset.")
             return
 
-        asset: DetectedAsset = selected[0].data(QtCore.Qt.UserRole)
+        asset: DetectedAsset = selected[0]
 
         # Ask for save location
         default_name = f"{asset.name}_config.json"
@@ -1450,7 +1434,7 @@ class ConfigGeneratorDialog(QtWidgets.QDialog):
 
     def _build_now(self):
         """Build selected assets now."""
-        selected = self.asset_list.selectedItems()
+        selected = self._selected_assets()
 
         if not selected:
             QtWidgets.QMessageBox.warning(self, "No Selection", "Please select assets to build.")
@@ -1468,7 +1452,7 @@ class ConfigGeneratorDialog(QtWidgets.QDialog):
             try:
                 if len(selected) == 1:
                     # Single asset: ask for file path
-                    asset: DetectedAsset = selected[0].data(QtCore.Qt.UserRole)
+                    asset: DetectedAsset = selected[0]
                     default_name = f"{asset.name}_config.json"
                     filepath, _ = QtWidgets.QFileDialog.getSaveFileName(
                         self, "Save Config", default_name, "JSON Files (*.json)"
@@ -1485,8 +1469,7 @@ class ConfigGeneratorDialog(QtWidgets.QDialog):
                     )
                     if target_dir:
                         count = 0
-                        for item in selected:
-                            asset: DetectedAsset = item.data(QtCore.Qt.UserRole)
+                        for asset in selected:
                             filename = f"{asset.name}_config.json"
                             filepath = os.path.join(target_dir, filename)
                             config = self._get_config_for_asset(asset)
@@ -1511,17 +1494,19 @@ class ConfigGeneratorDialog(QtWidgets.QDialog):
         # Build assets with progress UI
         results = []
         total_assets = len(selected)
-        assets_in_order: List[DetectedAsset] = []
-        for item in selected:
-            asset: DetectedAsset = item.data(QtCore.Qt.UserRole)
-            assets_in_order.append(asset)
+        assets_in_order: List[DetectedAsset] = list(selected)
+
+        # Material counts per asset from the scan index (only changed folders are re-listed)
+        configs = [self._get_config_for_asset(asset) for asset in assets_in_order]
+        material_counts = [self.scanner.material_index.count_for_config(config) for config in configs]
+        timing_history = TimingHistory.load()
 
-        # Create the progress dialog FIRST so it shows immediately
-        # We'll use a simple task count estimation (100 per asset) to avoid pre-scanning files
         progress_dialog = SimpleProgressDialog(title="LOPs Asset Builder v3 — Building Assets", parent=None)
 
-        # Simple estimate: 100 tasks per asset (avoids slow file scanning before showing dialog)
-        total_tasks = total_assets * 100
+        # One task per material to create; assets without textures still get one task
+        tasks_per_asset = [max(1, count) for count in material_counts]
+        total_tasks = sum(tasks_per_asset)
+        estimated_seconds = timing_history.estimate(sum(material_counts), total_assets)
 
         try:
             # Ensure the dialog is visible and brought to front so the progress bar is shown
@@ -1548,6 +1533,8 @@ class ConfigGeneratorDialog(QtWidgets.QDialog):
             progress_dialog.set_value(0)
             progress_dialog.set_message(f"Starting batch build of {total_assets} asset(s)…")
             progress_dialog.log(f"Starting batch build of {total_assets} asset(s). Progress is based on {total_tasks} material creation task(s).")
+            history_note = f"from {timing_history.samples} previous build(s)" if timing_history.samples else "no build history yet"
+            progress_dialog.log(f"Estimated build time: {format_duration(estimated_seconds)} ({history_note})")
             # Close the main dialog so only the progress window remains visible
             try:
                 self.close()
@@ -1561,11 +1548,13 @@ class ConfigGeneratorDialog(QtWidgets.QDialog):
 
         cancelled = False
         for idx, asset in enumerate(assets_in_order, start=1):
-            config = self._get_config_for_asset(asset)
+            config = configs[idx - 1]
 
             # Log current building status to the progress dialog instead of updating the closed main dialog
             try:
-                progress_dialog.log(f"Building {asset.name} ({idx}/{total_assets})…")
+                remaining = timing_history.estimate(sum(material_counts[idx - 1:]), total_assets - idx + 1)
+                progress_dialog.log(f"Building {asset.name} ({idx}/{total_assets}, "
+                                    f"{material_counts[idx - 1]} materials) — about {format_duration(remaining)} remaining…")
             except Exception:
                 pass
             QtWidgets.QApplication.processEvents()
@@ -1574,7 +1563,7 @@ class ConfigGeneratorDialog(QtWidgets.QDialog):
                 progress_dialog,
                 asset_index=idx,
                 asset_label=asset.name,
-                expected_tasks_for_asset=100  # Simple fixed estimate per asset
+                expected_tasks_for_asset=tasks_per_asset[idx - 1]
             )
 
             try:
@@ -1599,6 +1588,9 @@ class ConfigGeneratorDialog(QtWidgets.QDialog):
                 result = _Tmp(e)
 
             results.append((asset.name, result))
+            if getattr(result, 'success', False):
+                timing_history.record(reporter._local_done, material_seconds(getattr(result, 'build_plan', None)),
+                                      getattr(result, 'duration', 0.0))
             # Ensure we mark the per-asset finished to push progress to boundary
             try:
                 # Advance progress to the next asset without emitting a duplicate finish line
@@ -1614,6 +1606,9 @@ class ConfigGeneratorDialog(QtWidgets.QDialog):
             except Exception:
                 pass
 
+        if any(getattr(r, 'success', False) for _, r in results):
+            timing_history.save()
+
         # Finalize progress dialog and log summary directly in it (no extra dialogs)
         try:
             success_count = sum(1 for _, r in results if getattr(r, 'success', False))
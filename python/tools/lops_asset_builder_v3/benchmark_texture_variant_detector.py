@@ -0,0 +1,127 @@
+"""
+TextureVariantDetector Benchmark
+
+Times per-folder analysis and detector creation the way they worked before
+the pattern tables were precompiled and cached (string patterns through
+re.search, priority config re-read for every detector) against the current
+cold (cache cleared) and warm (cached) paths.
+
+Usage:
+    python -m tools.lops_asset_builder_v3.benchmark_texture_variant_detector [folder_count]
+    or from Houdini Python Shell:
+    from tools.lops_asset_builder_v3 import benchmark_texture_variant_detector
+    benchmark_texture_variant_detector.run_benchmark(10000)
+"""
+
+import re
+import time
+from typing import Dict, List
+
+from tools.lops_asset_builder_v3.texture_variant_detector import (
+    TextureVariantDetector,
+    _analyze_folder_name_cached,
+    clear_detector_cache,
+)
+
+# Folder names as seen across a batch of asset libraries (many repeats)
+_FOLDER_NAMES = [
+    "png4k", "png2k", "png1k", "jpg4k", "jpg2k", "jpg1k", "4k", "2K", "8K_EXR",
+    "2048x2048", "textures_4k_png", "4k_png", "2k_jpg",
+    "Cyberpunk_Trimsheets_4K_JPG_Textures", "Cyberpunk_Trimsheets_2K_PNG_Textures",
+    "Source", "Preview", "geo", "Textures",
+]
+
+
+def _legacy_analyze(detector: TextureVariantDetector, folder_name: str):
+    """Folder analysis as it ran before: string patterns, simple-pattern list rebuilt per call."""
+    folder_lower = folder_name.lower()
+    resolution = format_type = None
+    for pattern in detector.RESOLUTION_PATTERNS:
+        match = re.search(pattern, folder_lower, re.IGNORECASE)
+        if match:
+            res_value = match.group(1)
+            resolution = detector._numeric_to_resolution(int(res_value)) if len(res_value) > 2 else f"{res_value}k"
+            break
+    for pattern in detector.FORMAT_PATTERNS:
+        match = re.search(pattern, folder_lower, re.IGNORECASE)
+        if match:
+            format_type = match.group(1).lower()
+            break
+    if not resolution:
+        m = re.search(r'(png|jpg|jpeg|exr|tif|tiff)(\d+)[kK]', folder_lower, re.IGNORECASE)
+        if m:
+            resolution = f"{m.group(2)}k"
+    if not resolution:
+        m = re.search(r'(\d+)[kK](png|jpg|jpeg|exr|tif|tiff)', folder_lower, re.IGNORECASE)
+        if m:
+            resolution = f"{m.group(1)}k"
+    simple_patterns = [
+        r'^\d+[kK]$',
+        r'^(png|jpg|jpeg|exr|tif)\d+[kK]$',
+        r'^\d+[kK]_(png|jpg|jpeg|exr|tif)$',
+    ]
+    for pattern in simple_patterns:
+        if re.match(pattern, folder_name, re.IGNORECASE):
+            break
+    return resolution, format_type
+
+
+def _time_per_call(func, names: List[str]) -> float:
+    start = time.perf_counter()
+    for name in names:
+        func(name)
+    return (time.perf_counter() - start) / len(names)
+
+
+def run_benchmark(folder_count: int = 10000) -> Dict[str, float]:
+    """
+    Run the benchmark and print microseconds per folder / per detector.
+
+    Args:
+        folder_count: Number of folder names analysed (drawn from a realistic set)
+
+    Returns:
+        dict: Mode -> seconds per call
+    """
+    names = [_FOLDER_NAMES[i % len(_FOLDER_NAMES)] for i in range(folder_count)]
+    detector = TextureVariantDetector()
+
+    def cold(name):
+        _analyze_folder_name_cached.cache_clear()
+        detector._analyze_folder_name(name, name)
+
+    def new_detector_uncached(_):
+        clear_detector_cache()
+        TextureVariantDetector()
+
+    results = {
+        "analyze_before": _time_per_call(lambda n: _legacy_analyze(detector, n), names),
+        "analyze_cold": _time_per_call(cold, names),
+    }
+    clear_detector_cache()
+    results["analyze_warm"] = _time_per_call(lambda n: detector._analyze_folder_name(n, n), names)
+
+    detector_runs = names[:max(1, folder_count // 10)]
+    results["detector_before"] = _time_per_call(new_detector_uncached, detector_runs)
+    results["detector_cached"] = _time_per_call(lambda _: TextureVariantDetector(), detector_runs)
+
+    print("\n" + "=" * 60)
+    print(f"TextureVariantDetector benchmark ({folder_count} folder names)")
+    print("=" * 60)
+    for group in ("analyze", "detector"):
+        baseline = results[f"{group}_before"]
+        for mode, seconds in results.items():
+            if not mode.startswith(group):
+                continue
+            speedup = baseline / seconds if seconds else 0.0
+            print(f"  {mode:<20} {seconds * 1e6:10.2f}us  x{speedup:.1f}")
+    print("=" * 60)
+
+    return results
+
+
+if __name__ == "__main__":
+    import sys
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    run_benchmark(count)
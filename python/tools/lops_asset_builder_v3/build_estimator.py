@@ -0,0 +1,307 @@
+"""
+Up-front work estimation for LOPS Asset Builder v3 batch builds.
+
+A batch build used to guess "100 tasks per asset" for its progress bar,
+because counting materials with estimate_materials_in_folder re-scans every
+texture folder before the progress dialog can appear. This module splits the
+estimate into two cheap parts:
+
+    MaterialIndex  Raw material names per texture directory, filled while the
+                   batch UI scans the asset folders. Counting the materials of
+                   an asset only re-stats the indexed directories (a directory
+                   whose mtime changed is re-listed), so it takes milliseconds.
+    TimingHistory  Seconds per material and per asset from previous builds,
+                   kept as a moving average in a JSON file, which turns the
+                   counts into a time estimate for the whole batch.
+
+Material names are parsed with tex_to_mtlx_config.parse_texture_file_name, and the
+naming config is applied at count time, so the counts match the materials
+_create_materials finds in a folder (before filtering by the material names
+used in the geometry).
+
+Usage:
+    index = MaterialIndex()
+    index.index_folder("/assets/crate/textures/4k")
+    count = index.count("/assets/crate/textures/4k", MaterialNamingConfig.from_ui())
+
+    history = TimingHistory.load()
+    seconds = history.estimate(materials=count, assets=1)
+    ...
+    history.record(materials=count, material_seconds=12.3, total_seconds=20.1)
+    history.save()
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from modules.misc_utils import MaterialNamingConfig, slugify
+from tools.tex_to_mtlx_config import is_texture_file_name, parse_texture_file_name
+
+# Environment variable overriding the timing history location
+TIMINGS_ENV = "LOPS_BUILD_TIMINGS"
+TIMINGS_FILE_NAME = "lops_asset_builder_v3_timings.json"
+
+
+def _mtime(path: str) -> float:
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return -1.0
+
+
+@dataclass
+class _DirEntry:
+    """Raw material names of the textures directly inside one directory, with their texture types"""
+    mtime: float
+    textures: Dict[str, Tuple[str, ...]]
+
+    @property
+    def names(self):
+        return self.textures.keys()
+
+
+class MaterialIndex:
+    """
+    Cached texture folder -> material names index.
+
+    Each texture root keeps the list of directories found under it; a root is
+    still valid while none of those directories changed mtime (adding or
+    removing a file or a subfolder changes the mtime of its parent).
+    """
+
+    def __init__(self):
+        self._dirs: Dict[str, _DirEntry] = {}
+        self._roots: Dict[str, List[str]] = {}
+
+    @staticmethod
+    def _key(folder: str) -> str:
+        return os.path.normpath(folder or "")
+
+    def _scan_dir(self, directory: str, mtime: float) -> _DirEntry:
+        textures: Dict[str, Set[str]] = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if not is_texture_file_name(entry.name):
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                    except OSError:
+                        continue
+                    parsed = parse_texture_file_name(entry.name)
+                    if parsed:
+                        textures.setdefault(parsed[0], set()).add(parsed[1])
+        except OSError as e:
+            print(f"Warning: Could not index texture folder {directory}: {e}")
+        entry = _DirEntry(mtime, {name: tuple(sorted(types)) for name, types in sorted(textures.items())})
+        self._dirs[directory] = entry
+        return entry
+
+    def _is_current(self, root: str) -> bool:
+        directories = self._roots.get(root)
+        if directories is None:
+            return False
+        return all(_mtime(d) == self._dirs[d].mtime for d in directories)
+
+    def index_folder(self, folder: str, force: bool = False) -> int:
+        """
+        Index a texture folder and all its subfolders.
+
+        Args:
+            folder: Texture root folder
+            force: Re-list every directory even if its mtime is unchanged
+
+        Returns:
+            int: Number of raw material names found under the folder
+        """
+        root = self._key(folder)
+        if not root or not os.path.isdir(root):
+            self._roots.pop(root, None)
+            return 0
+        if force or not self._is_current(root):
+            directories = []
+            for current, _dirs, _files in os.walk(root):
+                mtime = _mtime(current)
+                cached = self._dirs.get(current)
+                if force or cached is None or cached.mtime != mtime:
+                    self._scan_dir(current, mtime)
+                directories.append(current)
+            self._roots[root] = directories
+        return len(self.raw_names(root))
+
+    def index_folders(self, folders: Iterable[str]):
+        """Index several texture folders (empty entries are skipped)."""
+        for folder in folders:
+            if folder:
+                self.index_folder(folder)
+
+    def raw_names(self, folder: str) -> Set[str]:
+        """Unsanitized material names under an indexed folder (indexes it if needed)."""
+        root = self._key(folder)
+        if not self._is_current(root):
+            if not os.path.isdir(root):
+                return set()
+            self.index_folder(root)
+        names = set()
+        for directory in self._roots.get(root, []):
+            names.update(self._dirs[directory].names)
+        return names
+
+    def texture_types(self, folder: str, naming_config: Optional[MaterialNamingConfig] = None) -> Dict[str, Set[str]]:
+        """
+        Texture types of every material under an indexed folder (indexes it if needed).
+
+        Args:
+            folder: Texture root folder
+            naming_config: Material naming configuration of the build
+
+        Returns:
+            dict: Material name (after the naming config) -> texture types found for it
+        """
+        self.raw_names(folder)
+        sanitize = naming_config is not None and naming_config.enabled
+        types: Dict[str, Set[str]] = {}
+        for directory in self._roots.get(self._key(folder), []):
+            for name, texture_types in self._dirs[directory].textures.items():
+                if sanitize:
+                    name = slugify(name, naming_config.drop_tokens, lowercase=naming_config.lowercase)
+                types.setdefault(name, set()).update(texture_types)
+        return types
+
+    def count(self, folder: str, naming_config: Optional[MaterialNamingConfig] = None) -> int:
+        """
+        Number of materials _create_materials would find in a texture folder.
+
+        Args:
+            folder: Texture root folder
+            naming_config: Material naming configuration of the build
+
+        Returns:
+            int: Distinct material names after applying the naming config
+        """
+        names = self.raw_names(folder)
+        if naming_config is not None and naming_config.enabled:
+            names = {slugify(n, naming_config.drop_tokens, lowercase=naming_config.lowercase) for n in names}
+        return len(names)
+
+    def count_for_config(self, config: Dict) -> int:
+        """
+        Number of materials a build config creates over all its material variants.
+
+        Args:
+            config: Asset builder config dict (folder_textures, mtl_variants, ...)
+
+        Returns:
+            int: Material count summed over every material library the build creates
+        """
+        folders = list(config.get("mtl_variants") or [])
+        if config.get("folder_textures"):
+            folders.append(config["folder_textures"])
+        if config.get("texture_variants_only") and folders:
+            # Only the main texture folder gets shader networks
+            folders = folders[-1:]
+        naming_config = MaterialNamingConfig.from_ui(lowercase=bool(config.get("lowercase_material_names", False)))
+        return sum(self.count(folder, naming_config) for folder in folders)
+
+    def clear(self):
+        self._dirs.clear()
+        self._roots.clear()
+
+
+def default_timings_path() -> str:
+    """Timing history file: $LOPS_BUILD_TIMINGS, else the Houdini user pref dir (or home)."""
+    path = os.environ.get(TIMINGS_ENV)
+    if path:
+        return path
+    base = os.environ.get("HOUDINI_USER_PREF_DIR") or os.path.expanduser("~")
+    return os.path.join(base, TIMINGS_FILE_NAME)
+
+
+@dataclass
+class TimingHistory:
+    """Moving averages of build timings, persisted between sessions"""
+    seconds_per_material: float = 0.5
+    seconds_per_asset: float = 5.0  # Build time outside material creation
+    samples: int = 0
+    path: str = field(default="", repr=False, compare=False)
+
+    # Weight of a new sample in the moving average (the first samples weigh more)
+    SMOOTHING = 0.2
+
+    @classmethod
+    def load(cls, path: str = "") -> "TimingHistory":
+        path = path or default_timings_path()
+        history = cls(path=path)
+        if not os.path.exists(path):
+            return history
+        try:
+            with open(path, "r") as f:
+                data = json.load(f) or {}
+            history.seconds_per_material = float(data.get("seconds_per_material", history.seconds_per_material))
+            history.seconds_per_asset = float(data.get("seconds_per_asset", history.seconds_per_asset))
+            history.samples = int(data.get("samples", 0))
+        except (OSError, ValueError, TypeError) as e:
+            print(f"Warning: Could not read build timings from {path}: {e}")
+        return history
+
+    def save(self) -> bool:
+        path = self.path or default_timings_path()
+        data = asdict(self)
+        data.pop("path", None)
+        data["updated"] = time.strftime("%Y-%m-%d %H:%M:%S")
+        try:
+            with open(path, "w") as f:
+                json.dump(data, f, indent=2)
+            return True
+        except OSError as e:
+            print(f"Warning: Could not save build timings to {path}: {e}")
+            return False
+
+    def record(self, materials: int, material_seconds: float, total_seconds: float):
+        """
+        Fold one finished asset build into the averages.
+
+        Args:
+            materials: Materials created by the build
+            material_seconds: Time spent in the material variant phases
+            total_seconds: Total build time of the asset
+        """
+        if total_seconds <= 0:
+            return
+        weight = max(self.SMOOTHING, 1.0 / (self.samples + 1))
+        if materials > 0 and material_seconds > 0:
+            per_material = material_seconds / materials
+            self.seconds_per_material += weight * (per_material - self.seconds_per_material)
+        overhead = max(0.0, total_seconds - max(0.0, material_seconds))
+        self.seconds_per_asset += weight * (overhead - self.seconds_per_asset)
+        self.samples += 1
+
+    def estimate(self, materials: int, assets: int = 1) -> float:
+        """Estimated seconds to build `assets` assets creating `materials` materials in total."""
+        return max(0, materials) * self.seconds_per_material + max(0, assets) * self.seconds_per_asset
+
+
+def material_seconds(build_plan) -> float:
+    """Seconds a finished BuildPlan spent in its material variant phases."""
+    if build_plan is None:
+        return 0.0
+    return sum(seconds for name, seconds in build_plan.phase_timings
+               if name.startswith("material_variant:"))
+
+
+def format_duration(seconds: float) -> str:
+    """Short human-readable duration (e.g. "42s", "3m 05s", "1h 12m")."""
+    seconds = int(round(max(0.0, seconds)))
+    if seconds < 60:
+        return f"{seconds}s"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes}m {seconds:02d}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes:02d}m"
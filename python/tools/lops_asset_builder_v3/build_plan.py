@@ -0,0 +1,157 @@
+"""
+Build plan for LOPS Asset Builder v3.
+
+A BuildPlan spells out what build_geo_and_mtl_variants will do for one asset:
+which geometry files are imported, which material-variant folders get a
+material library, and the material names expected from the geometry. The
+geometry analysis runs once and is shared by every material variant, so each
+variant only does its own texture-folder work.
+
+The plan also records how long each build phase took, so the per-phase cost
+of an asset build can be inspected after the fact. Plan phases are also
+phases of the active BuildProfiler, if any (see build_profiler).
+
+Usage:
+    from tools.lops_asset_builder_v3.build_plan import BuildPlan
+
+    plan = BuildPlan.from_inputs("MyAsset", "/geo/asset.fbx", mtl_variants=["/tex/jpg1k"],
+                                 folder_textures="/tex/png4k")
+    build_geo_and_mtl_variants(..., plan=plan)
+    print(plan.describe())
+"""
+
+from __future__ import annotations
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from tools.lops_asset_builder_v3.build_profiler import profile_phase
+
+
+@dataclass(frozen=True)
+class GeometryInput:
+    """One geometry file to import as a componentgeometry node."""
+    file_path: str
+    folder: str
+    name: str
+    extension: str
+
+    @classmethod
+    def from_path(cls, asset_path: str) -> "GeometryInput":
+        """Split an asset path into folder, name and extension (bgeo.sc aware)."""
+        file_path = asset_path.split(";")[0]
+        folder, filename = os.path.split(file_path)
+        name = filename.split(".")[0]
+        extension = "bgeo.sc" if filename.endswith("bgeo.sc") else filename.split(".")[-1]
+        return cls(file_path=file_path, folder=folder, name=name, extension=extension)
+
+
+@dataclass(frozen=True)
+class MaterialVariantInput:
+    """One texture folder that becomes a material library / material variant."""
+    folder: str
+
+    @property
+    def name(self) -> str:
+        return os.path.basename(self.folder)
+
+
+@dataclass
+class BuildPlan:
+    """Inspectable, timeable plan for one build_geo_and_mtl_variants call."""
+    node_name: str
+    geometry: List[GeometryInput]
+    material_variants: List[MaterialVariantInput]
+    lowercase_material_names: bool = False
+    material_names: Optional[List[str]] = None
+    phase_timings: List[Tuple[str, float]] = field(default_factory=list)
+    layout_report: Optional[Any] = None  # modules.layout_scheduler.LayoutReport, set after the build
+
+    @classmethod
+    def from_inputs(cls, node_name: str, main_asset_file_path: str,
+                    asset_variants: Optional[List[str]] = None,
+                    create_geo_variants: bool = True,
+                    mtl_variants: Optional[List[str]] = None,
+                    folder_textures: str = "",
+                    lowercase_material_names: bool = False) -> "BuildPlan":
+        """Build a plan from the same inputs build_geo_and_mtl_variants takes."""
+        assets = [main_asset_file_path]
+        if create_geo_variants:
+            assets += list(asset_variants or [])
+
+        # Material variants list (mtl_variants + main textures at end)
+        mtl_folders = list(mtl_variants or [])
+        if folder_textures:
+            mtl_folders.append(folder_textures)
+
+        return cls(
+            node_name=node_name,
+            geometry=[GeometryInput.from_path(a) for a in assets],
+            material_variants=[MaterialVariantInput(f) for f in mtl_folders],
+            lowercase_material_names=lowercase_material_names,
+        )
+
+    @property
+    def has_geo_variants(self) -> bool:
+        return len(self.geometry) > 1
+
+    @property
+    def asset_paths(self) -> List[str]:
+        return [g.file_path for g in self.geometry]
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a build phase and record it in phase_timings."""
+        start = time.perf_counter()
+        try:
+            with profile_phase(name):
+                yield
+        finally:
+            self.phase_timings.append((name, time.perf_counter() - start))
+
+    def resolve_material_names(self, extractor: Callable[..., List[str]]) -> List[str]:
+        """Run geometry material analysis once; later calls return the cached names.
+
+        Args:
+            extractor: Callable(asset_paths, lowercase=...) returning material names
+        """
+        if self.material_names is None:
+            with self.phase("geometry_analysis"):
+                self.material_names = list(extractor(self.asset_paths, lowercase=self.lowercase_material_names))
+        return self.material_names
+
+    def timings_by_phase(self) -> Dict[str, float]:
+        """Total seconds per phase name."""
+        totals: Dict[str, float] = {}
+        for name, seconds in self.phase_timings:
+            totals[name] = totals.get(name, 0.0) + seconds
+        return totals
+
+    def to_dict(self) -> Dict:
+        return {
+            "node_name": self.node_name,
+            "geometry": [g.file_path for g in self.geometry],
+            "material_variants": [m.folder for m in self.material_variants],
+            "material_names": self.material_names,
+            "phase_timings": self.timings_by_phase(),
+            "layout": asdict(self.layout_report) if self.layout_report is not None else None,
+        }
+
+    def describe(self) -> str:
+        """Human-readable plan with per-phase timings (if the plan has run)."""
+        lines = [f"Build plan: {self.node_name}"]
+        lines.append(f"  Geometry ({len(self.geometry)}):")
+        lines.extend(f"    - {g.name}.{g.extension}" for g in self.geometry)
+        lines.append(f"  Material variants ({len(self.material_variants)}):")
+        lines.extend(f"    - {m.name}" for m in self.material_variants)
+        if self.material_names is not None:
+            lines.append(f"  Expected materials: {len(self.material_names)}")
+        if self.phase_timings:
+            lines.append("  Phase timings:")
+            for name, seconds in self.timings_by_phase().items():
+                lines.append(f"    {name:<32} {seconds:8.3f}s")
+        if self.layout_report is not None:
+            lines.append(f"  {self.layout_report.summary()}")
+        return "\n".join(lines)
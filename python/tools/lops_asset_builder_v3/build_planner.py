@@ -0,0 +1,365 @@
+"""
+Houdini-free build planner for LOPS Asset Builder v3.
+
+Checking a batch of configs used to need Houdini: AssetBuilderConfig, the
+material validator and texture detection all lived in modules importing hou.
+The planner only uses the Houdini-free parts of the builder (asset_config,
+BuildPlan, the tex_to_mtlx naming rules through MaterialIndex), so a batch
+can be checked with plain Python on any machine before a Houdini session or
+license is spent on it.
+
+For every config it produces an AssetPlan:
+    - every input file resolved (main geometry, geometry variants, texture
+      folders), with missing ones reported as errors
+    - the BuildPlan the builder would follow
+    - the materials each material variant creates, and the geometry materials
+      missing a texture set in that folder
+    - estimated node counts per part of the build
+
+Geometry material names are read without Houdini for .obj (usemtl) and ASCII
+.usda (material:binding) files; other formats are reported as not checked,
+and their variants plan every material found in the texture folders.
+
+Configs are planned in parallel threads sharing one MaterialIndex, so kits
+whose assets share texture folders list each folder once.
+
+Usage:
+    python -m tools.lops_asset_builder_v3.build_planner configs/ --jobs 16 --json plan.json
+
+    from tools.lops_asset_builder_v3.build_planner import plan_configs
+    plans = plan_configs(load_config_items(collect_config_files(["configs/"])))
+    broken = [p for p in plans if not p.ok]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import MISSING, asdict, dataclass, field, fields
+from typing import Dict, List, Optional, Set
+
+from modules.misc_utils import MaterialNamingConfig, slugify
+from tools.lops_asset_builder_v3.asset_config import AssetBuilderConfig, collect_config_files, load_config_items
+from tools.lops_asset_builder_v3.build_estimator import MaterialIndex
+from tools.lops_asset_builder_v3.build_plan import BuildPlan
+
+# Nodes created by the builder pieces (including the children they create)
+COMPONENT_OUTPUT_NODES = {True: 110, False: 1}  # componentoutput_custom / stock componentoutput
+COMPONENT_MATERIAL_NODES = 8  # build_component_material_custom: subnet + 7 nodes
+MATERIAL_BASE_NODES = 5  # MaterialX builder subnet, standard surface, displacement, 2 output connectors
+PLACE2D_NODES = 5  # texcoord, scale/rotation/offset constants, place2d (non-UDIM textures)
+EXTRA_TEXTURE_NODES = {"normal": 1, "nor": 1, "nrm": 1, "nrml": 1, "norm": 1, "bump": 1, "bmp": 1}
+LOOKDEV_NODES = 2 + 1 + 29 + 4 + 2  # scope + graft, lookdev switch + subnet, camera/lights xforms, karma
+LIGHT_RIG_NODES = 2 + 3  # graft + switch, three point light rig
+ENV_LIGHT_NODES = 3  # graft + 2 switches, plus one dome light per HDRI
+
+# Geometry formats whose material names can be read without Houdini
+_OBJ_MATERIAL = re.compile(r'^\s*usemtl\s+(\S+)', re.MULTILINE)
+_USDA_BINDING = re.compile(r'rel\s+material:binding\s*=\s*<([^>]+)>')
+
+
+@dataclass
+class VariantPlan:
+    """What one material-variant folder contributes to a build"""
+    folder: str
+    exists: bool
+    role: str = "library"  # "library": own material library, "texture": texture path overrides only
+    materials: List[str] = field(default_factory=list)  # Materials created (or overridden) from the folder
+    textures: int = 0  # Texture maps used by those materials
+    missing_textures: List[str] = field(default_factory=list)  # Geometry materials without a texture set here
+
+
+@dataclass
+class AssetPlan:
+    """Houdini-free plan and check of one asset config"""
+    config_file: str
+    index: int
+    asset_name: str = ""
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    geometry_materials: Optional[List[str]] = None  # None when the geometry could not be read
+    variants: List[VariantPlan] = field(default_factory=list)
+    node_counts: Dict[str, int] = field(default_factory=dict)
+    build_plan: Optional[BuildPlan] = None
+    duration: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    @property
+    def missing_textures(self) -> int:
+        return sum(len(v.missing_textures) for v in self.variants)
+
+    def to_dict(self) -> Dict:
+        data = asdict(self)
+        data["build_plan"] = self.build_plan.to_dict() if self.build_plan is not None else None
+        data["ok"] = self.ok
+        return data
+
+    def summary(self) -> str:
+        status = "OK  " if self.ok else "FAIL"
+        line = (f"{status} {self.asset_name or '?'}: {len(self.variants)} variants, "
+                f"{sum(len(v.materials) for v in self.variants if v.role == 'library')} materials, "
+                f"{self.node_counts.get('total', 0)} nodes")
+        if self.missing_textures:
+            line += f", {self.missing_textures} missing texture sets"
+        if self.errors:
+            line += " - " + "; ".join(self.errors)
+        return line
+
+
+def _config_defaults() -> Dict:
+    defaults = {}
+    for f in fields(AssetBuilderConfig):
+        if f.default is not MISSING:
+            defaults[f.name] = f.default
+        elif f.default_factory is not MISSING:
+            defaults[f.name] = f.default_factory()
+    return defaults
+
+
+def read_geometry_material_names(path: str, lowercase: bool = False) -> Optional[List[str]]:
+    """
+    Material names of a geometry file, read without Houdini.
+
+    Mirrors _extract_material_names: shop-style material paths are slugified,
+    USD binding targets keep their prim name.
+
+    Args:
+        path: Geometry file path
+        lowercase: Lowercase the slugified names
+
+    Returns:
+        list: Sorted material names, or None if the format cannot be read without Houdini
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in (".obj", ".usda"):
+        return None
+    try:
+        with open(path, "r", errors="replace") as f:
+            text = f.read()
+    except OSError as e:
+        print(f"Warning: Could not read geometry {path}: {e}")
+        return None
+    if extension == ".obj":
+        names = {slugify(os.path.basename(m), lowercase=lowercase) for m in _OBJ_MATERIAL.findall(text)}
+    else:
+        names = {os.path.basename(m.rstrip("/")) for m in _USDA_BINDING.findall(text)}
+    return sorted(n for n in names if n)
+
+
+def _material_nodes(texture_types: Set[str]) -> int:
+    """Nodes of one MaterialX material built from the given texture types."""
+    return (MATERIAL_BASE_NODES + PLACE2D_NODES + len(texture_types)
+            + sum(EXTRA_TEXTURE_NODES.get(t, 0) for t in texture_types))
+
+
+def plan_config(config: Dict, config_file: str = "", index: int = 0,
+                material_index: Optional[MaterialIndex] = None) -> AssetPlan:
+    """
+    Plan and check one asset config without Houdini.
+
+    Args:
+        config: Asset builder config dict (see AssetBuilderConfig)
+        config_file: File the config came from (reporting only)
+        index: Index of the config in its file
+        material_index: Shared texture folder index (a new one if None)
+
+    Returns:
+        AssetPlan: errors for missing inputs, the build plan, materials per variant and node counts
+    """
+    start = time.perf_counter()
+    plan = AssetPlan(config_file=config_file, index=index)
+    material_index = material_index or MaterialIndex()
+    cfg = _config_defaults()
+    unknown = sorted(set(config) - set(cfg) - {"main_asset_file_path", "folder_textures"})
+    if unknown:
+        plan.warnings.append(f"Unknown config keys ignored: {', '.join(unknown)}")
+    cfg.update({k: v for k, v in config.items() if k not in unknown})
+
+    main_asset = cfg.get("main_asset_file_path") or ""
+    folder_textures = cfg.get("folder_textures") or ""
+    plan.asset_name = cfg.get("asset_name") or AssetBuilderConfig._derive_asset_name(main_asset)
+
+    # Resolve every input (the builder would stop at the first missing one)
+    if not main_asset:
+        plan.errors.append("Missing main_asset_file_path")
+    elif not os.path.isfile(main_asset):
+        plan.errors.append(f"Main asset file does not exist: {main_asset}")
+    if not folder_textures:
+        plan.errors.append("Missing folder_textures")
+    elif not os.path.isdir(folder_textures):
+        plan.errors.append(f"Texture folder does not exist: {folder_textures}")
+    if cfg["create_geo_variants"]:
+        for variant in cfg["asset_variants"]:
+            if not os.path.isfile(variant.split(";")[0]):
+                plan.errors.append(f"Geometry variant does not exist: {variant}")
+    for folder in cfg["mtl_variants"]:
+        if not os.path.isdir(folder):
+            plan.errors.append(f"Material variant folder does not exist: {folder}")
+    if not main_asset:
+        plan.duration = time.perf_counter() - start
+        return plan
+
+    build_plan = plan.build_plan = BuildPlan.from_inputs(
+        node_name=plan.asset_name,
+        main_asset_file_path=main_asset,
+        asset_variants=cfg["asset_variants"],
+        create_geo_variants=cfg["create_geo_variants"],
+        mtl_variants=cfg["mtl_variants"],
+        folder_textures=folder_textures,
+        lowercase_material_names=cfg["lowercase_material_names"],
+    )
+    naming_config = MaterialNamingConfig.from_ui(lowercase=bool(cfg["lowercase_material_names"]))
+
+    # Geometry materials (only for formats readable without Houdini)
+    geometry_materials: Optional[Set[str]] = set()
+    for path in build_plan.asset_paths:
+        if not os.path.isfile(path):
+            continue
+        names = read_geometry_material_names(path, lowercase=naming_config.lowercase)
+        if names is None:
+            geometry_materials = None
+            break
+        geometry_materials.update(names)
+    if geometry_materials is None:
+        plan.warnings.append("Geometry materials not checked (format needs Houdini)")
+    else:
+        plan.geometry_materials = sorted(geometry_materials)
+        build_plan.material_names = plan.geometry_materials
+
+    # Material variants, as build_geo_and_mtl_variants builds them
+    library_variants = build_plan.material_variants
+    texture_variants = []
+    if cfg["texture_variants_only"] and len(library_variants) > 1:
+        library_variants, texture_variants = library_variants[-1:], library_variants[:-1]
+
+    material_nodes = 0
+    for role, variants in (("library", library_variants), ("texture", texture_variants)):
+        for variant in variants:
+            variant_plan = VariantPlan(folder=variant.folder, exists=os.path.isdir(variant.folder), role=role)
+            plan.variants.append(variant_plan)
+            if not variant_plan.exists:
+                continue
+            types = material_index.texture_types(variant.folder, naming_config)
+            if not types:
+                plan.warnings.append(f"No texture sets in {variant.folder}; template materials would be created")
+            names = set(types)
+            # The builder only creates the materials the geometry uses (all of them if it uses none)
+            if geometry_materials:
+                names &= geometry_materials
+                variant_plan.missing_textures = sorted(geometry_materials - set(types))
+            variant_plan.materials = sorted(names)
+            variant_plan.textures = sum(len(types[n]) for n in names)
+            if role == "library":
+                material_nodes += sum(_material_nodes(types[n]) for n in names)
+
+    # Estimated nodes, per part of the build
+    geometry_count = len(build_plan.geometry)
+    counts = {
+        "component_output": COMPONENT_OUTPUT_NODES[bool(cfg["use_custom_component_output"])],
+        "geometry": geometry_count + (1 if geometry_count > 1 else 0),
+        "material_libraries": len(library_variants) * (1 + COMPONENT_MATERIAL_NODES) + (1 if texture_variants else 0),
+        "materials": material_nodes,
+        "lookdev": 0,
+    }
+    if cfg["create_lookdev"] and not cfg["publish_only"]:
+        counts["lookdev"] = LOOKDEV_NODES
+        if cfg["create_light_rig"]:
+            counts["lookdev"] += LIGHT_RIG_NODES
+        if cfg["enable_env_lights"]:
+            counts["lookdev"] += ENV_LIGHT_NODES + max(1, len(cfg["env_light_paths"]))
+    counts["total"] = sum(counts.values())
+    plan.node_counts = counts
+    plan.duration = time.perf_counter() - start
+    return plan
+
+
+def plan_configs(items: List[tuple], jobs: Optional[int] = None,
+                 material_index: Optional[MaterialIndex] = None) -> List[AssetPlan]:
+    """
+    Plan many configs in parallel.
+
+    Args:
+        items: (config_file, index, config dict or loading Exception), as from load_config_items
+        jobs: Worker threads (default: 4x CPU count, the work is mostly file system access)
+        material_index: Shared texture folder index (a new one if None)
+
+    Returns:
+        list: One AssetPlan per item, in input order
+    """
+    material_index = material_index or MaterialIndex()
+    jobs = jobs or min(64, (os.cpu_count() or 1) * 4)
+
+    def _plan(item) -> AssetPlan:
+        config_file, index, config = item
+        if isinstance(config, Exception):
+            return AssetPlan(config_file=config_file, index=index,
+                             errors=[f"Failed to load config file: {config}"])
+        try:
+            return plan_config(config, config_file, index, material_index)
+        except Exception as e:
+            return AssetPlan(config_file=config_file, index=index,
+                             errors=[f"Unexpected error: {e}"])
+
+    if jobs <= 1:
+        return [_plan(item) for item in items]
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(_plan, items))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point (plain Python, no Houdini needed).
+
+    Returns:
+        Exit code: 0 if every config is buildable, 1 if any has errors, 2 if no configs were found
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m tools.lops_asset_builder_v3.build_planner",
+        description="Check LOPS asset builder configs and plan their builds without Houdini",
+    )
+    parser.add_argument('configs', nargs='+',
+                        help='Config JSON files, folders of configs, or glob patterns')
+    parser.add_argument('--jobs', '-j', type=int, default=0,
+                        help='Worker threads (default: 4x CPU count)')
+    parser.add_argument('--json', default='', help='Write every plan to this JSON file')
+    parser.add_argument('--quiet', '-q', action='store_true', help='Only print failing configs and the summary')
+    args = parser.parse_args(argv)
+
+    config_files = collect_config_files(args.configs)
+    if not config_files:
+        print("Error: No config files found", file=sys.stderr)
+        return 2
+
+    start = time.perf_counter()
+    plans = plan_configs(load_config_items(config_files), jobs=args.jobs or None)
+    elapsed = time.perf_counter() - start
+
+    for plan in plans:
+        if not args.quiet or not plan.ok:
+            print(plan.summary())
+            for warning in plan.warnings:
+                if not args.quiet:
+                    print(f"     Warning: {warning}")
+
+    failed = sum(1 for p in plans if not p.ok)
+    print(f"\nPlanned {len(plans)} assets in {elapsed:.2f}s: {len(plans) - failed} OK, {failed} with errors, "
+          f"{sum(p.node_counts.get('total', 0) for p in plans)} nodes, "
+          f"{sum(p.missing_textures for p in plans)} missing texture sets")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump([p.to_dict() for p in plans], f, indent=2)
+        print(f"Plans written to {args.json}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,362 @@
+"""
+Opt-in per-phase profiler for LOPS Asset Builder v3.
+
+BuildResult only reports the total duration of a build, and BuildPlan only
+the wall time of a few top-level phases. A BuildProfiler records, for every
+phase of a build (geometry import, material name extraction, texture scan,
+material creation, layout, sticky notes, lookdev, ...):
+
+    seconds        Wall time spent in the phase itself (nested phases excluded)
+    hom_calls      Calls to HOM functions and to methods of the main hou classes
+    nodes_created  Nodes created, including the children a new node comes with
+
+HOM calls are counted by wrapping the public methods of the hou classes while
+a profiler is active; the wrappers are removed again when it stops. Counting
+adds a small cost to every HOM call, so compare profiled runs with profiled
+runs only.
+
+Builders open phases with profile_phase() (a context manager or a function
+decorator), which does nothing unless a profiler is active, so the build code
+needs no profiler argument (BuildPlan phases are profiled automatically).
+
+Usage:
+    from tools.lops_asset_builder_v3.build_profiler import BuildProfiler, profile_phase
+
+    with BuildProfiler("MyAsset") as profiler:
+        with profile_phase("texture_scan"):
+            ...
+    print(profiler.profile.describe())
+
+    # Aggregate the profiles of a batch run into <path>.json and <path>.txt
+    write_profile_report([r.profile for r in results], "/tmp/build_profile.json")
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import json
+import os
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import hou
+except ImportError:
+    # BuildPlan phases call profile_phase() in the Houdini-free build planner too
+    hou = None
+
+# hou classes whose public methods (and those of their hou base classes) are counted
+HOM_CLASSES = ("Node", "Parm", "ParmTuple", "Geometry", "Prim", "ParmTemplateGroup", "NetworkBox", "StickyNote")
+# hou module functions that are counted
+HOM_FUNCTIONS = ("node", "nodes", "pwd", "copyNodesTo", "selectedNodes")
+# Calls returning newly created node(s)
+NODE_CREATORS = ("createNode", "copyNodesTo", "copyItems")
+
+# Calls made outside any phase
+OTHER_PHASE = "other"
+
+_active: List["BuildProfiler"] = []
+_originals: Dict[Tuple[Any, str], Any] = {}
+_inside_hom = False
+
+
+@dataclass
+class PhaseProfile:
+    """Cost of one build phase"""
+    name: str
+    seconds: float = 0.0
+    hom_calls: int = 0
+    nodes_created: int = 0
+    runs: int = 0  # Times the phase was entered
+
+
+@dataclass
+class BuildProfile:
+    """Per-phase profile of one asset build"""
+    asset_name: str
+    total_seconds: float = 0.0
+    phases: Dict[str, PhaseProfile] = field(default_factory=dict)
+
+    @property
+    def hom_calls(self) -> int:
+        return sum(p.hom_calls for p in self.phases.values())
+
+    @property
+    def nodes_created(self) -> int:
+        return sum(p.nodes_created for p in self.phases.values())
+
+    def phase(self, name: str) -> PhaseProfile:
+        profile = self.phases.get(name)
+        if profile is None:
+            profile = self.phases[name] = PhaseProfile(name)
+        return profile
+
+    def to_dict(self) -> Dict:
+        return {
+            "asset_name": self.asset_name,
+            "total_seconds": self.total_seconds,
+            "hom_calls": self.hom_calls,
+            "nodes_created": self.nodes_created,
+            "phases": [asdict(p) for p in self.phases.values()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "BuildProfile":
+        profile = cls(asset_name=data.get("asset_name", ""), total_seconds=float(data.get("total_seconds", 0.0)))
+        for phase in data.get("phases", []):
+            profile.phases[phase["name"]] = PhaseProfile(**phase)
+        return profile
+
+    def describe(self) -> str:
+        """Text table of the phases, slowest first."""
+        lines = [f"Build profile: {self.asset_name} ({self.total_seconds:.3f}s, "
+                 f"{self.hom_calls} HOM calls, {self.nodes_created} nodes)"]
+        lines.append(f"  {'phase':<32} {'seconds':>9} {'HOM calls':>10} {'nodes':>7}")
+        for p in sorted(self.phases.values(), key=lambda p: p.seconds, reverse=True):
+            lines.append(f"  {p.name:<32} {p.seconds:9.3f} {p.hom_calls:10d} {p.nodes_created:7d}")
+        return "\n".join(lines)
+
+
+def _count_nodes(result) -> int:
+    """Nodes returned by a node-creating call, with the children they came with."""
+    nodes = result if isinstance(result, (tuple, list)) else (result,)
+    count = 0
+    for node in nodes:
+        if isinstance(node, hou.Node):
+            count += 1 + len(node.allSubChildren())
+    return count
+
+
+def _wrap(original, name: str):
+    creates_nodes = name in NODE_CREATORS
+
+    @functools.wraps(original)
+    def wrapper(*args, **kwargs):
+        global _inside_hom
+        # Calls made by a counted call (e.g. node callbacks) are part of it
+        if _inside_hom or not _active:
+            return original(*args, **kwargs)
+        _inside_hom = True
+        try:
+            result = original(*args, **kwargs)
+            phase = _active[-1].current_phase()
+            phase.hom_calls += 1
+            if creates_nodes:
+                phase.nodes_created += _count_nodes(result)
+        finally:
+            _inside_hom = False
+        return result
+
+    return wrapper
+
+
+def _install_hooks():
+    """Wrap the counted HOM methods and functions (once, while any profiler is active)."""
+    if hou is None:
+        return
+    targets = []
+    for class_name in HOM_CLASSES:
+        cls = getattr(hou, class_name, None)
+        if cls is None:
+            continue
+        for base in inspect.getmro(cls):
+            if base.__module__ != hou.__name__:
+                continue
+            for name, attr in list(vars(base).items()):
+                if not name.startswith("_") and inspect.isfunction(attr):
+                    targets.append((base, name, attr))
+    for name in HOM_FUNCTIONS:
+        function = getattr(hou, name, None)
+        if callable(function):
+            targets.append((hou, name, function))
+
+    for owner, name, original in targets:
+        if (owner, name) in _originals:
+            continue
+        try:
+            setattr(owner, name, _wrap(original, name))
+        except (AttributeError, TypeError):
+            print(f"Warning: Cannot count HOM calls to {getattr(owner, '__name__', owner)}.{name}")
+            continue
+        _originals[(owner, name)] = original
+
+
+def _remove_hooks():
+    for (owner, name), original in _originals.items():
+        setattr(owner, name, original)
+    _originals.clear()
+
+
+class BuildProfiler:
+    """
+    Records per-phase wall time, HOM calls and created nodes of one build.
+
+    Phases nest: time, calls and nodes are charged to the innermost open
+    phase, so the phases of a profile add up to the total.
+    """
+
+    def __init__(self, asset_name: str = ""):
+        self.profile = BuildProfile(asset_name)
+        self._stack: List[List] = []  # [PhaseProfile, start, seconds spent in nested phases]
+        self._start = 0.0
+
+    def current_phase(self) -> PhaseProfile:
+        if self._stack:
+            return self._stack[-1][0]
+        return self.profile.phase(OTHER_PHASE)
+
+    def start(self):
+        if not _active:
+            _install_hooks()
+        _active.append(self)
+        self._start = time.perf_counter()
+
+    def stop(self) -> BuildProfile:
+        """Stop profiling; time outside any phase is charged to the "other" phase."""
+        if self not in _active:
+            return self.profile
+        total = time.perf_counter() - self._start
+        _active.remove(self)
+        if not _active:
+            _remove_hooks()
+        self.profile.total_seconds = total
+        in_phases = sum(p.seconds for name, p in self.profile.phases.items() if name != OTHER_PHASE)
+        self.profile.phase(OTHER_PHASE).seconds = max(0.0, total - in_phases)
+        return self.profile
+
+    def __enter__(self) -> "BuildProfiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+    @contextmanager
+    def phase(self, name: str):
+        """Charge the block to a phase of this profiler."""
+        frame = [self.profile.phase(name), time.perf_counter(), 0.0]
+        self._stack.append(frame)
+        try:
+            yield frame[0]
+        finally:
+            self._stack.pop()
+            elapsed = time.perf_counter() - frame[1]
+            frame[0].seconds += elapsed - frame[2]
+            frame[0].runs += 1
+            if self._stack:
+                self._stack[-1][2] += elapsed
+
+
+@contextmanager
+def profile_phase(name: str):
+    """Charge the block to a phase of the active profiler (no-op when not profiling)."""
+    if not _active:
+        yield None
+        return
+    with _active[-1].phase(name) as phase:
+        yield phase
+
+
+def phase_group(name: str) -> str:
+    """Phase name without its per-asset detail ("material_variant:jpg1k" -> "material_variant")."""
+    return name.split(":", 1)[0]
+
+
+def aggregate_profiles(profiles: Iterable[BuildProfile | Dict], slowest: int = 10) -> Dict:
+    """
+    Aggregate the profiles of a batch run per phase.
+
+    Args:
+        profiles: BuildProfiles (or their to_dict()); None entries are skipped
+        slowest: Number of slowest assets to list
+
+    Returns:
+        dict: Batch totals, per-phase totals (slowest phase first) and the slowest assets
+    """
+    profiles = [BuildProfile.from_dict(p) if isinstance(p, dict) else p for p in profiles if p]
+    total_seconds = sum(p.total_seconds for p in profiles)
+    phases: Dict[str, Dict] = {}
+    for profile in profiles:
+        for p in profile.phases.values():
+            group = phase_group(p.name)
+            entry = phases.get(group)
+            if entry is None:
+                entry = phases[group] = {"phase": group, "seconds": 0.0, "hom_calls": 0, "nodes_created": 0,
+                                         "assets": 0, "max_seconds": 0.0, "max_asset": "", "_seen": set()}
+            entry["seconds"] += p.seconds
+            entry["hom_calls"] += p.hom_calls
+            entry["nodes_created"] += p.nodes_created
+            entry["_seen"].add(id(profile))
+            if p.seconds > entry["max_seconds"]:
+                entry["max_seconds"] = p.seconds
+                entry["max_asset"] = profile.asset_name
+
+    rows = sorted(phases.values(), key=lambda e: e["seconds"], reverse=True)
+    for entry in rows:
+        entry["assets"] = len(entry.pop("_seen"))
+        entry["mean_seconds"] = entry["seconds"] / entry["assets"]
+        entry["share"] = entry["seconds"] / total_seconds if total_seconds else 0.0
+
+    slowest_assets = []
+    for profile in sorted(profiles, key=lambda p: p.total_seconds, reverse=True)[:slowest]:
+        top = max(profile.phases.values(), key=lambda p: p.seconds, default=None)
+        slowest_assets.append({"asset_name": profile.asset_name, "seconds": profile.total_seconds,
+                               "slowest_phase": top.name if top else ""})
+
+    return {
+        "assets": len(profiles),
+        "total_seconds": total_seconds,
+        "hom_calls": sum(p.hom_calls for p in profiles),
+        "nodes_created": sum(p.nodes_created for p in profiles),
+        "phases": rows,
+        "slowest_assets": slowest_assets,
+    }
+
+
+def format_profile_report(report: Dict) -> str:
+    """Text table of an aggregate_profiles() report."""
+    lines = [f"Build profile: {report['assets']} assets, {report['total_seconds']:.2f}s, "
+             f"{report['hom_calls']} HOM calls, {report['nodes_created']} nodes"]
+    lines.append(f"{'phase':<24} {'total s':>10} {'share':>7} {'mean s':>9} {'max s':>9} "
+                 f"{'HOM calls':>11} {'nodes':>9}  slowest asset")
+    lines.append("-" * 100)
+    for e in report["phases"]:
+        lines.append(f"{e['phase']:<24} {e['seconds']:10.2f} {e['share']:7.1%} {e['mean_seconds']:9.3f} "
+                     f"{e['max_seconds']:9.3f} {e['hom_calls']:11d} {e['nodes_created']:9d}  {e['max_asset']}")
+    if report["slowest_assets"]:
+        lines.append("")
+        lines.append("Slowest assets:")
+        for a in report["slowest_assets"]:
+            lines.append(f"  {a['asset_name']:<40} {a['seconds']:9.2f}s  ({a['slowest_phase']})")
+    return "\n".join(lines)
+
+
+def write_profile_report(profiles: Iterable[BuildProfile | Dict], path: str) -> Optional[Dict]:
+    """
+    Write an aggregated profile report as JSON, with a text table next to it.
+
+    Args:
+        profiles: BuildProfiles (or their to_dict()) of a batch run
+        path: JSON report path; the table goes to the same path with a .txt extension
+
+    Returns:
+        dict: The report, or None if it could not be written
+    """
+    report = aggregate_profiles(profiles)
+    text_path = os.path.splitext(path)[0] + ".txt"
+    try:
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+        with open(text_path, "w") as f:
+            f.write(format_profile_report(report) + "\n")
+    except OSError as e:
+        print(f"Warning: Could not write build profile report to {path}: {e}")
+        return None
+    return report
@@ -0,0 +1,296 @@
+"""
+Geometry file name parsing for the batch asset builder.
+
+AssetScanner groups geometry files into assets by splitting each file name
+into a base name and a variant suffix (_high, _lod1, _B, _v2, ...), and
+orders the variants of a group. The batch dialog parses the same files again
+when it expands groups into one asset per file. Every caller used to re-run
+the suffix checks and regexes on each use, including once more inside the
+sort key.
+
+GeoVariantParser parses each file name once into an immutable GeoFileParse
+record (base, suffix, sort keys) and caches it by file name, so the scanner,
+the variant expansion and the config generator all share one parse.
+
+    python tools/lops_asset_builder_v3/geo_variant_parser.py 10000 [folder]
+
+runs a benchmark on 10k generated file names, or on the files of a folder.
+
+Usage:
+    parser = GeoVariantParser(suffixes, patterns)
+    record = parser.parse("PropCargo_B.fbx")
+    record.base, record.suffix      # ("PropCargo", "_B")
+    variants.sort(key=lambda f: parser.parse(f).sort_key)
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+_SINGLE_LETTER = re.compile(r'^_([A-Za-z])$')
+_NUMBERED = re.compile(r'^_(\d+)$')
+_VERSIONED = re.compile(r'^_v(\d+)$')
+_LOD = re.compile(r'^_lod(\d+)$')
+_LETTER_SUFFIX = re.compile(r'_[A-Za-z]$')
+
+_QUALITY_ORDER = {'_high': 0, '_mid': 1, '_low': 2}
+_KNOWN_SUFFIXES = ['_proxy', '_render', '_sim', '_hero', '_background']
+
+# Common variant suffixes to detect
+VARIANT_SUFFIXES = [
+    '_high', '_mid', '_low',           # LOD variants
+    '_lod0', '_lod1', '_lod2', '_lod3', # LOD numbered
+    '_proxy', '_render', '_sim',       # Purpose variants
+    '_hero', '_background',            # Quality variants
+    'High', 'Mid', 'Low',              # Capitalized
+    'LOD0', 'LOD1', 'LOD2',            # Capitalized LOD
+]
+
+# Additional patterns for single-letter and numbered variants
+# Will be checked separately with regex
+VARIANT_PATTERNS = [
+    r'_[A-Z]$',         # Single uppercase letter: _A, _B, _C
+    r'_[a-z]$',         # Single lowercase letter: _a, _b, _c
+    r'_v\d+$',          # Version numbered: _v1, _v2, _v3
+    r'_var\d+$',        # Variant numbered: _var1, _var2
+    r'_\d+$',           # Pure numbered: _1, _2, _3
+]
+
+
+@dataclass(frozen=True)
+class GeoFileParse:
+    """Parsed geometry file name."""
+    filename: str
+    stem: str           # File name without extension(s) (.bgeo.sc aware)
+    base: str           # Asset group name (scanner suffix rules)
+    suffix: str         # Variant suffix, "" for a main file
+    sort_key: tuple     # Order of the variants inside a group
+    letter_base: str    # Base name by the single-letter rule (_A, _b) used for variant expansion
+    letter_suffix: str
+    letter_sort_key: tuple  # Order of the files when a group is expanded to one asset per file
+
+
+def file_stem(filename: str) -> str:
+    """File name without extension(s), treating .bgeo.sc as one extension."""
+    if filename.lower().endswith('.bgeo.sc'):
+        return filename[:-8]  # .bgeo.sc is 8 characters
+    return os.path.splitext(filename)[0]
+
+
+def variant_sort_key(suffix: str, filename: str) -> tuple:
+    """
+    Deterministic variant order: letters, numbers, versions, quality, LOD,
+    known purpose suffixes, then anything else by file name.
+
+    When a group has no explicit main file, the first variant in this order
+    becomes the main, so _A, _B, _C picks _A.
+    """
+    s_low = suffix.lower()
+    # Single letter _A/_b
+    m = _SINGLE_LETTER.match(suffix)
+    if m:
+        return (0, ord(m.group(1).upper()) - ord('A'))
+    # Pure numbered _1
+    m = _NUMBERED.match(suffix)
+    if m:
+        return (1, int(m.group(1)))
+    # Versioned _v1
+    m = _VERSIONED.match(s_low)
+    if m:
+        return (2, int(m.group(1)))
+    # Quality _high/_mid/_low → High < Mid < Low
+    if s_low in _QUALITY_ORDER:
+        return (3, _QUALITY_ORDER[s_low])
+    # LOD _lodN
+    m = _LOD.match(s_low)
+    if m:
+        return (4, int(m.group(1)))
+    # Other known words get moderate priority by name
+    if s_low in _KNOWN_SUFFIXES:
+        return (5, _KNOWN_SUFFIXES.index(s_low))
+    # Fallback: lexicographic on full filename
+    return (9, filename.lower())
+
+
+class GeoVariantParser:
+    """Parses geometry file names with configurable suffixes/patterns, caching one record per name."""
+
+    def __init__(self, suffixes: Iterable[str], patterns: Iterable[str], cache: bool = True):
+        """
+        Args:
+            suffixes: Literal variant suffixes, checked in order
+            patterns: Regex variant patterns (searched in the name), checked after the suffixes
+            cache: Keep the parse records (disable only to measure the uncached cost)
+        """
+        self.suffixes: Tuple[str, ...] = tuple(s for s in suffixes if s)
+        compiled = []
+        for pattern in patterns:
+            try:
+                compiled.append(re.compile(pattern))
+            except re.error:
+                # Skip invalid regex patterns from config
+                print(f"Warning: Ignoring invalid geo variant pattern: {pattern}")
+        self.patterns: Tuple[re.Pattern, ...] = tuple(compiled)
+        self._cache: Optional[Dict[str, GeoFileParse]] = {} if cache else None
+
+    def split(self, stem: str) -> Tuple[str, str]:
+        """Split a name (without extension) into (base_name, suffix) by the scanner rules."""
+        # 1. Check for exact suffix matches first (most specific)
+        for suffix in self.suffixes:
+            if stem.endswith(suffix):
+                return (stem[:-len(suffix)].rstrip('_'), suffix)
+
+        # 2. Check for pattern-based variants (regex patterns)
+        for pattern in self.patterns:
+            match = pattern.search(stem)
+            if match:
+                return (stem[:match.start()].rstrip('_'), match.group(0))
+
+        # 3. No variant detected
+        return (stem, "")
+
+    def parse(self, filename: str) -> GeoFileParse:
+        """
+        Parse record of a geometry file.
+
+        Args:
+            filename: File name or path (only the base name is parsed)
+
+        Returns:
+            GeoFileParse: Cached record for the file name
+        """
+        filename = os.path.basename(filename)
+        if self._cache is not None:
+            record = self._cache.get(filename)
+            if record is not None:
+                return record
+
+        stem = file_stem(filename)
+        base, suffix = self.split(stem)
+
+        m = _LETTER_SUFFIX.search(stem)
+        if m:
+            letter_base, letter_suffix = stem[:m.start()], m.group(0)
+            letter_sort_key = (0, ord(letter_suffix[1].upper()) - ord('A'))
+        else:
+            # Files without suffix come first
+            letter_base, letter_suffix = stem, ""
+            letter_sort_key = (-1, filename.lower())
+
+        record = GeoFileParse(
+            filename=filename,
+            stem=stem,
+            base=base,
+            suffix=suffix,
+            sort_key=variant_sort_key(suffix, filename),
+            letter_base=letter_base,
+            letter_suffix=letter_suffix,
+            letter_sort_key=letter_sort_key,
+        )
+        if self._cache is not None:
+            self._cache[filename] = record
+        return record
+
+    def group(self, filenames: Iterable[str]) -> Dict[str, Dict]:
+        """
+        Group geometry files into assets by base name.
+
+        Args:
+            filenames: Geometry file names of one folder
+
+        Returns:
+            dict: base name -> {'main': file or None, 'variants': [files sorted by sort_key],
+                  'suffixes': [variant suffixes in input order]}
+        """
+        groups: Dict[str, Dict] = {}
+        for filename in filenames:
+            record = self.parse(filename)
+            data = groups.get(record.base)
+            if data is None:
+                data = groups[record.base] = {'main': None, 'variants': [], 'suffixes': []}
+
+            if record.suffix:
+                data['variants'].append(filename)
+                data['suffixes'].append(record.suffix)
+            elif data['main'] is None:
+                # No suffix = likely the main file
+                data['main'] = filename
+            else:
+                # Multiple files without suffix, treat as variants
+                data['variants'].append(filename)
+
+        for data in groups.values():
+            data['variants'].sort(key=lambda f: self.parse(f).sort_key)
+        return groups
+
+    def clear_cache(self):
+        if self._cache is not None:
+            self._cache.clear()
+
+
+def _generated_file_names(count: int) -> List[str]:
+    """Geometry file names mixing mains, letter, LOD, quality, version and numbered variants."""
+    suffixes = ["", "_B", "_C", "_lod0", "_lod1", "_high", "_low", "_v2", "_01", "_proxy"]
+    extensions = [".fbx", ".abc", ".usd", ".bgeo.sc"]
+    names = []
+    asset = 0
+    while len(names) < count:
+        for index, suffix in enumerate(suffixes[:2 + asset % (len(suffixes) - 1)]):
+            names.append(f"Prop{asset:05d}{suffix}{extensions[(asset + index) % len(extensions)]}")
+        asset += 1
+    return names[:count]
+
+
+def run_benchmark(count: int = 10000, folder: str = "") -> Dict[str, float]:
+    """
+    Time grouping geometry files with and without the parse cache, and the
+    re-parse done later by variant expansion and config generation.
+
+    Args:
+        count: Number of generated file names (ignored when folder is given)
+        folder: Optional folder whose geometry files are used instead
+
+    Returns:
+        dict: Label -> seconds
+    """
+    if folder:
+        filenames = sorted(f for f in os.listdir(folder) if os.path.isfile(os.path.join(folder, f)))
+    else:
+        filenames = _generated_file_names(count)
+
+    def _time(label, parser):
+        start = time.perf_counter()
+        groups = parser.group(filenames)
+        # Variant expansion and config generation parse every file again
+        for data in groups.values():
+            files = ([data['main']] if data['main'] else []) + data['variants']
+            files.sort(key=lambda f: parser.parse(f).letter_sort_key)
+            for f in files:
+                parser.parse(f).letter_base
+        timings[label] = time.perf_counter() - start
+
+    timings: Dict[str, float] = {}
+    _time("uncached", GeoVariantParser(VARIANT_SUFFIXES, VARIANT_PATTERNS, cache=False))
+    cached = GeoVariantParser(VARIANT_SUFFIXES, VARIANT_PATTERNS)
+    _time("cached (cold)", cached)
+    _time("cached (warm)", cached)
+
+    print("\n" + "=" * 60)
+    print(f"Geometry variant parsing benchmark ({len(filenames)} files)")
+    print("=" * 60)
+    for label, seconds in timings.items():
+        print(f"  {label:<15} {seconds * 1000:8.1f}ms")
+    print("=" * 60)
+
+    return timings
+
+
+if __name__ == "__main__":
+    import sys
+
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 10000,
+                  sys.argv[2] if len(sys.argv) > 2 else "")
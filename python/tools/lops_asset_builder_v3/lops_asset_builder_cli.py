@@ -21,14 +21,27 @@ Usage:
     # Batch build multiple assets
     configs = [config1, config2, config3]
     results = lops_asset_builder_cli.build_assets_batch(configs)
+
+    # From a shell, with hython (the folder containing `tools` on PYTHONPATH):
+    hython -m tools.lops_asset_builder_v3.lops_asset_builder_cli configs/ -o /library/build --jobs 4
+    hython -m tools.lops_asset_builder_v3.lops_asset_builder_cli "configs/**/*.json" --no-hip
+    hython -m tools.lops_asset_builder_v3.lops_asset_builder_cli configs/ --validate-only
+
+    One JSON line per asset is written to stdout (build logs go to stderr), and
+    the exit code is non-zero if any asset failed. See main().
 """
 
 from __future__ import annotations
 import os
+import sys
+import copy
 import json
 import time
+import argparse
+import contextlib
+import subprocess
+import threading
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, field, asdict
 
 import hou
 
@@ -38,119 +51,39 @@ from tools.lops_asset_builder_v3.lops_asset_builder_v3 import (
     create_organized_net_note,
     create_karma_nodes,
 )
+from tools.lops_asset_builder_v3.asset_config import AssetBuilderConfig, collect_config_files, load_config_items
+from tools.lops_asset_builder_v3.build_plan import BuildPlan
+from tools.lops_asset_builder_v3.material_validator import validate_kit
+from tools.lops_asset_builder_v3.build_profiler import (
+    BuildProfiler, BuildProfile, aggregate_profiles, format_profile_report, write_profile_report,
+)
+from tools.lops_asset_builder_v3.progress_events import (
+    ProgressBus, ProgressEvent, PhaseProgress, describe,
+    PHASE_START, PHASE_END, MATERIAL_CREATED, COUNTER, LOG,
+)
 from tools.lops_asset_builder_v3.subnet_lookdev_setup import create_subnet_lookdev_setup
 from tools.lops_asset_builder_v3.create_transform_nodes import (
     build_transform_camera_and_scene_node,
     build_lights_spin_xform,
 )
 from tools import lops_light_rig
-from modules.misc_utils import _sanitize
-
-
-@dataclass
-class AssetBuilderConfig:
-    """Configuration for LOPS Asset Builder command-line execution.
-
-    Required fields:
-        main_asset_file_path: Path to main geometry file
-        folder_textures: Path to texture folder
-
-    Optional fields with defaults:
-        asset_name: Asset name (auto-derived from file if not provided)
-        asset_variants: List of additional geometry variant file paths
-        asset_vset_name: Geometry variant set name
-        mtl_variants: List of material variant folder paths
-        mtl_vset_name: Material variant set name
-        create_lookdev: Enable lookdev setup
-        create_light_rig: Enable light rig creation
-        enable_env_lights: Enable environment lights
-        env_light_paths: List of HDRI paths for environment lights
-        create_network_boxes: Create network boxes around node groups (default: False)
-        skip_matchsize: Skip matchsize node creation in component geometry (default: False)
-        stage_context_path: Path to stage node (default: /stage)
-        verbose: Print detailed progress logs
-    """
-    # Required
-    main_asset_file_path: str
-    folder_textures: str
-
-    # Optional with defaults (all bool options default to False)
-    asset_name: str = ""
-    asset_variants: List[str] = field(default_factory=list)
-    create_geo_variants: bool = True
-    asset_vset_name: str = "geo_variant"
-    mtl_variants: List[str] = field(default_factory=list)
-    mtl_vset_name: str = "mtl_variant"
-    create_lookdev: bool = False
-    create_light_rig: bool = False
-    enable_env_lights: bool = False
-    env_light_paths: List[str] = field(default_factory=list)
-    create_network_boxes: bool = False
-    skip_matchsize: bool = False
-    stage_context_path: str = "/stage"
-    verbose: bool = True
-    lowercase_material_names: bool = False  # Default to False to preserve FBX naming
-    use_custom_component_output: bool = True
-
-    def __post_init__(self):
-        """Auto-derive asset name if not provided and validate paths."""
-        if not self.asset_name:
-            self.asset_name = self._derive_asset_name(self.main_asset_file_path)
-
-        # Validate required paths
-        if not os.path.isfile(self.main_asset_file_path):
-            raise ValueError(f"Main asset file does not exist: {self.main_asset_file_path}")
-        if not os.path.isdir(self.folder_textures):
-            raise ValueError(f"Texture folder does not exist: {self.folder_textures}")
-
-    @staticmethod
-    def _derive_asset_name(path: str) -> str:
-        """Derive asset name from file path."""
-        base = os.path.basename(path) if path else ""
-        if not base:
-            return "ASSET"
-        # Strip .bgeo.sc specially, otherwise strip last extension
-        if base.endswith(".bgeo.sc"):
-            base = base[:-len(".bgeo.sc")]
-        else:
-            if "." in base:
-                base = base.split(".")[0]
-        return base or "ASSET"
-
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "AssetBuilderConfig":
-        """Create config from dictionary."""
-        # Filter only known fields
-        valid_fields = {f.name for f in cls.__dataclass_fields__.values()}
-        filtered = {k: v for k, v in data.items() if k in valid_fields}
-        return cls(**filtered)
-
-    @classmethod
-    def from_json_file(cls, filepath: str) -> "AssetBuilderConfig":
-        """Load config from JSON file."""
-        with open(filepath, 'r') as f:
-            data = json.load(f)
-        return cls.from_dict(data)
-
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert config to dictionary."""
-        return asdict(self)
-
-    def to_json_file(self, filepath: str):
-        """Save config to JSON file."""
-        with open(filepath, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
+from modules.misc_utils import MaterialNamingConfig, _sanitize
+from modules.layout_scheduler import deferred_layout
 
 
 class ConsoleProgressReporter:
     """Simple console-based progress reporter for non-UI execution."""
 
-    def __init__(self, verbose: bool = True):
+    def __init__(self, verbose: bool = True, bus: Optional[ProgressBus] = None):
         self.verbose = verbose
         self._cancelled = False
         self._step = 0
         self._total = 100
         self._start_time = time.time()
+        self._phase = PhaseProgress()
+        # Builders publish typed events here (see progress_events)
+        self.events = bus or ProgressBus()
+        self.events.subscribe(self._on_event)
 
     def set_total(self, total: int):
         self._total = max(1, int(total))
@@ -167,6 +100,23 @@ class ConsoleProgressReporter:
         if self.verbose:
             print(f"  → {message}")
 
+    def _on_event(self, event: ProgressEvent):
+        if event.kind == PHASE_START:
+            self._phase.start(self._step, event, self._total)
+        elif event.kind in (MATERIAL_CREATED, COUNTER):
+            self._step = max(self._step, self._phase.value(event))
+        elif event.kind == PHASE_END:
+            self._step = max(self._step, self._phase.end())
+
+        message = describe(event)
+        if not message or not self.verbose:
+            return
+        if event.kind == LOG:
+            self.log(message)
+        else:
+            elapsed = time.time() - self._start_time
+            print(f"[{self._step}/{self._total}] ({elapsed:.1f}s) {message}")
+
     def is_cancelled(self) -> bool:
         return self._cancelled
 
@@ -183,18 +133,47 @@ class BuildResult:
     """Result of an asset builder execution."""
 
     def __init__(self, success: bool, message: str, output_node: Optional[hou.Node] = None,
-                 error: Optional[Exception] = None, duration: float = 0.0):
+                 error: Optional[Exception] = None, duration: float = 0.0,
+                 build_plan: Optional[BuildPlan] = None, output_path: Optional[str] = None,
+                 profile: Optional[BuildProfile] = None):
         self.success = success
         self.message = message
         self.output_node = output_node
         self.error = error
         self.duration = duration
+        self.build_plan = build_plan  # Plan with per-phase timings of the geo/mtl build
+        self.output_path = output_path  # USD written by a publish_only build
+        self.profile = profile  # Per-phase profile when the config enables profile
 
     def __repr__(self):
         status = "SUCCESS" if self.success else "FAILED"
         return f"BuildResult({status}: {self.message}, duration={self.duration:.2f}s)"
 
 
+def _create_publish_network(asset_name: str) -> hou.Node:
+    """Throwaway LOP network for a publish_only build."""
+    return hou.node("/obj").createNode("lopnet", _sanitize(f"publish_{asset_name}"))
+
+
+def publish_component_output(comp_out: hou.Node, publish_dir: str, asset_name: str) -> str:
+    """
+    Save a component output to disk with its own Save to Disk.
+
+    Args:
+        comp_out: componentoutput node
+        publish_dir: Output root; the asset is written to <publish_dir>/<asset_name>/
+        asset_name: Asset name
+
+    Returns:
+        The USD file path written
+    """
+    folder = os.path.join(publish_dir, _sanitize(asset_name)).replace(os.sep, "/")
+    os.makedirs(folder, exist_ok=True)
+    comp_out.parm("lopoutput").set(f'{folder}/`chs("filename")`')
+    comp_out.parm("execute").pressButton()
+    return comp_out.parm("lopoutput").eval()
+
+
 def build_asset(config: Dict[str, Any] | AssetBuilderConfig,
                 progress: Optional[ConsoleProgressReporter] = None) -> BuildResult:
     """
@@ -217,8 +196,17 @@ def build_asset(config: Dict[str, Any] | AssetBuilderConfig,
         result = build_asset(config)
         if result.success:
             print(f"Built asset: {result.output_node.path()}")
+
+    With publish_only, the asset is built in a throwaway LOP network that is
+    destroyed once the component USD is written; the result carries
+    output_path instead of output_node, so large batches leave the scene (and
+    memory) as they found it.
     """
     start_time = time.time()
+    plan = None
+    publish_net = None
+    profiler = None
+    profile = None
 
     try:
         # Convert dict to config object if needed
@@ -227,6 +215,11 @@ def build_asset(config: Dict[str, Any] | AssetBuilderConfig,
         else:
             cfg = config
 
+        if cfg.profile:
+            profiler = BuildProfiler(cfg.asset_name)
+            profile = profiler.profile  # Completed in place when the profiler stops
+            profiler.start()
+
         # Create progress reporter if not provided
         if progress is None:
             progress = ConsoleProgressReporter(verbose=cfg.verbose)
@@ -236,7 +229,10 @@ def build_asset(config: Dict[str, Any] | AssetBuilderConfig,
 
         # Validate stage context
         progress.step("Validating stage context")
-        stage_context = hou.node(cfg.stage_context_path)
+        if cfg.publish_only:
+            stage_context = publish_net = _create_publish_network(cfg.asset_name)
+        else:
+            stage_context = hou.node(cfg.stage_context_path)
         if stage_context is None:
             raise ValueError(f"Stage context not found: {cfg.stage_context_path}")
 
@@ -245,28 +241,62 @@ def build_asset(config: Dict[str, Any] | AssetBuilderConfig,
 
         # Build geometry and material variants
         progress.step("Building geometry and material variants")
-        geometry_variants_node, comp_out, nodes_to_layout, comp_material_last = build_geo_and_mtl_variants(
-            stage_context=stage_context,
+        plan = BuildPlan.from_inputs(
             node_name=cfg.asset_name,
             main_asset_file_path=cfg.main_asset_file_path,
             asset_variants=cfg.asset_variants,
             create_geo_variants=cfg.create_geo_variants,
-            asset_vset_name=cfg.asset_vset_name,
             mtl_variants=cfg.mtl_variants,
             folder_textures=cfg.folder_textures,
-            mtl_vset_name=cfg.mtl_vset_name,
-            skip_matchsize=cfg.skip_matchsize,
-            progress=progress,
             lowercase_material_names=cfg.lowercase_material_names,
-            use_custom_component_output=cfg.use_custom_component_output,
         )
+        # Nobody looks at a publish network: drop its layout requests (otherwise the
+        # builder lays its networks out with its own scheduler)
+        with deferred_layout(discard=True) if cfg.publish_only else contextlib.nullcontext():
+            geometry_variants_node, comp_out, nodes_to_layout, comp_material_last = build_geo_and_mtl_variants(
+                stage_context=stage_context,
+                node_name=cfg.asset_name,
+                main_asset_file_path=cfg.main_asset_file_path,
+                asset_variants=cfg.asset_variants,
+                create_geo_variants=cfg.create_geo_variants,
+                asset_vset_name=cfg.asset_vset_name,
+                mtl_variants=cfg.mtl_variants,
+                folder_textures=cfg.folder_textures,
+                mtl_vset_name=cfg.mtl_vset_name,
+                skip_matchsize=cfg.skip_matchsize,
+                progress=progress,
+                lowercase_material_names=cfg.lowercase_material_names,
+                use_custom_component_output=cfg.use_custom_component_output,
+                plan=plan,
+                layout_grid_threshold=cfg.layout_grid_threshold,
+                texture_variants_only=cfg.texture_variants_only,
+                texture_vset_name=cfg.texture_vset_name,
+            )
+        if cfg.verbose:
+            print(plan.describe())
 
         if progress.is_cancelled():
             raise KeyboardInterrupt("Cancelled by user")
 
+        if publish_net is not None:
+            progress.step("Publishing component USD")
+            publish_dir = cfg.publish_dir or hou.text.expandString("$HIP/usd/assets")
+            with plan.phase("publish"):
+                output_path = publish_component_output(comp_out, publish_dir, cfg.asset_name)
+            progress.mark_finished("Done")
+            return BuildResult(
+                success=True,
+                message=f"Asset published: {output_path}",
+                duration=time.time() - start_time,
+                build_plan=plan,
+                output_path=output_path,
+                profile=profile
+            )
+
         # Layout nodes
         progress.step("Organizing network layout")
-        stage_context.layoutChildren(nodes_to_layout)
+        with plan.phase("layout"):
+            stage_context.layoutChildren(nodes_to_layout)
 
         if progress.is_cancelled():
             raise KeyboardInterrupt("Cancelled by user")
@@ -286,141 +316,144 @@ def build_asset(config: Dict[str, Any] | AssetBuilderConfig,
                 success=True,
                 message=f"Asset built successfully (no lookdev): {comp_out.path()}",
                 output_node=comp_out,
-                duration=duration
+                duration=duration,
+                build_plan=plan,
+                profile=profile
             )
 
-        # Lookdev setup
-        progress.step("Creating lookdev scope and graft stages")
-        lookdev_setup_layout = []
-
-        # Create primitive scope node
-        primitive_node = stage_context.createNode("primitive", _sanitize(f"{cfg.asset_name}_geo"))
-        primitive_node.parm("primpath").set("/turntable/asset/\n/turntable/lookdev/\n/turntable/lights/")
-        primitive_node.parm("parentprimtype").set("UsdGeomScope")
-
-        # Create graftstage for asset
-        graftstage_asset_node = stage_context.createNode("graftstages", "graftstage_asset")
-        graftstage_asset_node.parm("primpath").set("/turntable/asset")
-        graftstage_asset_node.parm("destpath").set("/")
-        graftstage_asset_node.setInput(0, primitive_node)
-        graftstage_asset_node.setInput(1, comp_out)
-
-        current_stream = graftstage_asset_node
-
-        # Light rig
-        if cfg.create_light_rig:
-            progress.step("Building light rig")
-            if progress.is_cancelled():
-                raise KeyboardInterrupt("Cancelled by user")
-
-            graftstage_lights_node = stage_context.createNode("graftstages", "graftstage_lights_rig")
-            graftstage_lights_node.parm("primpath").set("/turntable/")
-            graftstage_lights_node.parm("destpath").set("/")
-            graftstage_lights_node.setInput(0, current_stream)
-
-            light_rig_nodes_to_layout, light_mixer = lops_light_rig.create_three_point_light(selected_node=comp_out)
-
-            if progress.is_cancelled():
-                raise KeyboardInterrupt("Cancelled by user")
-
-            create_organized_net_note("Light Rig", light_rig_nodes_to_layout, hou.Vector2(5, 10), create_network_boxes=cfg.create_network_boxes)
-
-            graftstage_lights_node.setInput(1, light_mixer)
-
-            switch_lights_rig_node = stage_context.createNode("switch", "switch_lights_rig")
-            switch_lights_rig_node.setInput(0, current_stream)
-            switch_lights_rig_node.setInput(1, graftstage_lights_node)
-            switch_lights_rig_node.parm("input").set(1)
-            lookdev_setup_layout.extend([switch_lights_rig_node, graftstage_lights_node])
-
-            current_stream = switch_lights_rig_node
-
-        # Environment lights
-        if cfg.enable_env_lights:
-            progress.step("Creating environment lights")
-            graftstage_envlights_node = stage_context.createNode("graftstages", "graftstage_envlights")
-            graftstage_envlights_node.parm("primpath").set("/turntable/lights")
-            graftstage_envlights_node.parm("destpath").set("/")
-            graftstage_envlights_node.setInput(0, current_stream)
-
-            domes = []
-            if cfg.env_light_paths:
-                for idx, path in enumerate(cfg.env_light_paths):
-                    base = os.path.splitext(os.path.basename(path))[0]
-                    dome = stage_context.createNode("domelight::3.0", _sanitize(f"{base or 'env_light'}_{idx+1}"))
+        with plan.phase("lookdev"):
+            # Lookdev setup
+            progress.step("Creating lookdev scope and graft stages")
+            lookdev_setup_layout = []
+
+            # Create primitive scope node
+            primitive_node = stage_context.createNode("primitive", _sanitize(f"{cfg.asset_name}_geo"))
+            primitive_node.parm("primpath").set("/turntable/asset/\n/turntable/lookdev/\n/turntable/lights/")
+            primitive_node.parm("parentprimtype").set("UsdGeomScope")
+
+            # Create graftstage for asset
+            graftstage_asset_node = stage_context.createNode("graftstages", "graftstage_asset")
+            graftstage_asset_node.parm("primpath").set("/turntable/asset")
+            graftstage_asset_node.parm("destpath").set("/")
+            graftstage_asset_node.setInput(0, primitive_node)
+            graftstage_asset_node.setInput(1, comp_out)
+
+            current_stream = graftstage_asset_node
+
+            # Light rig
+            if cfg.create_light_rig:
+                progress.step("Building light rig")
+                if progress.is_cancelled():
+                    raise KeyboardInterrupt("Cancelled by user")
+
+                graftstage_lights_node = stage_context.createNode("graftstages", "graftstage_lights_rig")
+                graftstage_lights_node.parm("primpath").set("/turntable/")
+                graftstage_lights_node.parm("destpath").set("/")
+                graftstage_lights_node.setInput(0, current_stream)
+
+                light_rig_nodes_to_layout, light_mixer = lops_light_rig.create_three_point_light(selected_node=comp_out)
+
+                if progress.is_cancelled():
+                    raise KeyboardInterrupt("Cancelled by user")
+
+                create_organized_net_note("Light Rig", light_rig_nodes_to_layout, hou.Vector2(5, 10), create_network_boxes=cfg.create_network_boxes)
+
+                graftstage_lights_node.setInput(1, light_mixer)
+
+                switch_lights_rig_node = stage_context.createNode("switch", "switch_lights_rig")
+                switch_lights_rig_node.setInput(0, current_stream)
+                switch_lights_rig_node.setInput(1, graftstage_lights_node)
+                switch_lights_rig_node.parm("input").set(1)
+                lookdev_setup_layout.extend([switch_lights_rig_node, graftstage_lights_node])
+
+                current_stream = switch_lights_rig_node
+
+            # Environment lights
+            if cfg.enable_env_lights:
+                progress.step("Creating environment lights")
+                graftstage_envlights_node = stage_context.createNode("graftstages", "graftstage_envlights")
+                graftstage_envlights_node.parm("primpath").set("/turntable/lights")
+                graftstage_envlights_node.parm("destpath").set("/")
+                graftstage_envlights_node.setInput(0, current_stream)
+
+                domes = []
+                if cfg.env_light_paths:
+                    for idx, path in enumerate(cfg.env_light_paths):
+                        base = os.path.splitext(os.path.basename(path))[0]
+                        dome = stage_context.createNode("domelight::3.0", _sanitize(f"{base or 'env_light'}_{idx+1}"))
+                        dome.parm("primpath").set("/$OS")
+                        dome.parm("xn__inputstexturefile_r3ah").set(path)
+                        domes.append(dome)
+                else:
+                    dome = stage_context.createNode("domelight::3.0", "env_light")
                     dome.parm("primpath").set("/$OS")
-                    dome.parm("xn__inputstexturefile_r3ah").set(path)
                     domes.append(dome)
-            else:
-                dome = stage_context.createNode("domelight::3.0", "env_light")
-                dome.parm("primpath").set("/$OS")
-                domes.append(dome)
-
-            switch_envlights_selection_node = stage_context.createNode("switch", "switch_envlights_selection")
-            for i, dome in enumerate(domes):
-                switch_envlights_selection_node.setInput(i, dome)
-            envlights_nodes_to_layout = domes + [switch_envlights_selection_node]
 
-            stage_context.layoutChildren(items=envlights_nodes_to_layout)
+                switch_envlights_selection_node = stage_context.createNode("switch", "switch_envlights_selection")
+                for i, dome in enumerate(domes):
+                    switch_envlights_selection_node.setInput(i, dome)
+                envlights_nodes_to_layout = domes + [switch_envlights_selection_node]
+
+                stage_context.layoutChildren(items=envlights_nodes_to_layout)
+
+                if progress.is_cancelled():
+                    raise KeyboardInterrupt("Cancelled by user")
+
+                create_organized_net_note("Env Light", envlights_nodes_to_layout, hou.Vector2(5, 6), create_network_boxes=cfg.create_network_boxes)
+
+                graftstage_envlights_node.setInput(1, switch_envlights_selection_node)
+                switch_env_lights = stage_context.createNode("switch", "switch_env_lights")
+                switch_env_lights.setInput(0, current_stream)
+                switch_env_lights.setInput(1, graftstage_envlights_node)
+                switch_env_lights.parm("input").set(1)
+                current_stream = switch_env_lights
+                lookdev_setup_layout.extend([switch_env_lights, graftstage_envlights_node])
+
+            # Lookdev subnet
+            progress.step("Creating lookdev subnetwork")
+            subnetwork_lookdevsetup_node = create_subnet_lookdev_setup(node_name="lookdev_setup")
+            subnetwork_lookdevsetup_node.setInput(0, current_stream)
+
+            switch_lookdev_setup_node = stage_context.createNode("switch", "switch_lookdev_setup")
+            switch_lookdev_setup_node.setInput(0, current_stream)
+            switch_lookdev_setup_node.setInput(1, subnetwork_lookdevsetup_node)
+            switch_lookdev_setup_node.parm("input").set(1)
+            lookdev_setup_layout = lookdev_setup_layout + [
+                switch_lookdev_setup_node, subnetwork_lookdevsetup_node,
+                graftstage_asset_node, primitive_node
+            ]
+            stage_context.layoutChildren(items=lookdev_setup_layout, horizontal_spacing=0.3, vertical_spacing=1.5)
+            create_organized_net_note("LookDev Setup", lookdev_setup_layout, hou.Vector2(15, -5), create_network_boxes=cfg.create_network_boxes)
+
+            # Camera, animations, and render nodes
+            progress.step("Creating camera, animations, and render nodes")
+            transform_camera_and_scene_node = build_transform_camera_and_scene_node()
+            transform_camera_and_scene_node.setInput(0, switch_lookdev_setup_node)
+            switch_transform_camera_and_scene_node = stage_context.createNode("switch", "switch_transform_camera_and_scene_node")
+            switch_transform_camera_and_scene_node.setInput(0, switch_lookdev_setup_node)
+            switch_transform_camera_and_scene_node.setInput(1, transform_camera_and_scene_node)
+            transform_envlights_node = build_lights_spin_xform()
+            transform_envlights_node.setInput(0, switch_transform_camera_and_scene_node)
+            switch_animate_lights = stage_context.createNode("switch", "switch_animate_lights")
+            switch_animate_lights.setInput(0, switch_transform_camera_and_scene_node)
+            switch_animate_lights.setInput(1, transform_envlights_node)
+
+            # Create Karma nodes
+            karma_settings, usdrender_rop = create_karma_nodes(stage_context)
+            karma_settings.setInput(0, switch_animate_lights)
+            usdrender_rop.setInput(0, karma_settings)
+
+            # Layout karma nodes
+            karma_nodes = [
+                switch_transform_camera_and_scene_node, transform_camera_and_scene_node,
+                switch_animate_lights, transform_envlights_node, karma_settings, usdrender_rop
+            ]
+            stage_context.layoutChildren(items=karma_nodes, horizontal_spacing=0.25, vertical_spacing=1)
 
             if progress.is_cancelled():
                 raise KeyboardInterrupt("Cancelled by user")
 
-            create_organized_net_note("Env Light", envlights_nodes_to_layout, hou.Vector2(5, 6), create_network_boxes=cfg.create_network_boxes)
-
-            graftstage_envlights_node.setInput(1, switch_envlights_selection_node)
-            switch_env_lights = stage_context.createNode("switch", "switch_env_lights")
-            switch_env_lights.setInput(0, current_stream)
-            switch_env_lights.setInput(1, graftstage_envlights_node)
-            switch_env_lights.parm("input").set(1)
-            current_stream = switch_env_lights
-            lookdev_setup_layout.extend([switch_env_lights, graftstage_envlights_node])
-
-        # Lookdev subnet
-        progress.step("Creating lookdev subnetwork")
-        subnetwork_lookdevsetup_node = create_subnet_lookdev_setup(node_name="lookdev_setup")
-        subnetwork_lookdevsetup_node.setInput(0, current_stream)
-
-        switch_lookdev_setup_node = stage_context.createNode("switch", "switch_lookdev_setup")
-        switch_lookdev_setup_node.setInput(0, current_stream)
-        switch_lookdev_setup_node.setInput(1, subnetwork_lookdevsetup_node)
-        switch_lookdev_setup_node.parm("input").set(1)
-        lookdev_setup_layout = lookdev_setup_layout + [
-            switch_lookdev_setup_node, subnetwork_lookdevsetup_node,
-            graftstage_asset_node, primitive_node
-        ]
-        stage_context.layoutChildren(items=lookdev_setup_layout, horizontal_spacing=0.3, vertical_spacing=1.5)
-        create_organized_net_note("LookDev Setup", lookdev_setup_layout, hou.Vector2(15, -5), create_network_boxes=cfg.create_network_boxes)
-
-        # Camera, animations, and render nodes
-        progress.step("Creating camera, animations, and render nodes")
-        transform_camera_and_scene_node = build_transform_camera_and_scene_node()
-        transform_camera_and_scene_node.setInput(0, switch_lookdev_setup_node)
-        switch_transform_camera_and_scene_node = stage_context.createNode("switch", "switch_transform_camera_and_scene_node")
-        switch_transform_camera_and_scene_node.setInput(0, switch_lookdev_setup_node)
-        switch_transform_camera_and_scene_node.setInput(1, transform_camera_and_scene_node)
-        transform_envlights_node = build_lights_spin_xform()
-        transform_envlights_node.setInput(0, switch_transform_camera_and_scene_node)
-        switch_animate_lights = stage_context.createNode("switch", "switch_animate_lights")
-        switch_animate_lights.setInput(0, switch_transform_camera_and_scene_node)
-        switch_animate_lights.setInput(1, transform_envlights_node)
-
-        # Create Karma nodes
-        karma_settings, usdrender_rop = create_karma_nodes(stage_context)
-        karma_settings.setInput(0, switch_animate_lights)
-        usdrender_rop.setInput(0, karma_settings)
-
-        # Layout karma nodes
-        karma_nodes = [
-            switch_transform_camera_and_scene_node, transform_camera_and_scene_node,
-            switch_animate_lights, transform_envlights_node, karma_settings, usdrender_rop
-        ]
-        stage_context.layoutChildren(items=karma_nodes, horizontal_spacing=0.25, vertical_spacing=1)
-
-        if progress.is_cancelled():
-            raise KeyboardInterrupt("Cancelled by user")
-
-        create_organized_net_note("Camera Render", karma_nodes, hou.Vector2(0, -5), create_network_boxes=cfg.create_network_boxes)
+            create_organized_net_note("Camera Render", karma_nodes, hou.Vector2(0, -5), create_network_boxes=cfg.create_network_boxes)
         comp_out.setSelected(True, clear_all_selected=True)
 
         progress.mark_finished("Done")
@@ -430,7 +463,9 @@ def build_asset(config: Dict[str, Any] | AssetBuilderConfig,
             success=True,
             message=f"Asset built successfully: {comp_out.path()}",
             output_node=comp_out,
-            duration=duration
+            duration=duration,
+            build_plan=plan,
+            profile=profile
         )
 
     except KeyboardInterrupt as e:
@@ -439,7 +474,9 @@ def build_asset(config: Dict[str, Any] | AssetBuilderConfig,
             success=False,
             message=f"Build cancelled: {str(e)}",
             error=e,
-            duration=duration
+            duration=duration,
+            build_plan=plan,
+            profile=profile
         )
     except Exception as e:
         duration = time.time() - start_time
@@ -447,8 +484,18 @@ def build_asset(config: Dict[str, Any] | AssetBuilderConfig,
             success=False,
             message=f"Build failed: {str(e)}",
             error=e,
-            duration=duration
+            duration=duration,
+            build_plan=plan,
+            profile=profile
         )
+    finally:
+        if profiler is not None:
+            profiler.stop()
+        if publish_net is not None:
+            try:
+                publish_net.destroy()
+            except hou.ObjectWasDeleted:
+                pass
 
 
 def build_asset_from_file(config_filepath: str, verbose: bool = True) -> BuildResult:
@@ -479,13 +526,17 @@ def build_asset_from_file(config_filepath: str, verbose: bool = True) -> BuildRe
 
 
 def build_assets_batch(configs: List[Dict[str, Any] | AssetBuilderConfig],
-                      verbose: bool = True) -> List[BuildResult]:
+                      verbose: bool = True, profile: bool = False,
+                      profile_report: str = "") -> List[BuildResult]:
     """
     Build multiple LOPS assets in batch mode.
 
     Args:
         configs: List of configuration dictionaries or AssetBuilderConfig instances
         verbose: Enable verbose logging
+        profile: Profile every build (see build_profiler) and print the aggregated phase table
+        profile_report: JSON path for the aggregated profile report (a .txt table is written
+            next to it); implies profile
 
     Returns:
         List of BuildResult objects, one per asset
@@ -498,9 +549,13 @@ def build_assets_batch(configs: List[Dict[str, Any] | AssetBuilderConfig],
         results = build_assets_batch(configs)
         for i, result in enumerate(results):
             print(f"Asset {i+1}: {result}")
+
+        # Find the bottleneck phases of a large run
+        build_assets_batch(configs, profile_report="/tmp/build_profile.json")
     """
     results = []
     total = len(configs)
+    profile = profile or bool(profile_report)
 
     print(f"\n{'='*60}")
     print(f"BATCH BUILD: Processing {total} assets")
@@ -508,6 +563,12 @@ def build_assets_batch(configs: List[Dict[str, Any] | AssetBuilderConfig],
 
     for i, config in enumerate(configs, 1):
         print(f"\n[BATCH {i}/{total}] Starting build...")
+        if profile:
+            if isinstance(config, dict):
+                config = {**config, "profile": True}
+            else:
+                config = copy.copy(config)
+                config.profile = True
         result = build_asset(config, progress=ConsoleProgressReporter(verbose=verbose))
         results.append(result)
 
@@ -525,6 +586,13 @@ def build_assets_batch(configs: List[Dict[str, Any] | AssetBuilderConfig],
     print(f"Total duration: {total_duration:.2f}s")
     print(f"{'='*60}\n")
 
+    if profile:
+        profiles = [r.profile for r in results]
+        report = write_profile_report(profiles, profile_report) if profile_report else None
+        print(format_profile_report(report or aggregate_profiles(profiles)))
+        if report is not None:
+            print(f"Build profile report: {profile_report}")
+
     return results
 
 
@@ -595,3 +663,316 @@ def quick_build(asset_path: str, textures_path: str, **kwargs) -> BuildResult:
         **kwargs
     }
     return build_asset(config)
+
+
+# ---------------------------------------------------------------------------
+# Command line (hython)
+# ---------------------------------------------------------------------------
+
+def export_component_usd(output_node: hou.Node, usd_path: str) -> str:
+    """
+    Write a component output to a USD file with its own Save to Disk.
+
+    The component output's geo, mtl and payload layers are saved next to the
+    root layer, because their save paths follow its lopoutput parm.
+
+    Args:
+        output_node: componentoutput node to export
+        usd_path: Output file path of the root layer
+
+    Returns:
+        The written file path
+    """
+    os.makedirs(os.path.dirname(usd_path), exist_ok=True)
+    output_node.parm("lopoutput").set(usd_path.replace(os.sep, "/"))
+    output_node.parm("execute").pressButton()
+    return output_node.parm("lopoutput").eval()
+
+
+def _build_item(config_file: str, index: int, config, output_dir: str, save_hip: bool, save_usd: bool,
+                verbose: bool, publish_only: bool = False, profile: bool = False) -> Dict[str, Any]:
+    """Build one config in an empty scene and save its outputs; returns the JSONL record."""
+    record = {
+        "config": config_file,
+        "index": index,
+        "asset": "",
+        "success": False,
+        "message": "",
+        "duration": 0.0,
+        "hip": None,
+        "usd": None,
+    }
+    if isinstance(config, Exception):
+        record["message"] = f"Failed to load config file: {config}"
+        return record
+
+    start_time = time.time()
+    hou.hipFile.clear(suppress_save_prompt=True)
+    try:
+        cfg = AssetBuilderConfig.from_dict(config)
+    except Exception as e:
+        record["message"] = f"Invalid config: {e}"
+        return record
+    cfg.verbose = verbose
+    cfg.profile = profile
+    if publish_only:
+        cfg.publish_only = True
+        cfg.publish_dir = output_dir
+    record["asset"] = cfg.asset_name
+
+    result = build_asset(cfg)
+    record["success"] = result.success
+    record["message"] = result.message
+    if result.build_plan is not None:
+        record["phases"] = result.build_plan.timings_by_phase()
+    if result.profile is not None:
+        record["profile"] = result.profile.to_dict()
+
+    if result.success and publish_only:
+        # The component output already wrote the USD; the scene is empty again
+        record["usd"] = result.output_path
+    elif result.success:
+        asset_dir = os.path.join(output_dir, _sanitize(cfg.asset_name))
+        try:
+            if save_usd and result.output_node is not None:
+                record["usd"] = export_component_usd(result.output_node,
+                                                     os.path.join(asset_dir, f"{_sanitize(cfg.asset_name)}.usd"))
+            if save_hip:
+                os.makedirs(asset_dir, exist_ok=True)
+                hip_path = os.path.join(asset_dir, f"{_sanitize(cfg.asset_name)}.hip")
+                hou.hipFile.save(file_name=hip_path, save_to_recent_files=False)
+                record["hip"] = hip_path
+        except Exception as e:
+            record["success"] = False
+            record["message"] = f"Built, but saving outputs failed: {e}"
+
+    record["duration"] = round(time.time() - start_time, 3)
+    return record
+
+
+def _run_shard(items: List[tuple], args, records: Optional[List[Dict]] = None) -> int:
+    """Build the items of this process's shard, writing one JSON line per asset to stdout."""
+    out = sys.stdout
+    shard, shards = args.shard
+    failed = 0
+    for position, (config_file, index, config) in enumerate(items):
+        if position % shards != shard:
+            continue
+        # Build logs go to stderr so stdout stays valid JSONL
+        with contextlib.redirect_stdout(sys.stderr):
+            try:
+                record = _build_item(config_file, index, config, args.output_dir,
+                                     not args.no_hip, not args.no_usd, not args.quiet, args.publish_only,
+                                     args.profile)
+            except Exception as e:
+                record = {"config": config_file, "index": index, "success": False,
+                          "message": f"Unexpected error: {e}"}
+        if shards > 1:
+            record["shard"] = shard
+        failed += 0 if record.get("success") else 1
+        if records is not None:
+            records.append(record)
+        out.write(json.dumps(record) + "\n")
+        out.flush()
+    return 1 if failed else 0
+
+
+def _run_validation(items: List[tuple], args) -> int:
+    """Validate the materials of every config against each of its material variant folders, as one job."""
+    out = sys.stdout
+    records = []
+    kits: Dict[bool, Dict[str, tuple]] = {}  # lowercase_material_names -> validate_kit input
+    for config_file, index, config in items:
+        record = {"config": config_file, "index": index, "asset": "", "success": False, "message": ""}
+        records.append(record)
+        if isinstance(config, Exception):
+            record["message"] = f"Failed to load config file: {config}"
+            continue
+        try:
+            cfg = AssetBuilderConfig.from_dict(config)
+        except Exception as e:
+            record["message"] = f"Invalid config: {e}"
+            continue
+        plan = BuildPlan.from_inputs(cfg.asset_name, cfg.main_asset_file_path, cfg.asset_variants,
+                                     cfg.create_geo_variants, cfg.mtl_variants, cfg.folder_textures)
+        record["asset"] = cfg.asset_name
+        record["key"] = f"{cfg.asset_name}@{config_file}#{index}"
+        kit = kits.setdefault(cfg.lowercase_material_names, {})
+        kit[record["key"]] = (plan.asset_paths, [m.folder for m in plan.material_variants])
+
+    reports = {}
+    with contextlib.redirect_stdout(sys.stderr):
+        for lowercase, kit in kits.items():
+            reports.update(validate_kit(kit, naming_config=MaterialNamingConfig.from_ui(lowercase=lowercase),
+                                        max_workers=args.jobs if args.jobs > 1 else None))
+
+    failed = 0
+    for record in records:
+        report = reports.get(record.pop("key", None))
+        if report is not None:
+            report.asset_name = record["asset"]
+            missing = report.materials_missing
+            record["success"] = bool(report.materials_expected) and not missing
+            record["message"] = (f"{len(missing)} material(s) missing in at least one variant" if missing
+                                 else f"{len(report.materials_expected)} material(s) covered by "
+                                      f"{len(report.variants)} variant(s)")
+            record["validation"] = report.to_dict()
+            if not args.quiet:
+                print(report.get_summary(), file=sys.stderr)
+        failed += 0 if record["success"] else 1
+        out.write(json.dumps(record) + "\n")
+    out.flush()
+    return 1 if failed else 0
+
+
+def _default_hython() -> str:
+    hfs = os.environ.get("HFS")
+    if hfs:
+        for name in ("hython", "hython.exe"):
+            candidate = os.path.join(hfs, "bin", name)
+            if os.path.isfile(candidate):
+                return candidate
+    return sys.executable
+
+
+def _run_parallel(args, records: Optional[List[Dict]] = None) -> int:
+    """Spawn args.jobs hython processes, one shard each, and merge their JSONL output."""
+    python_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (python_root, env.get("PYTHONPATH", "")) if p)
+
+    base_cmd = [args.hython or _default_hython(), "-m", "tools.lops_asset_builder_v3.lops_asset_builder_cli",
+                *args.configs, "--output-dir", args.output_dir]
+    for flag in ("no_hip", "no_usd", "quiet", "publish_only", "profile"):
+        if getattr(args, flag):
+            base_cmd.append("--" + flag.replace("_", "-"))
+
+    lock = threading.Lock()
+    failed = []
+
+    def _forward(proc):
+        for line in proc.stdout:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # Not a result line; pass it on as a log message
+                print(line, file=sys.stderr)
+                continue
+            if not record.get("success"):
+                failed.append(line)
+            with lock:
+                if records is not None:
+                    records.append(record)
+                sys.stdout.write(line + "\n")
+                sys.stdout.flush()
+
+    procs = []
+    readers = []
+    for shard in range(args.jobs):
+        proc = subprocess.Popen(base_cmd + ["--shard", f"{shard}/{args.jobs}"], env=env,
+                                stdout=subprocess.PIPE, text=True)
+        reader = threading.Thread(target=_forward, args=(proc,), daemon=True)
+        reader.start()
+        procs.append(proc)
+        readers.append(reader)
+
+    exit_codes = [proc.wait() for proc in procs]
+    for reader in readers:
+        reader.join()
+
+    return 1 if failed or any(exit_codes) else 0
+
+
+def _parse_shard(value: str) -> tuple:
+    try:
+        shard, shards = (int(v) for v in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError("expected K/N, e.g. 0/4")
+    if shards < 1 or not 0 <= shard < shards:
+        raise argparse.ArgumentTypeError("expected 0 <= K < N")
+    return shard, shards
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point (run with hython).
+
+    Returns:
+        Exit code: 0 if every asset built, 1 if any failed, 2 if no configs were found
+    """
+    parser = argparse.ArgumentParser(
+        prog="hython -m tools.lops_asset_builder_v3.lops_asset_builder_cli",
+        description="Build LOPS assets from JSON configs, one .hip/.usd per asset",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Build every config in a folder
+  hython -m tools.lops_asset_builder_v3.lops_asset_builder_cli /path/to/configs -o /path/to/build
+
+  # Glob of configs, 4 parallel hython processes, USD only
+  hython -m tools.lops_asset_builder_v3.lops_asset_builder_cli "configs/**/*.json" --jobs 4 --no-hip
+
+  # Publish only: write <asset>/<file>.usd from the component output, no .hip, no lookdev
+  hython -m tools.lops_asset_builder_v3.lops_asset_builder_cli configs -o /path/to/publish --publish-only
+
+  # Only validate materials: every asset against each material variant folder, one parallel job
+  hython -m tools.lops_asset_builder_v3.lops_asset_builder_cli configs --validate-only
+
+Each asset produces one JSON line on stdout:
+  {"config": ..., "asset": ..., "success": true, "message": ..., "duration": ..., "hip": ..., "usd": ...}
+        """
+    )
+    parser.add_argument('configs', nargs='+',
+                        help='Config JSON files, folders of configs, or glob patterns')
+    parser.add_argument('--output-dir', '-o', default='build',
+                        help='Folder for the per-asset <asset>/<asset>.hip/.usd outputs (default: ./build)')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Number of parallel hython processes (default: 1)')
+    parser.add_argument('--no-hip', action='store_true', help='Do not save a .hip file per asset')
+    parser.add_argument('--no-usd', action='store_true', help='Do not export the component USD per asset')
+    parser.add_argument('--publish-only', action='store_true',
+                        help='Only write the component USD of each asset (no lookdev, layout or .hip)')
+    parser.add_argument('--validate-only', action='store_true',
+                        help='Only validate geometry materials against every material variant folder (no build)')
+    parser.add_argument('--profile', action='store_true',
+                        help='Profile every build and write <output-dir>/build_profile.json/.txt')
+    parser.add_argument('--quiet', '-q', action='store_true', help='Disable build logs on stderr')
+    parser.add_argument('--hython', default='',
+                        help='hython executable for --jobs (default: $HFS/bin/hython, else this interpreter)')
+    parser.add_argument('--shard', type=_parse_shard, default=(0, 1), help=argparse.SUPPRESS)
+
+    args = parser.parse_args(argv)
+    args.output_dir = os.path.abspath(args.output_dir)
+
+    config_files = collect_config_files(args.configs)
+    if not config_files:
+        print("Error: No config files found", file=sys.stderr)
+        return 2
+
+    items = load_config_items(config_files)
+    # No more processes (or scanner threads) than there are configs
+    args.jobs = max(1, min(args.jobs, len(items)))
+
+    if args.validate_only:
+        # Folder scans are threaded in this process; --jobs sets the scanner thread count
+        return _run_validation(items, args)
+
+    records = []
+    if args.jobs > 1 and args.shard == (0, 1):
+        exit_code = _run_parallel(args, records)
+    else:
+        exit_code = _run_shard(items, args, records)
+
+    if args.profile and args.shard == (0, 1):
+        # Shard processes only report; the parent aggregates every shard
+        report_path = os.path.join(args.output_dir, "build_profile.json")
+        if write_profile_report([r.get("profile") for r in records], report_path) is not None:
+            print(f"Build profile report: {report_path}", file=sys.stderr)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
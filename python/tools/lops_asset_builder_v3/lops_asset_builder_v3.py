@@ -1,4 +1,5 @@
 import os
+import json
 import time
 
 import hou
@@ -17,6 +18,13 @@ from tools.lops_asset_builder_v3.create_transform_nodes import build_transform_c
 from tools.lops_asset_builder_v3.subnet_lookdev_setup import create_subnet_lookdev_setup
 from tools.lops_asset_builder_v3.asset_builder_ui import AssetMaterialVariantsDialog, ProgressReporter
 from tools.lops_asset_builder_v3.material_validator import validate_and_warn_user
+from tools.lops_asset_builder_v3.build_plan import BuildPlan
+from tools.lops_asset_builder_v3.build_profiler import profile_phase
+from tools.lops_asset_builder_v3.progress_events import (
+    ProgressEvent, publish, PHASE_START, PHASE_END, MATERIAL_CREATED, COUNTER,
+)
+from tools.lops_asset_builder_v3 import texture_variants
+from modules.layout_scheduler import deferred_layout, request_layout
 from PySide6 import QtWidgets, QtCore
 
 
@@ -591,7 +599,42 @@ def _create_mtlx_templates(parent, material_lib):
             folder_label="MaterialX Builder",
             render_context="mtlx"
         )
-    material_lib.layoutChildren()
+    request_layout(material_lib, grid=True)
+
+def _collect_texture_list(folder_textures, naming_config: MaterialNamingConfig, progress: ProgressReporter | None = None) -> dict:
+    """
+    Scan a texture folder and all its subfolders with TxToMtlx.
+
+    Args:
+        folder_textures: Root texture folder
+        naming_config: Material naming configuration
+        progress: Progress reporter instance
+
+    Returns:
+        dict: Combined texture list (material -> texture details), empty if no valid textures were found
+    """
+    material_handler = tex_to_mtlx.TxToMtlx(naming_config=naming_config)
+    combined_texture_list = {}
+
+    # Recursively search for textures in the folder and all subfolders
+    for root, dirs, files in os.walk(folder_textures):
+        if progress and progress.is_cancelled():
+            raise KeyboardInterrupt("Cancelled by user")
+        # Convert Windows path to Houdini-friendly format
+        current_folder = root.replace(os.sep, "/")
+
+        # Check if this folder contains valid textures
+        if material_handler.folder_with_textures(current_folder):
+            # Get texture details from this folder
+            folder_texture_list = material_handler.get_texture_details(current_folder)
+            if folder_texture_list and isinstance(folder_texture_list, dict):
+                # Merge with combined list
+                combined_texture_list.update(folder_texture_list)
+            # Counter event per valid subfolder discovered
+            publish(progress, ProgressEvent(COUNTER, f"Found textures in: {os.path.basename(current_folder)}",
+                                            phase="texture_scan", name=os.path.basename(current_folder)))
+
+    return combined_texture_list
 
 def _create_materials(parent, folder_textures, material_lib, expected_names=None, progress: ProgressReporter | None = None, naming_config: MaterialNamingConfig = None):
     ''' Create the material using the tex_to_mtlx script
@@ -613,59 +656,29 @@ def _create_materials(parent, folder_textures, material_lib, expected_names=None
         folder_textures_check = os.path.normpath(folder_textures)
         if progress:
             progress.log(f"Scanning texture folder: {folder_textures_check}")
-            # Nudge progress so the bar reflects scanning work
-            try:
-                progress.step("Scanning texture folders…")
-            except Exception:
-                pass
+            publish(progress, ProgressEvent(PHASE_START, "Scanning texture folders…", phase="texture_scan"))
         if not os.path.exists(folder_textures_check):
             warn1 = f"Warning: Texture folder does not exist: {folder_textures_check}"
             warn2 = f"Warning: Texture folder not found: {folder_textures}. Creating template materials instead."
             if progress:
                 progress.log(warn1)
                 progress.log(warn2)
-                # Step a bit so the user sees movement even when falling back
-                try:
-                    for _ in range(3):
-                        progress.step("Texture folder missing; creating template materials…")
-                except Exception:
-                    pass
+                publish(progress, ProgressEvent(PHASE_END, "Texture folder missing; creating template materials…",
+                                                phase="texture_scan"))
             else:
                 print(warn1)
                 print(warn2)
             _create_mtlx_templates(parent, material_lib)
             return True
 
-        material_handler = tex_to_mtlx.TxToMtlx(naming_config=naming_config)
         materials_created_length = 0
 
         # Combined texture list from all subfolders
-        combined_texture_list = {}
-        valid_folders_found = False
+        with profile_phase("texture_scan"):
+            combined_texture_list = _collect_texture_list(folder_textures_check, naming_config, progress=progress)
+        publish(progress, ProgressEvent(PHASE_END, phase="texture_scan"))
 
-        # Recursively search for textures in the folder and all subfolders
-        for root, dirs, files in os.walk(folder_textures_check):
-            if progress and progress.is_cancelled():
-                raise KeyboardInterrupt("Cancelled by user")
-            # Convert Windows path to Houdini-friendly format
-            current_folder = root.replace(os.sep, "/")
-
-            # Check if this folder contains valid textures
-            if material_handler.folder_with_textures(current_folder):
-                valid_folders_found = True
-                # Get texture details from this folder
-                folder_texture_list = material_handler.get_texture_details(current_folder)
-                if folder_texture_list and isinstance(folder_texture_list, dict):
-                    # Merge with combined list
-                    combined_texture_list.update(folder_texture_list)
-                # Minor progress tick per valid subfolder discovered
-                if progress:
-                    try:
-                        progress.step(f"Found textures in: {os.path.basename(current_folder)}")
-                    except Exception:
-                        pass
-
-        if valid_folders_found and combined_texture_list:
+        if combined_texture_list:
             start_time = time.perf_counter()
             # Common data
             common_data = {
@@ -676,68 +689,48 @@ def _create_materials(parent, folder_textures, material_lib, expected_names=None
 
             total_to_create = sum(1 for material_name in combined_texture_list if not expected_names or material_name in expected_names)
             created_so_far = 0
-            if progress:
-                progress.log(f"Creating up to {total_to_create} materials in {material_lib.path()}")
-                # Pre-creation bump so users see movement before the first material completes
+            # The material phase may advance the bar by ~800 units (out of the 1000
+            # total set by the caller); reporters map material counts into that span.
+            publish(progress, ProgressEvent(PHASE_START, f"Creating up to {total_to_create} materials in {material_lib.path()}",
+                                            phase="materials", total=total_to_create, span=800))
+
+            with profile_phase("material_creation"):
+                # One pre-configured MaterialX builder subnet, copied for every material
+                template = tex_to_mtlx.MtlxMaterialTemplate(material_lib)
                 try:
-                    for _ in range(min(5, max(1, total_to_create // 10))):
-                        progress.step("Preparing material creation…")
-                except Exception:
-                    pass
-
-            # Determine how many progress steps to allocate per material so the bar moves continuously.
-            # Aim to spend ~800 steps (out of the 1000 total set by the caller) within this phase.
-            target_phase_steps = 800
-            per_mat_steps = 1
-            if total_to_create > 0:
-                per_mat_steps = max(1, target_phase_steps // total_to_create)
-
-            for material_name in combined_texture_list:
-                if progress and progress.is_cancelled():
-                    raise KeyboardInterrupt("Cancelled by user")
-                # Skip materials not in expected_names list if provided
-                if expected_names and material_name not in expected_names:
-                    continue
-
-                # Fix to provide the correct path
-                path = combined_texture_list[material_name]['FOLDER_PATH']
-                if not path.endswith("/"):
-                    combined_texture_list[material_name]['FOLDER_PATH'] = path + "/"
-
-                create_material = tex_to_mtlx.MtlxMaterial(
-                    material_name,
-                    **common_data,
-                    folder_path=path,
-                    texture_list=combined_texture_list,
-                    naming_config=naming_config
-                )
-                create_material.create_materialx()
-
-                materials_created_length += 1
-                created_so_far += 1
-                # Advance progress multiple ticks per material to convey ongoing work
-                if progress:
-                    try:
-                        # First tick with a message, the rest silent to avoid log spam
-                        progress.step(f"Created material {created_so_far}/{total_to_create}: {material_name}")
-                        for _ in range(per_mat_steps - 1):
-                            progress.step()
-                    except Exception:
-                        pass
-
-                if progress and (created_so_far % 5 == 0 or created_so_far == total_to_create):
-                    progress.log(f"Created {created_so_far}/{total_to_create} materials…")
+                    for material_name in combined_texture_list:
+                        if progress and progress.is_cancelled():
+                            raise KeyboardInterrupt("Cancelled by user")
+                        # Skip materials not in expected_names list if provided
+                        if expected_names and material_name not in expected_names:
+                            continue
+
+                        # Fix to provide the correct path
+                        path = combined_texture_list[material_name]['FOLDER_PATH']
+                        if not path.endswith("/"):
+                            combined_texture_list[material_name]['FOLDER_PATH'] = path + "/"
+
+                        create_material = tex_to_mtlx.MtlxMaterial(
+                            material_name,
+                            **common_data,
+                            folder_path=path,
+                            texture_list=combined_texture_list,
+                            naming_config=naming_config,
+                            template=template
+                        )
+                        create_material.create_materialx()
+
+                        materials_created_length += 1
+                        created_so_far += 1
+                        publish(progress, ProgressEvent(MATERIAL_CREATED, phase="materials", name=material_name,
+                                                        current=created_so_far, total=total_to_create))
+                finally:
+                    template.release()
 
             elapsed = time.perf_counter() - start_time
             msg = f"Created {materials_created_length} materials in {material_lib.path()} in {elapsed:.2f}s"
             if progress:
-                progress.log(msg)
-                # Small tail steps to reach the phase target smoothly
-                try:
-                    for _ in range(5):
-                        progress.step()
-                except Exception:
-                    pass
+                publish(progress, ProgressEvent(PHASE_END, msg, phase="materials"))
             else:
                 print(msg)
             return True
@@ -746,11 +739,7 @@ def _create_materials(parent, folder_textures, material_lib, expected_names=None
             msg = "No valid textures sets found in folder or subfolders"
             if progress:
                 progress.log(msg)
-                try:
-                    for _ in range(5):
-                        progress.step("No textures found; using template materials…")
-                except Exception:
-                    pass
+                progress.step("No textures found; using template materials…")
             else:
                 print(msg)
             return True
@@ -763,6 +752,60 @@ def _create_materials(parent, folder_textures, material_lib, expected_names=None
             print(err)
         return False
 
+def _create_texture_variants_node(stage_context, node_name: str, material_lib, base_variant,
+                                  texture_only_variants, texture_vset_name: str,
+                                  naming_config: MaterialNamingConfig, progress: ProgressReporter | None = None):
+    '''
+    Create the Python LOP that turns the other material-variant folders into texture path variants.
+    Args:
+        stage_context: Stage network
+        node_name: Asset name
+        material_lib: Material library built from the base variant folder
+        base_variant (MaterialVariantInput): Folder the shader networks were built from
+        texture_only_variants (list): MaterialVariantInput folders authored as texture overrides only
+        texture_vset_name: Variant set name authored on every material
+        naming_config: Material naming configuration (must match the one used for the materials)
+        progress: Progress reporter instance
+    Return:
+        python_lop = python LOP node created (wired after material_lib)
+    '''
+    base_list = _collect_texture_list(os.path.normpath(base_variant.folder), naming_config)
+    variant_lists = {}
+    for variant in texture_only_variants:
+        variant_lists[variant.name] = _collect_texture_list(os.path.normpath(variant.folder), naming_config, progress=progress)
+    variant_map = texture_variants.build_texture_variant_map(base_list, variant_lists)
+    if progress:
+        counts = ", ".join(f"{name}: {len(mapping)}" for name, mapping in variant_map.items())
+        progress.log(f"Texture-only material variants ({counts} textures mapped)")
+
+    python_lop = stage_context.createNode("pythonscript", _sanitize(f"{node_name}_texture_variants"))
+    python_lop.setInput(0, material_lib)
+
+    # Create the extra parms to use
+    ptg = python_lop.parmTemplateGroup()
+    ptg.append(hou.StringParmTemplate("material_root", "Material Root", 1, default_value=(["/ASSET/mtl"])))
+    ptg.append(hou.StringParmTemplate("variant_set", "Variant Set", 1, default_value=([texture_vset_name])))
+    ptg.append(hou.StringParmTemplate("base_variant", "Base Variant", 1, default_value=([base_variant.name])))
+    ptg.append(hou.StringParmTemplate("variant_map", "Variant Map", 1, default_value=([json.dumps(variant_map)])))
+    python_lop.setParmTemplateGroup(ptg)
+
+    code = '''
+import json
+from tools.lops_asset_builder_v3 import texture_variants
+
+node = hou.pwd()
+texture_variants.author_texture_variants(
+    node.editableLayer(),
+    node.evalParm("material_root"),
+    json.loads(node.evalParm("variant_map")),
+    node.evalParm("base_variant"),
+    node.evalParm("variant_set"),
+)
+'''
+    python_lop.parm("python").set(code)
+
+    return python_lop
+
 def _extract_material_names(asset_paths, lowercase: bool = False):
     """
     Extract material names from geometry files by examining shop_materialpath
@@ -868,110 +911,138 @@ def build_geo_and_mtl_variants(stage_context, node_name: str, main_asset_file_pa
                                progress: ProgressReporter | None = None,
                                lowercase_material_names: bool = False,
                                use_custom_component_output: bool = True,
-                               create_geo_variants: bool = True):
+                               create_geo_variants: bool = True,
+                               plan: BuildPlan | None = None,
+                               layout_grid_threshold: int | None = None,
+                               texture_variants_only: bool = False,
+                               texture_vset_name: str = "texture_variant"):
     """
     Build the geometry variants, material variants, and materials, returning
     key nodes for further wiring.
 
+    The build follows a BuildPlan: geometry material names are extracted once
+    and shared by every material variant. Pass a plan to inspect it (and its
+    per-phase timings) afterwards; otherwise one is created from the inputs.
+
+    Network layout of the material libraries is deferred until all variants are
+    built (see modules.layout_scheduler); libraries with at least
+    layout_grid_threshold materials get a grid layout instead of layoutChildren.
+
+    With texture_variants_only, the shader networks are built once from the main
+    texture folder and the other material-variant folders only become
+    `inputs:file` overrides in a per-material texture_vset_name variant set
+    (see texture_variants), instead of one full material library each.
+
     Returns:
         tuple: (geometry_variants_node or comp_geo, comp_out, nodes_to_layout, comp_material_last)
     """
     # Create unified material naming configuration
     naming_config = MaterialNamingConfig.from_ui(lowercase=lowercase_material_names)
 
-    # Assemble assets list - only include variants if create_geo_variants is True
-    if create_geo_variants:
-        assets = [main_asset_file_path] + (asset_variants or [])
-    else:
-        assets = [main_asset_file_path]
+    if plan is None:
+        plan = BuildPlan.from_inputs(
+            node_name=node_name,
+            main_asset_file_path=main_asset_file_path,
+            asset_variants=asset_variants,
+            create_geo_variants=create_geo_variants,
+            mtl_variants=mtl_variants,
+            folder_textures=folder_textures,
+            lowercase_material_names=naming_config.lowercase,
+        )
 
-    has_geo_variants = len(assets) > 1  # More than just the main asset
+    has_geo_variants = plan.has_geo_variants  # More than just the main asset
 
     # Create Component Output (custom or normal) based on flag
-    if use_custom_component_output:
-        comp_out = componentoutput_custom_creation(node_name=_sanitize(f"{node_name}"))
-    else:
-        comp_out = stage_context.createNode("componentoutput", _sanitize(f"{node_name}"))
-        comp_out.parm("rootprim").set("/ASSET")
-
-    # Only create componentgeometryvariants if we have actual variants
-    if has_geo_variants:
-        geometry_variants_node = stage_context.createNode("componentgeometryvariants", "geometry_variants")
-        if asset_vset_name:
-            geometry_variants_node.parm("variantset").set(asset_vset_name)
-        nodes_to_layout = [geometry_variants_node, comp_out]
-
-        # Geometry variants population
-        for index, asset in enumerate(assets):
+    with plan.phase("component_output"):
+        if use_custom_component_output:
+            comp_out = componentoutput_custom_creation(node_name=_sanitize(f"{node_name}"),
+                                                       parent_path=stage_context.path())
+        else:
+            comp_out = stage_context.createNode("componentoutput", _sanitize(f"{node_name}"))
+            comp_out.parm("rootprim").set("/ASSET")
+
+    with plan.phase("geometry_import"):
+        # Only create componentgeometryvariants if we have actual variants
+        if has_geo_variants:
+            geometry_variants_node = stage_context.createNode("componentgeometryvariants", "geometry_variants")
+            if asset_vset_name:
+                geometry_variants_node.parm("variantset").set(asset_vset_name)
+            nodes_to_layout = [geometry_variants_node, comp_out]
+
+            # Geometry variants population
+            for index, geo in enumerate(plan.geometry):
+                if progress and progress.is_cancelled():
+                    raise KeyboardInterrupt("Cancelled by user")
+                if progress:
+                    progress.log(f"Creating geometry variant {index+1}/{len(plan.geometry)}: {geo.name}")
+                comp_geo = stage_context.createNode("componentgeometry", _sanitize(f"{geo.name}_geo"))
+                geometry_variants_node.setInput(index, comp_geo)
+                _prepare_imported_asset(comp_geo, _sanitize(f"{geo.name}"), geo.extension, geo.folder, comp_out, skip_matchsize=skip_matchsize, lowercase_material_names=lowercase_material_names)
+                nodes_to_layout.append(comp_geo)
+
+            first_geo_node = geometry_variants_node
+        else:
+            # No variants - just create a single componentgeometry node
+            if progress:
+                progress.log(f"No geometry variants - creating single geometry node")
+            geo = plan.geometry[0]
+            comp_geo = stage_context.createNode("componentgeometry", _sanitize(f"{geo.name}_geo"))
+            _prepare_imported_asset(comp_geo, _sanitize(f"{geo.name}"), geo.extension, geo.folder, comp_out, skip_matchsize=skip_matchsize, lowercase_material_names=lowercase_material_names)
+            nodes_to_layout = [comp_geo, comp_out]
+            first_geo_node = comp_geo
+            geometry_variants_node = comp_geo  # Return comp_geo as the "geometry node" for consistency
+
+    # Extract material names from ALL geometry variant assets (main + variants), once for every material variant
+    if plan.material_variants:
+        material_names = plan.resolve_material_names(_extract_material_names)
+        if progress:
+            readable_list = "\n".join(f"- {m}" for m in material_names)
+            progress.log(f"Found {len(material_names)} Materials across all geometry{'variants' if has_geo_variants else ''} (from {len(plan.geometry)} unique asset{'s' if len(plan.geometry) > 1 else ''}):\n{readable_list}")
+
+    # Material subnets and libraries request a layout per material; lay each network out once at the end
+    # (the profiler charges the final layout to "material_layout"; the variants have their own phases)
+    with profile_phase("material_layout"), deferred_layout(grid_threshold=layout_grid_threshold) as layout_scheduler:
+        comp_material_last = None
+        build_variants = plan.material_variants
+        texture_only_variants = []
+        if texture_variants_only and len(plan.material_variants) > 1:
+            # Main textures (last) get the shader networks; other folders only contribute texture paths
+            build_variants = plan.material_variants[-1:]
+            texture_only_variants = plan.material_variants[:-1]
+
+        for index, mtl_variant in enumerate(build_variants):
             if progress and progress.is_cancelled():
                 raise KeyboardInterrupt("Cancelled by user")
-            path, filename = os.path.split(asset.split(";")[0])
-            # Get asset name and extension
-            asset_name = filename.split(".")[0]
-            asset_extension = filename.split(".")[-1]
-            if filename.endswith("bgeo.sc"):
-                asset_name = filename.split(".")[0]
-                asset_extension = "bgeo.sc"
+            mtl_folder_name = mtl_variant.name
             if progress:
-                progress.log(f"Creating geometry variant {index+1}/{len(assets)}: {asset_name}")
-            comp_geo = stage_context.createNode("componentgeometry", _sanitize(f"{asset_name}_geo"))
-            geometry_variants_node.setInput(index, comp_geo)
-            _prepare_imported_asset(comp_geo, _sanitize(f"{asset_name}"), asset_extension, path, comp_out, skip_matchsize=skip_matchsize, lowercase_material_names=lowercase_material_names)
-            nodes_to_layout.append(comp_geo)
-
-        first_geo_node = geometry_variants_node
-    else:
-        # No variants - just create a single componentgeometry node
-        if progress:
-            progress.log(f"No geometry variants - creating single geometry node")
-        path, filename = os.path.split(main_asset_file_path.split(";")[0])
-        asset_name = filename.split(".")[0]
-        asset_extension = filename.split(".")[-1]
-        if filename.endswith("bgeo.sc"):
-            asset_name = filename.split(".")[0]
-            asset_extension = "bgeo.sc"
-
-        comp_geo = stage_context.createNode("componentgeometry", _sanitize(f"{asset_name}_geo"))
-        _prepare_imported_asset(comp_geo, _sanitize(f"{asset_name}"), asset_extension, path, comp_out, skip_matchsize=skip_matchsize, lowercase_material_names=lowercase_material_names)
-        nodes_to_layout = [comp_geo, comp_out]
-        first_geo_node = comp_geo
-        geometry_variants_node = comp_geo  # Return comp_geo as the "geometry node" for consistency
-
-    # Material variants list (mtl_variants + main textures at end)
-    mtl_folders = list(mtl_variants or [])
-    if folder_textures:
-        mtl_folders.append(folder_textures)
-
-    comp_material_last = None
-    for index, mtl_folder in enumerate(mtl_folders):
-        if progress and progress.is_cancelled():
-            raise KeyboardInterrupt("Cancelled by user")
-        mtl_folder_name = os.path.basename(mtl_folder)
-        if progress:
-            progress.log(f"Creating material variant {index+1}/{len(mtl_folders)} from folder: {mtl_folder_name}")
-        material_lib = stage_context.createNode("materiallibrary", _sanitize(f"{node_name}_mtl_{mtl_folder_name}"))
-        comp_material = build_component_material_custom(node_name=_sanitize(f"{node_name}_material_variant_{mtl_folder_name}"))
-        if mtl_vset_name:
-            comp_material.parm("variantset").set(mtl_vset_name)
-        material_lib.parm("matpathprefix").set(f"/ASSET/mtl/")
-        if index == 0:
-            comp_material.setInput(0, first_geo_node)  # Use first_geo_node instead of geometry_variants_node
-        else:
-            comp_material.setInput(0, comp_material_last)
-        comp_material.setInput(1, material_lib)
-        comp_material_last = comp_material
-        # Extract material names from ALL geometry variant assets (main + variants)
-        # Ensure asset paths are unique (order-preserving) to avoid repeated processing
-        all_asset_paths = []
-        for a in assets:
-            all_asset_paths.append(a)
-        material_names = _extract_material_names(all_asset_paths, lowercase=naming_config.lowercase)
-        readable_list = "\n".join(f"- {m}" for m in material_names)
-        progress.log(f"Found {len(material_names)} Materials across all geometry{'variants' if has_geo_variants else ''} (from {len(all_asset_paths)} unique asset{'s' if len(all_asset_paths) > 1 else ''}):\n{readable_list}")
-        # Create the materials using the text_to_mtlx script with targeted material creation
-        _create_materials(first_geo_node, mtl_folder, material_lib, material_names, progress=progress, naming_config=naming_config)  # Use first_geo_node
-        nodes_to_layout.append(material_lib)
-        nodes_to_layout.append(comp_material)
+                progress.log(f"Creating material variant {index+1}/{len(build_variants)} from folder: {mtl_folder_name}")
+            with plan.phase(f"material_variant:{mtl_folder_name}"):
+                material_lib = stage_context.createNode("materiallibrary", _sanitize(f"{node_name}_mtl_{mtl_folder_name}"))
+                comp_material = build_component_material_custom(parent_path=stage_context.path(),
+                                                                node_name=_sanitize(f"{node_name}_material_variant_{mtl_folder_name}"))
+                if mtl_vset_name:
+                    comp_material.parm("variantset").set(mtl_vset_name)
+                material_lib.parm("matpathprefix").set(f"/ASSET/mtl/")
+                if index == 0:
+                    comp_material.setInput(0, first_geo_node)  # Use first_geo_node instead of geometry_variants_node
+                else:
+                    comp_material.setInput(0, comp_material_last)
+                comp_material.setInput(1, material_lib)
+                comp_material_last = comp_material
+                # Create the materials using the text_to_mtlx script with targeted material creation
+                _create_materials(first_geo_node, mtl_variant.folder, material_lib, plan.material_names, progress=progress, naming_config=naming_config)  # Use first_geo_node
+            nodes_to_layout.append(material_lib)
+            if texture_only_variants:
+                with plan.phase("texture_variants"):
+                    texture_variants_node = _create_texture_variants_node(
+                        stage_context, node_name, material_lib, mtl_variant, texture_only_variants,
+                        texture_vset_name, naming_config, progress=progress)
+                    comp_material.setInput(1, texture_variants_node)
+                nodes_to_layout.append(texture_variants_node)
+            nodes_to_layout.append(comp_material)
+    plan.layout_report = layout_scheduler.report
+    if progress:
+        progress.log(layout_scheduler.report.summary())
 
     # Wire final material output to component output
     if comp_material_last is not None:
@@ -1009,6 +1080,7 @@ def _random_color():
     return (main_colour, secondary_colour)
 
 
+@profile_phase("sticky_notes")
 def create_organized_net_note(asset_name, nodes_to_layout, offset_vector=hou.Vector2(0, 0), create_network_boxes=True, category=None):
     '''
     Creates a network box and sticky note organized around selected nodes,
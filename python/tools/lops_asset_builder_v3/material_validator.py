@@ -3,14 +3,26 @@ Material Validator - Validate materials and warn about missing textures
 
 Checks if geometry files have material assignments that can't be satisfied
 by the available texture folders, and provides detailed warnings to users.
+
+validate_material_variants validates an asset against each of its material
+variant folders separately (one MaterialValidationResult per folder plus a
+material x variant coverage matrix); validate_kit does the same for a whole
+kit of assets as one job. Geometry is read once per file, and every texture
+folder of the kit is scanned concurrently while the geometry is being read.
 """
 
 import os
-from typing import List, Dict, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, List, Dict, Optional, Set, Tuple
 import hou
 from modules.misc_utils import slugify, MaterialNamingConfig
+from tools.lops_asset_builder_v3.build_estimator import MaterialIndex
 from tools.lops_asset_builder_v3.texture_variant_detector import TextureVariantDetector
 
+# Texture folder index shared by every validation (re-lists a folder only when its mtime changes)
+_material_index = MaterialIndex()
+
 
 class MaterialValidationResult:
     """Result of material validation."""
@@ -165,65 +177,241 @@ def extract_material_names_from_geometry(asset_paths: List[str], lowercase: bool
     return material_names
 
 
-def find_available_materials_in_textures(texture_folder: str, lowercase: bool = False) -> Set[str]:
+def find_available_materials_in_textures(texture_folder: str, lowercase: bool = False,
+                                        naming_config: MaterialNamingConfig = None,
+                                        material_index: MaterialIndex = None) -> Set[str]:
     """
     Scan texture folder to find available material sets.
 
-    A material set is identified by finding texture files with common prefixes.
+    Texture files are parsed with the same rules as the material builder
+    (tex_to_mtlx_config.parse_texture_file_name), through a MaterialIndex that
+    is memoized per directory mtime, so validation and building always agree.
 
     Args:
         texture_folder: Path to texture folder
-        lowercase: If True, convert material names to lowercase
+        lowercase: If True, convert material names to lowercase (ignored when naming_config is given)
+        naming_config: Material naming configuration of the build
+        material_index: Texture folder index to use (default: the shared validator index)
 
     Returns:
         Set of material names that can be created from textures
     """
     if not os.path.exists(texture_folder):
         return set()
+    if naming_config is None:
+        naming_config = MaterialNamingConfig.from_ui(lowercase=lowercase)
+    index = material_index if material_index is not None else _material_index
+    return {name for name in index.texture_types(texture_folder, naming_config) if name}
 
-    material_names = set()
 
-    # Texture suffixes that identify material maps
-    texture_suffixes = [
-        'basecolor', 'base_color', 'diffuse', 'albedo',
-        'normal', 'normal_gl', 'normal_dx',
-        'roughness', 'metallic', 'metalness',
-        'ao', 'ambient_occlusion', 'ambientocclusion',
-        'height', 'displacement', 'bump',
-        'opacity', 'alpha', 'transmission',
-        'emission', 'emissive'
-    ]
+def scan_texture_folders(folders: List[str], naming_config: MaterialNamingConfig = None,
+                         max_workers: Optional[int] = None,
+                         material_index: MaterialIndex = None) -> Dict[str, Set[str]]:
+    """
+    Find the available materials of several texture folders concurrently.
 
-    # Walk through all subdirectories
-    for root, dirs, files in os.walk(texture_folder):
-        texture_files = [f for f in files if f.lower().endswith(('.png', '.jpg', '.jpeg', '.tif', '.tiff', '.exr', '.tx'))]
+    Args:
+        folders: Texture folders (duplicates are scanned once)
+        naming_config: Material naming configuration of the build
+        max_workers: Scanner threads (default: ThreadPoolExecutor default)
+        material_index: Texture folder index to use (default: the shared validator index)
 
-        if not texture_files:
-            continue
+    Returns:
+        dict: Folder -> set of material names (every requested folder is a key)
+    """
+    return _submit_folder_scans(folders, naming_config, max_workers, material_index)()
 
-        # Extract material names by removing texture suffixes
-        for texture_file in texture_files:
-            if lowercase:
-                basename = os.path.splitext(texture_file)[0].lower()
-            else:
-                basename = os.path.splitext(texture_file)[0]
-
-            # Try to identify material name by removing known suffixes
-            material_name = None
-            for suffix in texture_suffixes:
-                if basename.lower().endswith(f"_{suffix}"):
-                    material_name = basename[:-len(suffix)-1]
-                    break
-                elif basename.lower().endswith(suffix):
-                    material_name = basename[:-len(suffix)]
-                    break
-
-            if material_name:
-                material_name = slugify(material_name, lowercase=lowercase).strip("_")
-                if material_name:
-                    material_names.add(material_name)
 
-    return material_names
+def _submit_folder_scans(folders, naming_config, max_workers, material_index):
+    """Start scanning folders in the background; returns a callable that waits for the results."""
+    if naming_config is None:
+        naming_config = MaterialNamingConfig.from_ui()
+    unique = list(dict.fromkeys(os.path.normpath(f) for f in folders if f))
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="material_validator")
+    futures = {folder: executor.submit(find_available_materials_in_textures, folder,
+                                       naming_config=naming_config, material_index=material_index)
+               for folder in unique}
+    executor.shutdown(wait=False)
+
+    def results() -> Dict[str, Set[str]]:
+        scanned = {}
+        for folder, future in futures.items():
+            try:
+                scanned[folder] = future.result()
+            except Exception as e:
+                print(f"Warning: Could not scan texture folder {folder}: {e}")
+                scanned[folder] = set()
+        return {f: scanned[os.path.normpath(f)] for f in folders if f}
+
+    return results
+
+
+@dataclass
+class VariantValidationReport:
+    """Validation of one asset against each of its material variant folders."""
+    asset_name: str
+    materials_expected: Set[str] = field(default_factory=set)
+    variants: Dict[str, MaterialValidationResult] = field(default_factory=dict)  # folder -> result
+
+    @staticmethod
+    def variant_name(folder: str) -> str:
+        return os.path.basename(os.path.normpath(folder))
+
+    @property
+    def has_warnings(self) -> bool:
+        return any(result.has_warnings for result in self.variants.values())
+
+    @property
+    def materials_missing(self) -> Set[str]:
+        """Materials missing from at least one variant folder."""
+        missing = set()
+        for result in self.variants.values():
+            missing.update(result.materials_missing)
+        return missing
+
+    def coverage_matrix(self) -> Dict[str, Dict[str, bool]]:
+        """
+        Material x variant coverage.
+
+        Returns:
+            dict: Expected material -> {variant folder: True if the folder has textures for it}
+        """
+        return {
+            material: {folder: material in result.materials_available for folder, result in self.variants.items()}
+            for material in sorted(self.materials_expected)
+        }
+
+    def to_dict(self) -> Dict:
+        return {
+            "asset": self.asset_name,
+            "materials_expected": sorted(self.materials_expected),
+            "variants": {
+                folder: {
+                    "materials_available": len(result.materials_available),
+                    "materials_missing": sorted(result.materials_missing),
+                    "warnings": list(result.warnings),
+                }
+                for folder, result in self.variants.items()
+            },
+            "coverage": self.coverage_matrix(),
+        }
+
+    def get_summary(self) -> str:
+        """Coverage matrix as text, one row per expected material and one column per variant."""
+        names = [self.variant_name(folder) for folder in self.variants]
+        width = max([len(m) for m in self.materials_expected] + [len("Material")])
+        lines = [f"Material coverage: {self.asset_name} "
+                 f"({len(self.materials_expected)} material(s), {len(self.variants)} variant(s))"]
+        columns = [max(len(n), 3) for n in names]
+        lines.append("  " + "Material".ljust(width) + "".join(f"  {n.center(c)}" for n, c in zip(names, columns)))
+        for material, row in self.coverage_matrix().items():
+            cells = "".join(f"  {('yes' if row[folder] else '--').center(c)}"
+                            for folder, c in zip(self.variants, columns))
+            lines.append("  " + material.ljust(width) + cells)
+        for folder, name in zip(self.variants, names):
+            result = self.variants[folder]
+            if result.materials_missing:
+                lines.append(f"  {name}: {len(result.materials_missing)} missing")
+        return "\n".join(lines)
+
+
+def _variant_result(materials_expected: Set[str], folder: str, available: Set[str]) -> MaterialValidationResult:
+    """Validation result of one texture folder against the expected materials."""
+    result = MaterialValidationResult()
+    result.materials_expected = set(materials_expected)
+    if not materials_expected:
+        result.add_warning("No material assignments found in geometry files")
+        return result
+    if not os.path.isdir(folder):
+        result.add_warning(f"Texture folder does not exist: {folder}")
+        result.materials_missing = set(materials_expected)
+        return result
+    result.materials_available = set(available)
+    result.materials_missing = result.materials_expected - result.materials_available
+    if result.materials_missing:
+        result.add_warning(f"{len(result.materials_missing)} material(s) referenced in geometry have no matching textures")
+    result.add_info(f"Found {len(result.materials_available)} material set(s) in {folder}")
+    return result
+
+
+def validate_kit(
+    assets: Dict[str, Tuple[List[str], List[str]]],
+    naming_config: MaterialNamingConfig = None,
+    lowercase: bool = False,
+    max_workers: Optional[int] = None,
+    extractor: Callable[..., Set[str]] = extract_material_names_from_geometry,
+    material_index: MaterialIndex = None
+) -> Dict[str, VariantValidationReport]:
+    """
+    Validate a kit of assets against all their material variant folders as one job.
+
+    Every texture folder of the kit is scanned concurrently while the geometry
+    is read on the calling thread (hou is not thread-safe). Each geometry file
+    is read once, even when several assets share it.
+
+    Args:
+        assets: Asset name -> (geometry file paths, material variant folders)
+        naming_config: Material naming configuration (preferred over lowercase param)
+        lowercase: If True, convert material names to lowercase (deprecated, use naming_config)
+        max_workers: Folder scanner threads (default: ThreadPoolExecutor default)
+        extractor: Callable(asset_paths, lowercase=...) returning material names of geometry files
+        material_index: Texture folder index to use (default: the shared validator index)
+
+    Returns:
+        dict: Asset name -> VariantValidationReport
+    """
+    if naming_config is None:
+        naming_config = MaterialNamingConfig.from_ui(lowercase=lowercase)
+
+    folders = [folder for _paths, variant_folders in assets.values() for folder in variant_folders]
+    scan_results = _submit_folder_scans(folders, naming_config, max_workers, material_index)
+
+    geometry_cache: Dict[str, Set[str]] = {}
+    expected: Dict[str, Set[str]] = {}
+    for asset_name, (asset_paths, _folders) in assets.items():
+        names = set()
+        for path in asset_paths:
+            path = path.strip()
+            if path not in geometry_cache:
+                geometry_cache[path] = set(extractor([path], lowercase=naming_config.lowercase))
+            names.update(geometry_cache[path])
+        expected[asset_name] = names
+
+    available = scan_results()
+    reports = {}
+    for asset_name, (_paths, variant_folders) in assets.items():
+        report = VariantValidationReport(asset_name, expected[asset_name])
+        for folder in variant_folders:
+            if folder:
+                report.variants[folder] = _variant_result(expected[asset_name], folder, available[folder])
+        reports[asset_name] = report
+    return reports
+
+
+def validate_material_variants(
+    asset_paths: List[str],
+    variant_folders: List[str],
+    naming_config: MaterialNamingConfig = None,
+    lowercase: bool = False,
+    max_workers: Optional[int] = None,
+    asset_name: str = ""
+) -> VariantValidationReport:
+    """
+    Validate one asset against each of its material variant folders.
+
+    Args:
+        asset_paths: List of geometry file paths
+        variant_folders: Texture folders, one per material variant
+        naming_config: Material naming configuration (preferred over lowercase param)
+        lowercase: If True, convert material names to lowercase (deprecated, use naming_config)
+        max_workers: Folder scanner threads (default: ThreadPoolExecutor default)
+        asset_name: Name shown in the report
+
+    Returns:
+        VariantValidationReport with one MaterialValidationResult per folder
+    """
+    return validate_kit({asset_name: (asset_paths, variant_folders)}, naming_config=naming_config,
+                        lowercase=lowercase, max_workers=max_workers)[asset_name]
 
 
 def validate_materials(
@@ -268,10 +456,6 @@ def validate_materials(
         result.materials_missing = result.materials_expected.copy()
         return result
 
-    # Scan main texture folder
-    result.add_info(f"Scanning texture folder: {texture_folder}")
-    result.materials_available = find_available_materials_in_textures(texture_folder, lowercase=naming_config.lowercase)
-
     # Intelligently detect variant folders if not provided
     if not texture_variants:
         detector = TextureVariantDetector()
@@ -282,19 +466,23 @@ def validate_materials(
                 result.add_info(f"  Found variant: {variant.folder_name} ({variant.variant_key})")
             texture_variants = [v.folder_name for v in detected_variants]
 
-    # Scan variant folders
-    if texture_variants:
-        for variant in texture_variants:
-            # Handle both folder names and full paths
-            if os.path.isabs(variant):
-                variant_path = variant
-            else:
-                variant_path = os.path.join(texture_folder, variant)
-
-            if os.path.exists(variant_path) and os.path.isdir(variant_path):
-                result.add_info(f"Scanning variant folder: {os.path.basename(variant_path)}")
-                variant_materials = find_available_materials_in_textures(variant_path, lowercase=naming_config.lowercase)
-                result.materials_available.update(variant_materials)
+    # Scan the main texture folder and the variant folders concurrently
+    result.add_info(f"Scanning texture folder: {texture_folder}")
+    variant_paths = []
+    for variant in texture_variants or []:
+        # Handle both folder names and full paths
+        if os.path.isabs(variant):
+            variant_path = variant
+        else:
+            variant_path = os.path.join(texture_folder, variant)
+
+        if os.path.exists(variant_path) and os.path.isdir(variant_path):
+            result.add_info(f"Scanning variant folder: {os.path.basename(variant_path)}")
+            variant_paths.append(variant_path)
+
+    scanned = scan_texture_folders([texture_folder] + variant_paths, naming_config=naming_config)
+    for materials in scanned.values():
+        result.materials_available.update(materials)
 
     # Identify missing materials
     result.materials_missing = result.materials_expected - result.materials_available
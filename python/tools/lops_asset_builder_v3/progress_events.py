@@ -0,0 +1,142 @@
+"""
+Typed progress events for LOPS Asset Builder v3.
+
+The builders used to report progress as strings through progress.step(): up
+to ~800 silent steps per asset just to move the bar, and reporters parsing
+"Created material n/X" back out of the messages with regexes. Builders now
+publish ProgressEvent objects on the reporter's ProgressBus, and every
+reporter (Qt dialog, batch UI, console) subscribes to the bus and turns the
+events into bar values and log lines itself.
+
+Reporters without a bus keep working: publish() falls back to
+progress.step(message).
+
+Usage:
+    publish(progress, ProgressEvent(PHASE_START, "Creating materials", phase="materials",
+                                    total=12, span=800))
+    publish(progress, ProgressEvent(MATERIAL_CREATED, name="Metal", current=1, total=12))
+    publish(progress, ProgressEvent(PHASE_END, phase="materials"))
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Callable, List
+
+# Event kinds
+PHASE_START = "phase_start"
+PHASE_END = "phase_end"
+MATERIAL_CREATED = "material_created"
+COUNTER = "counter"
+LOG = "log"
+
+# UI refresh rate for repaint / processEvents coalescing
+UI_REFRESH_HZ = 20.0
+
+
+@dataclass(frozen=True)
+class ProgressEvent:
+    """A progress event published by the builders"""
+    kind: str
+    message: str = ""
+    phase: str = ""
+    name: str = ""  # Material or item name (MATERIAL_CREATED, COUNTER)
+    current: int = 0
+    total: int = 0
+    span: int = 0  # PHASE_START: progress units the phase may advance the bar by
+
+
+class ProgressBus:
+    """Dispatches ProgressEvents to subscribed callbacks"""
+
+    def __init__(self):
+        self._subscribers: List[Callable[[ProgressEvent], None]] = []
+
+    def subscribe(self, callback: Callable[[ProgressEvent], None]):
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[ProgressEvent], None]):
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def emit(self, event: ProgressEvent):
+        for callback in list(self._subscribers):
+            try:
+                callback(event)
+            except KeyboardInterrupt:
+                raise
+            except Exception as e:
+                print(f"Warning: Progress subscriber failed on {event.kind}: {e}")
+
+
+class RateLimiter:
+    """Lets an action through at most `hz` times per second"""
+
+    def __init__(self, hz: float = UI_REFRESH_HZ):
+        self.interval = 1.0 / hz if hz > 0 else 0.0
+        self._last = 0.0
+
+    def ready(self) -> bool:
+        now = time.monotonic()
+        if now - self._last >= self.interval:
+            self._last = now
+            return True
+        return False
+
+    def reset(self):
+        self._last = 0.0
+
+
+class PhaseProgress:
+    """
+    Maps phase-relative counters to absolute bar values.
+
+    A PHASE_START with a span reserves that many progress units starting at the
+    reporter's current value (clamped to the reporter's total); MATERIAL_CREATED
+    / COUNTER events then place the bar at base + span * current / total.
+    """
+
+    def __init__(self):
+        self.base = 0
+        self.span = 0
+
+    def start(self, value: int, event: ProgressEvent, limit: int = 0):
+        self.base = int(value)
+        self.span = max(0, int(event.span))
+        if limit:
+            self.span = min(self.span, max(0, int(limit) - self.base))
+
+    def value(self, event: ProgressEvent) -> int:
+        if not self.span or event.total <= 0:
+            return self.base
+        return self.base + int(self.span * min(event.current, event.total) / event.total)
+
+    def end(self) -> int:
+        value = self.base + self.span
+        self.span = 0
+        self.base = value
+        return value
+
+
+def describe(event: ProgressEvent) -> str:
+    """Log/status line for an event ("" when there is nothing to show)."""
+    if event.kind == MATERIAL_CREATED:
+        return f"Created material {event.current}/{event.total}: {event.name}"
+    return event.message
+
+
+def publish(progress, event: ProgressEvent):
+    """
+    Publish an event on a reporter's bus, or fall back to progress.step().
+
+    Args:
+        progress: Progress reporter (may be None)
+        event: Event to publish
+    """
+    if progress is None:
+        return
+    bus = getattr(progress, "events", None)
+    if bus is not None:
+        bus.emit(event)
+    elif event.message:
+        progress.step(event.message)
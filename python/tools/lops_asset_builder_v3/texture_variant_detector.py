@@ -7,13 +7,28 @@ Handles various naming conventions:
 - Suffixed: 4k_png/, 2k_jpg/
 - Complex: Cyberpunk_Trimsheets_4K_JPG_Textures/
 - Mixed: 4K_JPG/, 2k_png/, 8K_EXR/
+
+Folder-name analysis runs on precompiled patterns and is cached per folder
+name, and the priority config is loaded once per process (reloaded when the
+env vars or the JSON file change), so batch scans over thousands of asset
+folders stay cheap. See benchmark_texture_variant_detector.py.
 """
 
 import os
 import re
+import json
+from functools import lru_cache
 from typing import List, Dict, Set, Tuple, Optional
 from dataclasses import dataclass
 
+CONFIG_FILE = os.path.join(os.path.dirname(__file__), "texture_variant_config.json")
+
+DEFAULT_RESOLUTION_PRIORITY = ("4k", "2k", "1k")
+DEFAULT_FORMAT_PRIORITY = ("jpg", "png", "exr", "tif", "tx", "hdr", "unknown")
+
+# (env values, config mtime) -> (resolution_priority, format_priority)
+_priority_cache: Dict[str, object] = {"key": None, "value": None}
+
 
 @dataclass
 class TextureVariant:
@@ -70,50 +85,15 @@ class TextureVariantDetector:
             '1k': 1024, '2k': 2048, '4k': 4096, '8k': 8192, '16k': 16384
         }
         # Priority config (defaults preserve previous behavior: 4k > 2k > 1k)
-        self.resolution_priority: List[str] = ["4k", "2k", "1k"]
-        self.format_priority: List[str] = ["jpg", "png", "exr", "tif", "tx", "hdr", "unknown"]
+        self.resolution_priority: List[str] = list(DEFAULT_RESOLUTION_PRIORITY)
+        self.format_priority: List[str] = list(DEFAULT_FORMAT_PRIORITY)
         self._load_priority_config()
 
     def _load_priority_config(self):
-        """Load resolution/format priority from env or local JSON config.
-
-        Precedence:
-        1) Environment variables: LOPS_TEX_RES_PRIORITY, LOPS_TEX_FORMAT_PRIORITY
-           - Comma/semicolon separated list, e.g. "8k,4k,2k,1k".
-        2) JSON file next to this module: texture_variant_config.json
-           {
-             "resolution_priority": ["8k", "4k", "2k", "1k"],
-             "format_priority": ["jpg", "png", "exr", "tif", "tx", "hdr", "unknown"]
-           }
-        Defaults are kept if nothing provided.
-        """
-        try:
-            # Env vars
-            res_env = os.environ.get("LOPS_TEX_RES_PRIORITY")
-            fmt_env = os.environ.get("LOPS_TEX_FORMAT_PRIORITY")
-            if res_env:
-                parts = [p.strip().lower() for p in re.split(r"[;,]", res_env) if p.strip()]
-                if parts:
-                    self.resolution_priority = parts
-            if fmt_env:
-                parts = [p.strip().lower() for p in re.split(r"[;,]", fmt_env) if p.strip()]
-                if parts:
-                    self.format_priority = parts
-            # JSON file
-            cfg_path = os.path.join(os.path.dirname(__file__), "texture_variant_config.json")
-            if os.path.exists(cfg_path):
-                import json
-                with open(cfg_path, "r") as f:
-                    data = json.load(f) or {}
-                res = data.get("resolution_priority")
-                fmt = data.get("format_priority")
-                if isinstance(res, list) and res:
-                    self.resolution_priority = [str(x).lower() for x in res]
-                if isinstance(fmt, list) and fmt:
-                    self.format_priority = [str(x).lower() for x in fmt]
-        except Exception:
-            # Silently ignore config errors, keep defaults
-            pass
+        """Apply the process-wide priority config (see load_priority_config)."""
+        res, fmt = load_priority_config()
+        self.resolution_priority = list(res)
+        self.format_priority = list(fmt)
 
     def _parse_resolution_numeric(self, res: Optional[str]) -> int:
         """Convert a resolution label like '4k' or '4096' into a comparable integer.
@@ -124,7 +104,7 @@ class TextureVariantDetector:
                 return 0
             r = str(res).lower()
             # Match like '4k', '8k'
-            m = re.match(r"^(\d+)[k]$", r)
+            m = _K_RESOLUTION_RE.match(r)
             if m:
                 return int(m.group(1)) * 1024
             # Match pure number like 4096
@@ -221,80 +201,11 @@ class TextureVariantDetector:
         Returns:
             TextureVariant if detected, None otherwise
         """
-        resolution = None
-        format_type = None
-        confidence = 0.0
-
-        folder_lower = folder_name.lower()
-
-        # Extract resolution
-        for pattern in self.RESOLUTION_PATTERNS:
-            match = re.search(pattern, folder_lower, re.IGNORECASE)
-            if match:
-                res_value = match.group(1)
-                # Normalize to format like "4k"
-                if len(res_value) > 2:  # Like 4096
-                    resolution = self._numeric_to_resolution(int(res_value))
-                else:  # Like 4 (from "4k")
-                    resolution = f"{res_value}k"
-                confidence += 0.5
-                break
-
-        # Extract format
-        for pattern in self.FORMAT_PATTERNS:
-            match = re.search(pattern, folder_lower, re.IGNORECASE)
-            if match:
-                format_type = match.group(1).lower()
-                # Normalize jpeg to jpg
-                if format_type == 'jpeg':
-                    format_type = 'jpg'
-                elif format_type == 'tiff':
-                    format_type = 'tif'
-                confidence += 0.3
-                break
-
-        # Fallback: handle concatenated format+resolution like 'png4k' or 'jpg2k'
-        if not resolution:
-            m = re.search(r'(png|jpg|jpeg|exr|tif|tiff)(\d+)[kK]', folder_lower, re.IGNORECASE)
-            if m:
-                fmt = m.group(1).lower()
-                if fmt == 'jpeg':
-                    fmt = 'jpg'
-                if fmt == 'tiff':
-                    fmt = 'tif'
-                format_type = format_type or fmt
-                res_value = m.group(2)
-                resolution = f"{res_value}k"
-                confidence += 0.7  # fairly confident match
-        # Also handle '4kpng' (less common)
-        if not resolution:
-            m = re.search(r'(\d+)[kK](png|jpg|jpeg|exr|tif|tiff)', folder_lower, re.IGNORECASE)
-            if m:
-                res_value = m.group(1)
-                resolution = f"{res_value}k"
-                fmt = m.group(2).lower()
-                if fmt == 'jpeg':
-                    fmt = 'jpg'
-                if fmt == 'tiff':
-                    fmt = 'tif'
-                format_type = format_type or fmt
-                confidence += 0.6
-
-        # Must have at least resolution to be considered a variant
-        if not resolution:
+        analysis = _analyze_folder_name_cached(folder_name)
+        if analysis is None:
             return None
 
-        # Create variant key
-        if format_type:
-            variant_key = f"{resolution}_{format_type}"
-        else:
-            variant_key = resolution
-            format_type = "unknown"
-
-        # Adjust confidence based on pattern clarity
-        if self._is_simple_pattern(folder_name):
-            confidence = min(1.0, confidence + 0.2)
-
+        resolution, format_type, variant_key, confidence = analysis
         return TextureVariant(
             folder_name=folder_name,
             folder_path=folder_path,
@@ -306,31 +217,11 @@ class TextureVariantDetector:
 
     def _numeric_to_resolution(self, numeric_res: int) -> str:
         """Convert numeric resolution to k notation."""
-        if numeric_res >= 16384:
-            return "16k"
-        elif numeric_res >= 8192:
-            return "8k"
-        elif numeric_res >= 4096:
-            return "4k"
-        elif numeric_res >= 2048:
-            return "2k"
-        elif numeric_res >= 1024:
-            return "1k"
-        else:
-            return f"{numeric_res}px"
+        return _numeric_to_resolution(numeric_res)
 
     def _is_simple_pattern(self, folder_name: str) -> bool:
         """Check if folder name follows simple pattern (4k, png2k, etc.)."""
-        simple_patterns = [
-            r'^\d+[kK]$',                           # 4k
-            r'^(png|jpg|jpeg|exr|tif)\d+[kK]$',    # png4k
-            r'^\d+[kK]_(png|jpg|jpeg|exr|tif)$',   # 4k_png
-        ]
-
-        for pattern in simple_patterns:
-            if re.match(pattern, folder_name, re.IGNORECASE):
-                return True
-        return False
+        return _is_simple_pattern(folder_name)
 
     def _learn_pattern(self, variants: List[TextureVariant]):
         """Learn common pattern from detected variants."""
@@ -395,6 +286,184 @@ class TextureVariantDetector:
         return None
 
 
+# Precompiled pattern tables
+_RESOLUTION_RES = tuple(re.compile(p, re.IGNORECASE) for p in TextureVariantDetector.RESOLUTION_PATTERNS)
+_FORMAT_RES = tuple(re.compile(p, re.IGNORECASE) for p in TextureVariantDetector.FORMAT_PATTERNS)
+_FORMAT_RESOLUTION_RE = re.compile(r'(png|jpg|jpeg|exr|tif|tiff)(\d+)[kK]', re.IGNORECASE)
+_RESOLUTION_FORMAT_RE = re.compile(r'(\d+)[kK](png|jpg|jpeg|exr|tif|tiff)', re.IGNORECASE)
+_SIMPLE_PATTERN_RES = (
+    re.compile(r'^\d+[kK]$', re.IGNORECASE),                           # 4k
+    re.compile(r'^(png|jpg|jpeg|exr|tif)\d+[kK]$', re.IGNORECASE),    # png4k
+    re.compile(r'^\d+[kK]_(png|jpg|jpeg|exr|tif)$', re.IGNORECASE),   # 4k_png
+)
+_K_RESOLUTION_RE = re.compile(r"^(\d+)[k]$")
+_PRIORITY_SPLIT_RE = re.compile(r"[;,]")
+
+_FORMAT_ALIASES = {'jpeg': 'jpg', 'tiff': 'tif'}
+
+
+def _numeric_to_resolution(numeric_res: int) -> str:
+    """Convert numeric resolution to k notation."""
+    if numeric_res >= 16384:
+        return "16k"
+    elif numeric_res >= 8192:
+        return "8k"
+    elif numeric_res >= 4096:
+        return "4k"
+    elif numeric_res >= 2048:
+        return "2k"
+    elif numeric_res >= 1024:
+        return "1k"
+    else:
+        return f"{numeric_res}px"
+
+
+def _is_simple_pattern(folder_name: str) -> bool:
+    return any(pattern.match(folder_name) for pattern in _SIMPLE_PATTERN_RES)
+
+
+@lru_cache(maxsize=8192)
+def _analyze_folder_name_cached(folder_name: str) -> Optional[Tuple[str, str, str, float]]:
+    """
+    Resolution/format analysis of a folder name (cached per name).
+
+    Returns:
+        (resolution, format, variant_key, confidence), or None if the name has no resolution
+    """
+    resolution = None
+    format_type = None
+    confidence = 0.0
+
+    folder_lower = folder_name.lower()
+
+    # Extract resolution
+    for pattern in _RESOLUTION_RES:
+        match = pattern.search(folder_lower)
+        if match:
+            res_value = match.group(1)
+            # Normalize to format like "4k"
+            if len(res_value) > 2:  # Like 4096
+                resolution = _numeric_to_resolution(int(res_value))
+            else:  # Like 4 (from "4k")
+                resolution = f"{res_value}k"
+            confidence += 0.5
+            break
+
+    # Extract format
+    for pattern in _FORMAT_RES:
+        match = pattern.search(folder_lower)
+        if match:
+            format_type = match.group(1).lower()
+            # Normalize jpeg to jpg, tiff to tif
+            format_type = _FORMAT_ALIASES.get(format_type, format_type)
+            confidence += 0.3
+            break
+
+    # Fallback: handle concatenated format+resolution like 'png4k' or 'jpg2k'
+    if not resolution:
+        m = _FORMAT_RESOLUTION_RE.search(folder_lower)
+        if m:
+            fmt = m.group(1).lower()
+            format_type = format_type or _FORMAT_ALIASES.get(fmt, fmt)
+            resolution = f"{m.group(2)}k"
+            confidence += 0.7  # fairly confident match
+    # Also handle '4kpng' (less common)
+    if not resolution:
+        m = _RESOLUTION_FORMAT_RE.search(folder_lower)
+        if m:
+            resolution = f"{m.group(1)}k"
+            fmt = m.group(2).lower()
+            format_type = format_type or _FORMAT_ALIASES.get(fmt, fmt)
+            confidence += 0.6
+
+    # Must have at least resolution to be considered a variant
+    if not resolution:
+        return None
+
+    # Create variant key
+    if format_type:
+        variant_key = f"{resolution}_{format_type}"
+    else:
+        variant_key = resolution
+        format_type = "unknown"
+
+    # Adjust confidence based on pattern clarity
+    if _is_simple_pattern(folder_name):
+        confidence = min(1.0, confidence + 0.2)
+
+    return resolution, format_type, variant_key, confidence
+
+
+def _parse_priority_env(value: Optional[str]) -> Optional[Tuple[str, ...]]:
+    if not value:
+        return None
+    parts = tuple(p.strip().lower() for p in _PRIORITY_SPLIT_RE.split(value) if p.strip())
+    return parts or None
+
+
+def load_priority_config() -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """Load resolution/format priority from env or local JSON config.
+
+    Precedence:
+    1) Environment variables: LOPS_TEX_RES_PRIORITY, LOPS_TEX_FORMAT_PRIORITY
+       - Comma/semicolon separated list, e.g. "8k,4k,2k,1k".
+    2) JSON file next to this module: texture_variant_config.json
+       {
+         "resolution_priority": ["8k", "4k", "2k", "1k"],
+         "format_priority": ["jpg", "png", "exr", "tif", "tx", "hdr", "unknown"]
+       }
+    Defaults are kept if nothing provided.
+
+    The result is cached for the process and reloaded only when the env vars
+    or the JSON file's mtime change.
+
+    Returns:
+        (resolution_priority, format_priority)
+    """
+    res_env = os.environ.get("LOPS_TEX_RES_PRIORITY")
+    fmt_env = os.environ.get("LOPS_TEX_FORMAT_PRIORITY")
+    try:
+        cfg_mtime = os.path.getmtime(CONFIG_FILE)
+    except OSError:
+        cfg_mtime = None
+
+    key = (res_env, fmt_env, cfg_mtime)
+    if _priority_cache["key"] == key:
+        return _priority_cache["value"]
+
+    resolution_priority = DEFAULT_RESOLUTION_PRIORITY
+    format_priority = DEFAULT_FORMAT_PRIORITY
+    try:
+        # Env vars
+        resolution_priority = _parse_priority_env(res_env) or resolution_priority
+        format_priority = _parse_priority_env(fmt_env) or format_priority
+        # JSON file
+        if cfg_mtime is not None:
+            with open(CONFIG_FILE, "r") as f:
+                data = json.load(f) or {}
+            res = data.get("resolution_priority")
+            fmt = data.get("format_priority")
+            if isinstance(res, list) and res:
+                resolution_priority = tuple(str(x).lower() for x in res)
+            if isinstance(fmt, list) and fmt:
+                format_priority = tuple(str(x).lower() for x in fmt)
+    except Exception:
+        # Silently ignore config errors, keep what was loaded so far
+        pass
+
+    value = (resolution_priority, format_priority)
+    _priority_cache["key"] = key
+    _priority_cache["value"] = value
+    return value
+
+
+def clear_detector_cache():
+    """Drop cached folder-name analyses and the cached priority config."""
+    _analyze_folder_name_cached.cache_clear()
+    _priority_cache["key"] = None
+    _priority_cache["value"] = None
+
+
 def example_usage():
     """Example usage with various folder structures."""
 
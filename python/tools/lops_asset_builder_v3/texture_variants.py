@@ -0,0 +1,144 @@
+"""
+Texture-path-only material variants for LOPS Asset Builder v3.
+
+Material-variant folders (jpg1k/jpg2k/png4k) hold the same texture sets at
+different resolutions and formats, so their shader networks are identical and
+only the image file paths differ. Instead of one materiallibrary with a full
+set of MaterialX subnets per folder, the materials are built once from the
+main texture folder and every material gets a variant set whose variants only
+override the `inputs:file` of its image shaders, the way
+modules.usd_material_variant_builder does for KB3D materials.
+
+The file inputs of the main folder are moved into its own variant as well:
+variant opinions are weaker than local ones, so leaving the base paths local
+would hide every other variant.
+
+Usage:
+    variant_map = build_texture_variant_map(base_list, {"jpg1k": jpg1k_list})
+    # Inside a Python LOP placed after the materiallibrary:
+    author_texture_variants(hou.pwd().editableLayer(), "/ASSET/mtl", variant_map,
+                            base_variant="png4k", variant_set="mtl_variant")
+"""
+
+import os
+import re
+from typing import Dict, List, Tuple
+
+FILE_INPUT = "inputs:file"
+_UDIM_RE = re.compile(r'\d{4}')
+
+# Texture list keys that are not texture types (see TxToMtlx.get_texture_details)
+_INFO_KEYS = ('UDIM', 'FOLDER_PATH', 'Size')
+
+
+def _texture_file_name(file_name: str, udim: bool) -> str:
+    """File name as MtlxMaterial writes it into the image node (UDIM tokenised)."""
+    return _UDIM_RE.sub('<UDIM>', file_name) if udim else file_name
+
+
+def build_texture_variant_map(base_texture_list: Dict[str, Dict],
+                              variant_texture_lists: Dict[str, Dict[str, Dict]]) -> Dict[str, Dict[str, str]]:
+    """
+    Map every base texture file name to its counterpart in each variant folder.
+
+    Textures are matched by (material, texture type), the same keys
+    TxToMtlx.get_texture_details produces for every folder.
+
+    Args:
+        base_texture_list: Texture list of the folder the materials are built from
+        variant_texture_lists: Variant name -> texture list of that variant folder
+
+    Returns:
+        dict: Variant name -> {base file name: variant file path}
+    """
+    variant_map: Dict[str, Dict[str, str]] = {}
+
+    for variant_name, texture_list in variant_texture_lists.items():
+        mapping = {}
+        for material, base_info in base_texture_list.items():
+            variant_info = texture_list.get(material)
+            if not variant_info:
+                continue
+            base_udim = base_info.get('UDIM', False)
+            variant_udim = variant_info.get('UDIM', False)
+            folder = variant_info.get('FOLDER_PATH', '').rstrip('/')
+            for texture_type, files in base_info.items():
+                if texture_type in _INFO_KEYS or not files:
+                    continue
+                variant_files = variant_info.get(texture_type)
+                if not variant_files:
+                    continue
+                base_name = _texture_file_name(files[0], base_udim)
+                mapping[base_name] = f"{folder}/{_texture_file_name(variant_files[0], variant_udim)}"
+        variant_map[variant_name] = mapping
+
+    return variant_map
+
+
+def _collect_file_inputs(prim_spec, relative_path, found: List[Tuple]):
+    """Collect (relative prim path, attribute spec) for every authored file input below prim_spec."""
+    attr = prim_spec.attributes.get(FILE_INPUT)
+    if attr is not None and attr.HasDefaultValue():
+        found.append((relative_path, attr))
+    for child in prim_spec.nameChildren:
+        _collect_file_inputs(child, relative_path.AppendChild(child.name), found)
+
+
+def author_texture_variants(layer, material_root: str, variant_map: Dict[str, Dict[str, str]],
+                            base_variant: str, variant_set: str) -> int:
+    """
+    Author a texture variant set on every material under material_root.
+
+    The base file inputs are moved from the material into the base variant, and
+    each other variant overrides them with its own texture paths. Textures that
+    have no counterpart in a variant keep their base path in that variant.
+
+    Args:
+        layer: Sdf.Layer holding the material specs (a Python LOP's editableLayer())
+        material_root: Prim path containing the materials (e.g. "/ASSET/mtl")
+        variant_map: Output of build_texture_variant_map
+        base_variant: Variant name of the folder the materials were built from
+        variant_set: Name of the variant set to author
+
+    Returns:
+        int: Number of materials that received the variant set
+    """
+    from pxr import Sdf
+
+    root_spec = layer.GetPrimAtPath(material_root)
+    if root_spec is None:
+        print(f"Warning: No materials found at {material_root} for texture variants")
+        return 0
+
+    variant_names = [base_variant] + [name for name in variant_map if name != base_variant]
+    authored = 0
+
+    with Sdf.ChangeBlock():
+        for material_spec in root_spec.nameChildren:
+            file_inputs: List[Tuple] = []
+            for child in material_spec.nameChildren:
+                _collect_file_inputs(child, Sdf.Path(child.name), file_inputs)
+            if not file_inputs:
+                continue
+
+            base_values = [(rel_path, attr.default) for rel_path, attr in file_inputs]
+            for _, attr in file_inputs:
+                attr.ClearDefaultValue()
+
+            for variant_name in variant_names:
+                mapping = variant_map.get(variant_name, {})
+                variant_path = material_spec.path.AppendVariantSelection(variant_set, variant_name)
+                for rel_path, base_value in base_values:
+                    base_path = base_value.path if isinstance(base_value, Sdf.AssetPath) else str(base_value)
+                    value = mapping.get(os.path.basename(base_path), base_path)
+                    prim_spec = Sdf.CreatePrimInLayer(layer, variant_path.AppendPath(rel_path))
+                    attr_spec = prim_spec.attributes.get(FILE_INPUT) or \
+                        Sdf.AttributeSpec(prim_spec, FILE_INPUT, Sdf.ValueTypeNames.Asset)
+                    attr_spec.default = Sdf.AssetPath(value)
+
+            if variant_set not in material_spec.variantSetNameList.prependedItems:
+                material_spec.variantSetNameList.prependedItems.append(variant_set)
+            material_spec.variantSelections[variant_set] = base_variant
+            authored += 1
+
+    return authored
@@ -12,6 +12,10 @@ from PySide6 import QtWidgets, QtGui, QtCore
 from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from modules.misc_utils import slugify, _sanitize, MaterialNamingConfig
+from modules.mtlx_material_template import MtlxMaterialTemplate, build_mtlx_builder_parm_template_group
+from modules.layout_scheduler import deferred_layout, request_layout
+from tools.tex_to_mtlx_config import TEXTURE_EXT, TEXTURE_TYPE, parse_texture_file_name
+
 
 class TxToMtlx(QtWidgets.QMainWindow):
 
@@ -52,22 +56,8 @@ class TxToMtlx(QtWidgets.QMainWindow):
         self.folders_path = []
 
         # Texture related constans
-        self.TEXTURE_EXT = ['.jpeg', '.png', '.jpg', '.jpeg', '.bmp', '.tif', '.tiff', '.exr', '.targa']
-        self.TEXTURE_TYPE = [
-            "diffuse", "diff", "albedo", "alb", "base", "col", "color", "basecolor",
-            "metalness", "metal", "mlt", "met","metallic",
-            "specular", "specularity", "spec", "spc",
-            "roughness", "rough", "rgh",
-            "transmission", "transparency", "trans",
-            "translucency", "sss",
-            "emission", "emissive", "emit", "emm",
-            "opacity", "opac", "alpha",
-            "ambient_occlusion", "ao", "occlusion", "cavity",
-            "bump", "bmp",
-            "displacement", "height", "displace", "disp", "dsp", "heightmap",
-            "user", "mask",
-            "normal", "nor", "nrm", "nrml", "norm"
-        ]
+        self.TEXTURE_EXT = list(TEXTURE_EXT)
+        self.TEXTURE_TYPE = list(TEXTURE_TYPE)
         self.UDIM_PATTERN = re.compile(r'(?:_)?(\d{4}())')
         self.SIZE_PATTERN = re.compile(r'(?:_)?(\d+[Kk])')
         self.texture_list = {}
@@ -250,25 +240,11 @@ class TxToMtlx(QtWidgets.QMainWindow):
                     valid_files.append(file)
             # Process files - textures
             for file in valid_files:
-                split_text = os.path.splitext(file)[0]
-                split_text = split_text.split("_")
-                material_name = split_text[0]
-                # Find the texture type
-                texture_type = None
-                for tx_type in self.TEXTURE_TYPE:
-                    for tx in split_text[1:]:
-                        if tx.lower() == tx_type:
-                            texture_type = tx_type
-                            index = split_text.index(tx)
-                            material_name = '_'.join(split_text[:index])
-                            break
-                if not texture_type:
+                parsed = parse_texture_file_name(file, self.sanitize_options, self.TEXTURE_TYPE)
+                if not parsed:
                     continue
+                material_name, texture_type = parsed
                 # Get UDIM and Size
-                # Use sanitize options if enabled, otherwise keep original name
-                if self.sanitize_options['enabled']:
-                    lowercase = self.sanitize_options.get('lowercase', True)
-                    material_name = slugify(material_name, self.sanitize_options['drop_tokens'], lowercase=lowercase)
                 udim_match = self.UDIM_PATTERN.search(file)
                 size_match = self.SIZE_PATTERN.search(file)
                 # Update texture list
@@ -365,14 +341,22 @@ class TxToMtlx(QtWidgets.QMainWindow):
             'sanitize_options': sanitize_options,
         }
 
-        for index in selected_rows:
-            row = index.row()
-            key = list(self.texture_list.keys())[row]
-            create_material = MtlxMaterial(key, **common_data,folder_path=self.texture_list[key]["FOLDER_PATH"], texture_list=self.texture_list)
-            create_material.create_materialx()
-
-            self.progress_bar.setValue(progress_bar_default + 1)
-            progress_bar_default += 1
+        # Material subnets and the library are laid out once, after all materials
+        with deferred_layout():
+            # One pre-configured builder subnet, copied for every material
+            template = MtlxMaterialTemplate(self.node_lib)
+            try:
+                for index in selected_rows:
+                    row = index.row()
+                    key = list(self.texture_list.keys())[row]
+                    create_material = MtlxMaterial(key, **common_data,folder_path=self.texture_list[key]["FOLDER_PATH"],
+                                                   texture_list=self.texture_list, template=template)
+                    create_material.create_materialx()
+
+                    self.progress_bar.setValue(progress_bar_default + 1)
+                    progress_bar_default += 1
+            finally:
+                template.release()
 
         hou.ui.displayMessage(f"Material creation completed!!", severity=hou.severityType.Message)
 
@@ -463,7 +447,8 @@ class TxToMtlx(QtWidgets.QMainWindow):
 
 class MtlxMaterial:
 
-    def __init__(self, mat, mtlTX, path, node, folder_path, texture_list, sanitize_options=None, naming_config: MaterialNamingConfig = None):
+    def __init__(self, mat, mtlTX, path, node, folder_path, texture_list, sanitize_options=None, naming_config: MaterialNamingConfig = None,
+                 template: MtlxMaterialTemplate = None):
         self.material_to_create = mat
         self.mtlTX = mtlTX
         self.node_path = path
@@ -471,6 +456,8 @@ class MtlxMaterial:
         self.texture_list = texture_list
         self.imaketx_path = None
         self.folder_path = folder_path
+        # Optional pre-configured subnet to copy instead of building one from scratch
+        self.template = template
         # Support both legacy sanitize_options and new naming_config
         if naming_config is not None:
             self.naming_config = naming_config
@@ -646,6 +633,10 @@ class MtlxMaterial:
         material_name = f"{canonical}_{material_lib_info['Size']}" \
                         if 'Size' in material_lib_info else canonical
 
+        if self.template is not None:
+            # Copy of the blank builder: parameters, material flag and main nodes already set
+            return self.template.instantiate(material_name)
+
         # Remove existing material if it exists
         existing_material = self.node_lib.node(material_name)
         if existing_material:
@@ -668,86 +659,7 @@ class MtlxMaterial:
             mtlx_subnet - with the correct parameters
         '''
 
-        hou_parm_template_group = hou.ParmTemplateGroup()
-
-        # FOLDER MATERIALX
-        hou_parm_template = hou.FolderParmTemplate("folder1", "MaterialX Builder",
-                                                   folder_type=hou.folderType.Collapsible, default_value=0,
-                                                   ends_tab_group=False)
-        hou_parm_template.setTags({"group_type": "collapsible", "sidefx::shader_isparm": "0"})
-
-        # Inherent from the class
-        hou_parm_template2 = hou.IntParmTemplate("inherit_ctrl", "Inherit from Class", 1, default_value=([2]), min=0,
-                                                 max=10, min_is_strict=False, max_is_strict=False,
-                                                 look=hou.parmLook.Regular, naming_scheme=hou.parmNamingScheme.Base1,
-                                                 menu_items=(["0", "1", "2"]),
-                                                 menu_labels=(["Never", "Always", "Material Flag"]), icon_names=([]),
-                                                 item_generator_script="",
-                                                 item_generator_script_language=hou.scriptLanguage.Python,
-                                                 menu_type=hou.menuType.Normal, menu_use_token=False)
-        hou_parm_template.addParmTemplate(hou_parm_template2)
-
-        # Class Arc
-        hou_parm_template2 = hou.StringParmTemplate("shader_referencetype", "Class Arc", 1, default_value=([
-            "n = hou.pwd()\nn_hasFlag = n.isMaterialFlagSet()\ni = n.evalParm('inherit_ctrl')\nr = 'none'\nif i == 1 or (n_hasFlag and i == 2):\n    r = 'inherit'\nreturn r"]),
-                                                    default_expression=([
-                                                        "n = hou.pwd()\nn_hasFlag = n.isMaterialFlagSet()\ni = n.evalParm('inherit_ctrl')\nr = 'none'\nif i == 1 or (n_hasFlag and i == 2):\n    r = 'inherit'\nreturn r"]),
-                                                    default_expression_language=([hou.scriptLanguage.Python]),
-                                                    naming_scheme=hou.parmNamingScheme.Base1,
-                                                    string_type=hou.stringParmType.Regular, menu_items=(
-                ["none", "reference", "inherit", "specialize", "represent"]), menu_labels=(
-                ["None", "Reference", "Inherit", "Specialize", "Represent"]), icon_names=([]), item_generator_script="",
-                                                    item_generator_script_language=hou.scriptLanguage.Python,
-                                                    menu_type=hou.menuType.Normal)
-        hou_parm_template2.setTags({"sidefx::shader_isparm": "0", "spare_category": "Shader"})
-        hou_parm_template.addParmTemplate(hou_parm_template2)
-        #  Class Prim Path
-        hou_parm_template2 = hou.StringParmTemplate("shader_baseprimpath", "Class Prim Path", 1,
-                                                    default_value=(["/__class_mtl__/`$OS`"]),
-                                                    naming_scheme=hou.parmNamingScheme.Base1,
-                                                    string_type=hou.stringParmType.Regular, menu_items=([]),
-                                                    menu_labels=([]), icon_names=([]), item_generator_script="",
-                                                    item_generator_script_language=hou.scriptLanguage.Python,
-                                                    menu_type=hou.menuType.Normal)
-        hou_parm_template2.setTags(
-            {"script_action": "import lopshaderutils\nlopshaderutils.selectPrimFromInputOrFile(kwargs)",
-             "script_action_help": "Select a primitive in the Scene Viewer or Scene Graph Tree pane.\nCtrl-click to select using the primitive picker dialog.",
-             "script_action_icon": "BUTTONS_reselect", "sidefx::shader_isparm": "0", "sidefx::usdpathtype": "prim",
-             "spare_category": "Shader"})
-        hou_parm_template.addParmTemplate(hou_parm_template2)
-
-        # Separator
-        hou_parm_template2 = hou.SeparatorParmTemplate("separator1")
-        hou_parm_template.addParmTemplate(hou_parm_template2)
-
-        # Tab Menu Mask
-        hou_parm_template2 = hou.StringParmTemplate("tabmenumask", "Tab Menu Mask", 1, default_value=(
-            ["MaterialX parameter constant collect null genericshader subnet subnetconnector suboutput subinput"]),
-                                                    naming_scheme=hou.parmNamingScheme.Base1,
-                                                    string_type=hou.stringParmType.Regular, menu_items=([]),
-                                                    menu_labels=([]), icon_names=([]), item_generator_script="",
-                                                    item_generator_script_language=hou.scriptLanguage.Python,
-                                                    menu_type=hou.menuType.Normal)
-        hou_parm_template2.setTags({"spare_category": "Tab Menu"})
-        hou_parm_template.addParmTemplate(hou_parm_template2)
-
-        # Render Context Name
-        hou_parm_template2 = hou.StringParmTemplate("shader_rendercontextname", "Render Context Name", 1,
-                                                    default_value=(["mtlx"]), naming_scheme=hou.parmNamingScheme.Base1,
-                                                    string_type=hou.stringParmType.Regular, menu_items=([]),
-                                                    menu_labels=([]), icon_names=([]), item_generator_script="",
-                                                    item_generator_script_language=hou.scriptLanguage.Python,
-                                                    menu_type=hou.menuType.Normal)
-        hou_parm_template2.setTags({"sidefx::shader_isparm": "0", "spare_category": "Shader"})
-        hou_parm_template.addParmTemplate(hou_parm_template2)
-
-        # Force Translation of Children
-        hou_parm_template2 = hou.ToggleParmTemplate("shader_forcechildren", "Force Translation of Children",
-                                                    default_value=True)
-        hou_parm_template2.setTags({"sidefx::shader_isparm": "0", "spare_category": "Shader"})
-        hou_parm_template.addParmTemplate(hou_parm_template2)
-        hou_parm_template_group.append(hou_parm_template)
-
+        hou_parm_template_group = build_mtlx_builder_parm_template_group()
         mtlx_subnet.setParmTemplateGroup(hou_parm_template_group)
 
         return mtlx_subnet
@@ -760,6 +672,14 @@ class MtlxMaterial:
             tuple - node for standard surface and node for the displacement
         '''
 
+        if self.template is not None and self.template.with_main_nodes:
+            # Nodes come pre-wired from the template, only give them the material names
+            mtlx_standard_surf = self.template.surface_node(subnet_context)
+            mtlx_displacement = self.template.displacement_node(subnet_context)
+            mtlx_standard_surf.setName(slugify(self.material_to_create + "_mtlxSurface"))
+            mtlx_displacement.setName(slugify(self.material_to_create + "_mtlxDisplacement"))
+            return mtlx_standard_surf, mtlx_displacement
+
         # Create main nodes
 
         mtlx_standard_surf = subnet_context.createNode("mtlxstandard_surface", slugify(self.material_to_create + "_mtlxSurface"))
@@ -1125,5 +1045,6 @@ class MtlxMaterial:
 
     def _layout_nodes(self, subnet_context):
         ''' Layout nodes in the network'''
-        subnet_context.layoutChildren()
-        self.node_lib.layoutChildren()
+        # Deferred to one layout per network when inside a deferred_layout() block
+        request_layout(subnet_context)
+        request_layout(self.node_lib, grid=True)
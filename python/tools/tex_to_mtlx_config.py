@@ -0,0 +1,89 @@
+"""
+Texture naming configuration for tex_to_mtlx.
+
+Texture file extensions and texture type tokens, and the parser that splits a
+texture file name into its material name and texture type. Kept free of
+Houdini imports so the same rules are used by the material builder, the
+batch estimate and the Houdini-free build planner.
+"""
+
+import os
+import re
+from functools import lru_cache
+
+from modules.misc_utils import slugify
+
+# Texture related constants
+TEXTURE_EXT = ['.jpeg', '.png', '.jpg', '.jpeg', '.bmp', '.tif', '.tiff', '.exr', '.targa']
+TEXTURE_TYPE = [
+    "diffuse", "diff", "albedo", "alb", "base", "col", "color", "basecolor",
+    "metalness", "metal", "mlt", "met","metallic",
+    "specular", "specularity", "spec", "spc",
+    "roughness", "rough", "rgh",
+    "transmission", "transparency", "trans",
+    "translucency", "sss",
+    "emission", "emissive", "emit", "emm",
+    "opacity", "opac", "alpha",
+    "ambient_occlusion", "ao", "occlusion", "cavity",
+    "bump", "bmp",
+    "displacement", "height", "displace", "disp", "dsp", "heightmap",
+    "user", "mask",
+    "normal", "nor", "nrm", "nrml", "norm"
+]
+
+
+_TEXTURE_EXT_TUPLE = tuple(TEXTURE_EXT)
+
+
+@lru_cache(maxsize=8)
+def _texture_type_resolver(texture_types):
+    ''' Compile the texture type tokens into one pattern plus a token -> priority table
+    A type token is a whole "_"-separated token after the first one; types containing
+    "_" can never be a single token, so they are left out of the pattern.
+    '''
+    ranks = {tx_type: rank for rank, tx_type in enumerate(texture_types)}
+    tokens = sorted((t for t in ranks if "_" not in t), key=len, reverse=True)
+    pattern = re.compile(r"(?<=_)(?:%s)(?=_|$)" % "|".join(map(re.escape, tokens)), re.IGNORECASE)
+    return pattern, ranks
+
+
+TEXTURE_TYPE_PATTERN, TEXTURE_TYPE_RANK = _texture_type_resolver(tuple(TEXTURE_TYPE))
+
+
+def is_texture_file_name(file_name):
+    ''' True if the file name has a texture extension and a "_" (material_type naming)'''
+    return file_name.lower().endswith(_TEXTURE_EXT_TUPLE) and "_" in file_name
+
+
+def parse_texture_file_name(file_name, sanitize_options=None, texture_types=TEXTURE_TYPE):
+    ''' Split a texture file name into its material name and texture type
+    Args:
+        file_name: Texture file name (e.g. "Metal_Plate_basecolor.png")
+        sanitize_options: Legacy sanitize options dict (see MaterialNamingConfig.to_sanitize_options)
+        texture_types: Texture type tokens, later entries win when several match
+    Returns:
+        (material_name, texture_type) or None if no texture type token is found
+    '''
+    if texture_types is TEXTURE_TYPE:
+        pattern, ranks = TEXTURE_TYPE_PATTERN, TEXTURE_TYPE_RANK
+    else:
+        pattern, ranks = _texture_type_resolver(tuple(texture_types))
+    stem = os.path.splitext(file_name)[0]
+    # Single pass over the type tokens; the highest priority type wins, at its first position
+    best = None
+    best_rank = -1
+    for match in pattern.finditer(stem):
+        tx = match.group()
+        rank = ranks.get(tx.lower(), -1)
+        if rank > best_rank:
+            best, best_rank = tx, rank
+    if best is None:
+        return None
+    texture_type = texture_types[best_rank]
+    split_text = stem.split("_")
+    material_name = '_'.join(split_text[:split_text.index(best)])
+    # Use sanitize options if enabled, otherwise keep original name
+    if sanitize_options and sanitize_options['enabled']:
+        lowercase = sanitize_options.get('lowercase', True)
+        material_name = slugify(material_name, sanitize_options['drop_tokens'], lowercase=lowercase)
+    return material_name, texture_type